@@ -0,0 +1,211 @@
+import asyncio
+import logging
+from typing import Any, Optional, Union
+
+import cohere
+import httpx
+from meilisearch_python_sdk import AsyncClient as MeiliAsyncClient
+from meilisearch_python_sdk._http_requests import AsyncHttpRequests as MeiliAsyncHttpRequests
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+COHERE_BASE_URL = "https://api.cohere.com"
+
+
+def _pool_stats(client: Union[httpx.Client, httpx.AsyncClient]) -> dict[str, Any]:
+    """httpx(httpcore) connection pool 상태. 공개 API가 없어 transport 내부를 조회한다."""
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", []) or [])
+
+    idle = sum(1 for conn in connections if conn.is_idle())
+    return {
+        "connections": len(connections),
+        "active": len(connections) - idle,
+        "idle": idle,
+        "http2": sum(
+            1 for conn in connections if "HTTP/2" in repr(conn)
+        ),
+    }
+
+
+class ClientRegistry:
+    """
+    외부 의존성(OpenAI, Cohere, GitHub, Meilisearch, Redis) 클라이언트를 한 곳에서 생성/관리한다.
+
+    - 명시적인 connection pool 크기와 keep-alive, TLS 구간은 HTTP/2 사용
+    - 서버 시작 시(lifespan) 미리 연결을 맺어 배포 직후 첫 요청의 TLS handshake 비용 제거
+    - 서버 종료 시 모든 연결을 정리
+    """
+
+    def __init__(self):
+        self.limits = httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        http2 = settings.HTTP2_ENABLED
+
+        self.request_counts: dict[str, int] = {}
+
+        # OpenAI (ChatOpenAI, OpenAIEmbeddings). timeout은 SDK가 요청마다 지정
+        self.openai_async = httpx.AsyncClient(
+            limits=self.limits, http2=http2, event_hooks=self._hooks("openai", True)
+        )
+        self.openai_sync = httpx.Client(
+            limits=self.limits, http2=http2, event_hooks=self._hooks("openai_sync", False)
+        )
+
+        # Cohere SDK는 동기 클라이언트만 사용 (to_thread로 호출)
+        self.cohere = httpx.Client(
+            limits=self.limits,
+            http2=http2,
+            timeout=60.0,
+            event_hooks=self._hooks("cohere", False),
+        )
+
+        self.github = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {settings.GITHUB_TOKEN}",
+                "Content-Type": "application/json",
+                "Accept": "application/vnd.github.v3+json",
+            },
+            limits=self.limits,
+            http2=http2,
+            timeout=20.0,
+            event_hooks=self._hooks("github", True),
+        )
+
+        # Meilisearch SDK는 pool 설정 / 외부 httpx 클라이언트를 받는 공개 인자가 없으므로
+        # 직접 만든 클라이언트로 교체 (SDK 내부 구조에 의존하므로 requirements.in에서 버전 고정)
+        # (h2c는 httpx에서 지원하지 않아 https 주소일 때만 HTTP/2)
+        meili_http2 = http2 and settings.MEILI_HTTP_ADDR.startswith("https")
+        self.meili = MeiliAsyncClient(settings.MEILI_HTTP_ADDR, settings.MEILI_KEY, timeout=30)
+
+        # SDK가 생성한 기본 클라이언트는 연결을 맺기 전에 교체되며, 종료 시 함께 닫는다
+        self._meili_sdk_client = self.meili.http_client
+        self._check_meili_http_client(self._meili_sdk_client)
+
+        self.meili.http_client = httpx.AsyncClient(
+            base_url=settings.MEILI_HTTP_ADDR,
+            headers=self._meili_sdk_client.headers,
+            timeout=30,
+            limits=self.limits,
+            http2=meili_http2,
+            event_hooks=self._hooks("meili", True),
+        )
+        self.meili._http_requests = MeiliAsyncHttpRequests(
+            self.meili.http_client, json_handler=self.meili.json_handler
+        )
+        self._check_meili_http_client(self.meili.http_client)
+
+        self.redis = Redis.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+
+    def _check_meili_http_client(self, expected: httpx.AsyncClient) -> None:
+        """SDK가 실제로 expected 클라이언트로 요청하는지 확인 (SDK 업데이트로 내부 구조가 바뀌면 시작 시 실패)"""
+        http_requests = getattr(self.meili, "_http_requests", None)
+        if not (
+            isinstance(http_requests, MeiliAsyncHttpRequests)
+            and getattr(http_requests, "http_client", None) is expected
+        ):
+            raise RuntimeError(
+                "Meilisearch SDK 내부 구조가 예상과 다릅니다. "
+                "meilisearch-python-sdk 버전을 확인하세요 (ClientRegistry의 http client 교체 불가)."
+            )
+
+    def _hooks(self, name: str, is_async: bool) -> dict[str, list]:
+        self.request_counts[name] = 0
+
+        def count() -> None:
+            self.request_counts[name] += 1
+
+        if is_async:
+            async def on_request(request: httpx.Request) -> None:
+                count()
+        else:
+            def on_request(request: httpx.Request) -> None:
+                count()
+
+        return {"request": [on_request]}
+
+    def cohere_client(self) -> cohere.ClientV2:
+        return cohere.ClientV2(settings.COHERE_API_KEY, httpx_client=self.cohere)
+
+    async def warm_up(self) -> None:
+        """각 외부 의존성에 미리 연결을 맺어 둔다. (응답 내용/상태 코드는 무시)"""
+        connections = max(1, settings.HTTP_WARMUP_CONNECTIONS)
+        github_root = str(httpx.URL(settings.GITHUB_BASE_URL).copy_with(path="/rate_limit"))
+
+        async def touch(name: str, coro_factory) -> None:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(coro_factory() for _ in range(connections))),
+                    timeout=10.0,
+                )
+                logger.info(f"Warmed up '{name}' connections")
+            except Exception as e:
+                logger.warning(f"Failed to warm up '{name}': {e}")
+
+        await asyncio.gather(
+            touch("openai", lambda: self.openai_async.get(f"{OPENAI_BASE_URL}/models")),
+            touch(
+                "cohere",
+                lambda: asyncio.to_thread(self.cohere.get, f"{COHERE_BASE_URL}/v2/models"),
+            ),
+            # /rate_limit 조회는 GitHub rate limit에 포함되지 않음
+            touch("github", lambda: self.github.get(github_root)),
+            touch("meili", self.meili.health),
+            touch("redis", self.redis.ping),
+        )
+
+    async def aclose(self) -> None:
+        results = await asyncio.gather(
+            self.openai_async.aclose(),
+            self.github.aclose(),
+            self.meili.aclose(),
+            self._meili_sdk_client.aclose(),
+            self.redis.aclose(),
+            asyncio.to_thread(self.openai_sync.close),
+            asyncio.to_thread(self.cohere.close),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to close client: {result}")
+
+        logger.info("Closed all external clients")
+
+    def stats(self) -> dict[str, Any]:
+        http_clients: dict[str, Union[httpx.Client, httpx.AsyncClient]] = {
+            "openai": self.openai_async,
+            "openai_sync": self.openai_sync,
+            "cohere": self.cohere,
+            "github": self.github,
+            "meili": self.meili.http_client,
+        }
+
+        result: dict[str, Any] = {
+            name: {"requests": self.request_counts.get(name, 0), **_pool_stats(client)}
+            for name, client in http_clients.items()
+        }
+        result["max_connections_per_client"] = self.limits.max_connections
+
+        pool = self.redis.connection_pool
+        in_use: Optional[set] = getattr(pool, "_in_use_connections", None)
+        available: Optional[list] = getattr(pool, "_available_connections", None)
+        result["redis"] = {
+            "in_use": len(in_use) if in_use is not None else None,
+            "idle": len(available) if available is not None else None,
+            "max_connections": pool.max_connections,
+        }
+
+        return result
@@ -1,4 +1,5 @@
 from enum import StrEnum
+from typing import Literal
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -19,6 +20,38 @@ class MeiliEnvironment(StrEnum):
     production = "production"
 
 
+# 검색 엔진
+class VectorBackendType(StrEnum):
+    meilisearch = "meilisearch"
+    local_hybrid = "local_hybrid"
+
+
+# Rerank 백엔드
+class RerankBackendType(StrEnum):
+    cohere = "cohere"
+    local = "local"
+
+
+# router / rewrite / plan 실행 방식
+class QueryAnalysisMode(StrEnum):
+    sequential = "sequential"  # router -> rewrite -> plan (LLM 3회)
+    fused = "fused"  # analyze (LLM 1회)
+
+
+# 검색 결과 평가 방식
+class GradeStrategy(StrEnum):
+    llm = "llm"  # LLM이 context를 읽고 판단
+    score = "score"  # rerank 점수 분포로만 판단 (LLM 호출 없음)
+    hybrid = "hybrid"  # 점수가 애매한 경우에만 LLM 호출
+
+
+# LangGraph checkpoint 저장 시점 (Pregel durability)
+class CheckpointDurability(StrEnum):
+    sync = "sync"  # 매 step 저장이 끝난 뒤 다음 step 실행
+    async_ = "async"  # 다음 step과 병렬로 저장 (LangGraph 기본값)
+    exit = "exit"  # 턴 종료 / interrupt 시점에만 저장
+
+
 # env 파일명
 env_file = ".env"
 
@@ -35,6 +68,10 @@ class Settings(BaseSettings):
     MEILI_GITHUB_ISSUES_INDEX: str | None
     MEILI_GITHUB_PRS_INDEX: str | None
 
+    # 검색 엔진 (meilisearch: Meilisearch, local_hybrid: in-process FAISS + BM25)
+    VECTOR_BACKEND: VectorBackendType = VectorBackendType.meilisearch
+    LOCAL_INDEX_DIR: str = "./local_index"
+
     OPENAI_API_KEY: str
 
     REDIS_URL: str
@@ -46,6 +83,27 @@ class Settings(BaseSettings):
     COHERE_API_KEY: str
     RERANK_THRESHOLD: float
 
+    # grade 방식 (score / hybrid는 rerank 점수 사용)
+    GRADE_STRATEGY: GradeStrategy = GradeStrategy.llm
+    GRADE_SCORE_TOP_K: int = 3  # 상위 k개 평균 >= RERANK_THRESHOLD 이면 good
+    GRADE_SCORE_MAX_THRESHOLD: float = 0.8  # 최고 점수가 이 이상이면 good
+    GRADE_SCORE_BAD_THRESHOLD: float = 0.1  # hybrid: 최고 점수가 이 미만이면 LLM 없이 bad
+
+    # Rerank 백엔드 (cohere: Cohere API, local: CPU cross-encoder)
+    RERANK_BACKEND: RerankBackendType = RerankBackendType.cohere
+    LOCAL_RERANK_MODEL: str = "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1"
+    LOCAL_RERANK_BATCH_SIZE: int = 16
+    LOCAL_RERANK_MAX_TOKENS: int = 512
+    LOCAL_RERANK_RUNTIME: Literal["torch", "onnx"] = "torch"
+    LOCAL_RERANK_ONNX_FILE: str | None = None
+    LOCAL_RERANK_QUANTIZE: bool = False
+
+    # Rerank 점수 캐시
+    RERANK_CACHE_ENABLED: bool = True
+    RERANK_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    RERANK_CACHE_REDIS_ENABLED: bool = False
+    RERANK_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+
     # Performance variables
     COHERE_RERANK_TOP_N: int
     MEILISEARCH_SEMANTIC_RATIO: float
@@ -56,6 +114,111 @@ class Settings(BaseSettings):
     OPENAI_CHAT_MODEL: str
     FINAL_SOURCES_SANITY_THRESHOLD: float
 
+    # LLM context 토큰 예산
+    GENERATE_CONTEXT_TOKEN_BUDGET: int = 12000
+    GRADE_CONTEXT_TOKEN_BUDGET: int = 6000
+    CONTEXT_MIN_TAIL_TOKENS: int = 200
+
+    # PR diff hunk 단위 압축 (PR당 토큰 상한)
+    PR_DIFF_CONDENSE_ENABLED: bool = True
+    PR_DIFF_TOKEN_CAP: int = 3000
+
+    # 외부 HTTP 클라이언트 connection pool (lifespan에서 생성/warm-up/종료)
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 120.0
+    HTTP2_ENABLED: bool = True
+    HTTP_WARMUP_ENABLED: bool = True
+    HTTP_WARMUP_CONNECTIONS: int = 2
+    REDIS_MAX_CONNECTIONS: int = 50
+
+    # GitHub PR context cache (in-process LRU + Redis, ETag 재검증)
+    PR_CONTEXT_CACHE_ENABLED: bool = True
+    PR_CONTEXT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    PR_CONTEXT_CACHE_REDIS_ENABLED: bool = True
+    PR_CONTEXT_CACHE_FRESH_SECONDS: float = 60.0
+    PR_CONTEXT_CACHE_MAX_STALE_SECONDS: int = 24 * 60 * 60
+
+    # (Streaming) 답변 토큰 delta 묶음 기준 (글자 수 / 최대 지연)
+    STREAM_TOKEN_COALESCE_CHARS: int = 32
+    STREAM_TOKEN_COALESCE_INTERVAL_SECONDS: float = 0.05
+
+    # Embedding cache (in-process LRU + Redis)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    EMBEDDING_CACHE_REDIS_ENABLED: bool = True
+    EMBEDDING_CACHE_TTL_SECONDS: int = 7 * 24 * 60 * 60
+
+    # retrieve / search_related_jira 검색 요청 병합
+    # (두 노드가 같은 superstep에서 실행되는 fused 모드의 analyze 직후에만 적용)
+    RETRIEVAL_COORDINATOR_ENABLED: bool = True
+    RETRIEVAL_BATCH_MAX_WAIT_SECONDS: float = 1.5
+
+    # 질문 분석 그래프 구성 (get_compiled_graph에서 결정)
+    QUERY_ANALYSIS_MODE: QueryAnalysisMode = QueryAnalysisMode.sequential
+
+    # 로컬 intent router (confidence 미만이면 LLM router 사용)
+    INTENT_ROUTER_ENABLED: bool = True
+    INTENT_ROUTER_CONFIDENCE_THRESHOLD: float = 0.8
+    INTENT_ROUTER_SHADOW_SAMPLE_RATE: float = 0.05
+
+    # grade -> rewrite 재시도 시 이미 실행한 (query, index) 검색 / rerank / PR context 재사용
+    INCREMENTAL_RETRIEVAL_ENABLED: bool = True
+
+    # 인덱스별 통계(문서 수, rerank 생존/인용 비율) 기반 검색 예산 분배
+    RETRIEVAL_BUDGET_ALLOCATOR_ENABLED: bool = True
+    RETRIEVAL_BUDGET_REFRESH_SECONDS: float = 300.0
+    RETRIEVAL_BUDGET_PRIOR_STRENGTH: float = 20.0
+
+    # 2단계 검색: snippet만 검색해 rerank 후 살아남은 문서만 전체 조회
+    TWO_PHASE_RETRIEVAL_ENABLED: bool = False
+    RETRIEVAL_SNIPPET_CROP_LENGTH: int = 120  # 단어 수
+
+    # LangGraph checkpoint 경량화: 큰 검색 결과 문서는 content-addressed blob으로 분리 저장
+    CHECKPOINT_OFFLOAD_ENABLED: bool = True
+    CHECKPOINT_BLOB_MIN_BYTES: int = 2048
+    CHECKPOINT_BLOB_TTL_SECONDS: int = 3 * 24 * 60 * 60
+    CHECKPOINT_BLOB_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # checkpoint 전용 msgpack serializer (알려진 타입 태그 인코딩 + 일정 크기 이상 zstd 압축)
+    CHECKPOINT_COMPACT_SERDE_ENABLED: bool = True
+    CHECKPOINT_COMPRESS_MIN_BYTES: int = 4096
+    CHECKPOINT_ZSTD_LEVEL: int = 3
+    # 엔드포인트별 checkpoint 저장 시점. exit여도 interrupt(manage_pr_context) 시점에는 저장되므로 resume 가능
+    CHAT_CHECKPOINT_DURABILITY: CheckpointDurability = CheckpointDurability.exit
+    STREAM_CHECKPOINT_DURABILITY: CheckpointDurability = CheckpointDurability.exit
+    # checkpoint write-behind: 저장을 큐에 모아 비동기로 반영 (대체된 checkpoint는 최신 것만 저장)
+    CHECKPOINT_WRITE_BEHIND_ENABLED: bool = False
+    CHECKPOINT_WRITE_BEHIND_MAX_DELAY_SECONDS: float = 0.05
+    # 활성 세션의 최신 checkpoint in-process 캐시 (Redis 포인터 / write 개수로 버전 확인)
+    CHECKPOINT_HOT_CACHE_ENABLED: bool = True
+    CHECKPOINT_HOT_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    CHECKPOINT_HOT_CACHE_TTL_SECONDS: int = 10 * 60
+    # checkpoint 보존 정책: thread 키 TTL (0이면 만료 없음) + thread별 최신 N개만 남기는 백그라운드 compaction
+    CHECKPOINT_TTL_SECONDS: int = 3 * 24 * 60 * 60
+    CHECKPOINT_TTL_REFRESH_ON_READ: bool = False  # 조회 시 TTL 갱신 (hot cache hit은 갱신하지 않음)
+    CHECKPOINT_COMPACTION_ENABLED: bool = True
+    CHECKPOINT_KEEP_LAST: int = 5  # resume 대기 중인 interrupt checkpoint는 별도 보존
+    CHECKPOINT_COMPACTION_INTERVAL_SECONDS: float = 10 * 60
+
+    # 대화 요약 메모리: 요약되지 않은 대화가 토큰 예산을 넘으면 턴 종료 후 오래된 턴을 누적 요약에 합침
+    CONVERSATION_SUMMARY_ENABLED: bool = True
+    CONVERSATION_SUMMARY_TRIGGER_TOKENS: int = 1500
+    CONVERSATION_SUMMARY_KEEP_TURNS: int = 2  # 요약하지 않고 원문으로 유지할 최근 턴 수
+    CONVERSATION_SUMMARY_MAX_TOKENS: int = 500
+
+    # 원본 질문 추측 검색 (router/rewrite/plan과 병렬 실행)
+    SPECULATIVE_RETRIEVAL_ENABLED: bool = False
+    SPECULATIVE_REUSE_SIMILARITY: float = 0.9
+
+    # Semantic answer cache (opt-in)
+    ANSWER_CACHE_ENABLED: bool = False
+    ANSWER_CACHE_SIMILARITY_THRESHOLD: float = 0.95
+    ANSWER_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    ANSWER_CACHE_MAX_ENTRIES_PER_SCOPE: int = 200
+    ANSWER_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+    ANSWER_CACHE_REDIS_ENABLED: bool = True
+    ANSWER_CACHE_INDEX_VERSION_TTL_SECONDS: float = 30.0
+
     GITHUB_TOKEN: str
     GITHUB_BASE_URL: str
 
@@ -6,8 +6,16 @@ from fastapi import FastAPI, Request
 
 from app import __version__
 from app.core.config import MeiliEnvironment, settings
+from app.observability.metrics import collect_stats
 from app.rag.api.router import router as chat_router
-from app.rag.factory import get_vector_repository
+from app.rag.factory import (
+    get_budget_allocator,
+    get_checkpoint_compactor,
+    get_conversation_summarizer,
+    get_checkpointer,
+    get_client_registry,
+    get_vector_repository,
+)
 
 # logging 설정
 logging.basicConfig(
@@ -21,6 +29,11 @@ logger = logging.getLogger(__name__)
 # Meilisearch 설정 (서버 가동 시점에 최초 1회 실행)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 외부 의존성 클라이언트 생성 및 연결 warm-up
+    clients = get_client_registry()
+    if settings.HTTP_WARMUP_ENABLED:
+        await clients.warm_up()
+
     try:
         logger.info("Initializing server setup ...")
         logger.info(f"Meilisearch HTTP address: {settings.MEILI_HTTP_ADDR}")
@@ -45,8 +58,32 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"Falied to connect to Meilisearch. {e}")
 
+    # 인덱스별 검색 예산 통계 백그라운드 갱신
+    if settings.RETRIEVAL_BUDGET_ALLOCATOR_ENABLED:
+        get_budget_allocator().start()
+
+    # checkpoint 보존 정책 (오래된 checkpoint / orphan write 정리) 백그라운드 실행
+    if settings.CHECKPOINT_COMPACTION_ENABLED:
+        get_checkpoint_compactor().start()
+
     yield
 
+    if settings.CHECKPOINT_COMPACTION_ENABLED:
+        await get_checkpoint_compactor().stop()
+
+    if settings.RETRIEVAL_BUDGET_ALLOCATOR_ENABLED:
+        await get_budget_allocator().stop()
+
+    # 진행 중인 대화 요약 취소 (요약되지 않은 턴은 다음 턴 종료 후 다시 요약)
+    if settings.CONVERSATION_SUMMARY_ENABLED:
+        await get_conversation_summarizer().aclose()
+
+    # write-behind 큐에 남은 checkpoint 저장
+    if settings.CHECKPOINT_WRITE_BEHIND_ENABLED:
+        await get_checkpointer().aclose()
+
+    await clients.aclose()
+
 
 # MAIN
 app = FastAPI(
@@ -67,6 +104,12 @@ async def health_check():
     return {"status": "ok", "message": "RAG Server is running."}
 
 
+# 캐시/성능 지표
+@app.get("/metrics")
+async def metrics():
+    return collect_stats()
+
+
 # 응답 시간 추출
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
@@ -0,0 +1,25 @@
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# 이름 -> 통계 dict를 반환하는 함수
+_stats_providers: dict[str, Callable[[], dict[str, Any]]] = {}
+
+
+def register_stats(name: str, provider: Callable[[], dict[str, Any]]) -> None:
+    """`GET /metrics`로 노출할 통계 제공자 등록 (같은 이름은 덮어씀)"""
+    _stats_providers[name] = provider
+
+
+def collect_stats() -> dict[str, Any]:
+    result: dict[str, Any] = {}
+
+    for name, provider in _stats_providers.items():
+        try:
+            result[name] = provider()
+        except Exception as e:
+            logger.warning(f"Failed to collect stats for '{name}': {e}")
+            result[name] = None
+
+    return result
@@ -38,6 +38,7 @@ async def chat_response_stream(
             role=request.role,
             session_id=request.session_id,
             index_list=request.index_list,
+            stream_tokens=request.stream_tokens,
         ):
             yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
 
@@ -52,7 +53,8 @@ async def chat_resume(
     async def event_generator():
         async for chunk in service.chat_stream(
             session_id=request.session_id,
-            resume_data=request.user_selected_pull_requests
+            resume_data=request.user_selected_pull_requests,
+            stream_tokens=request.stream_tokens,
         ):
             yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
         
@@ -0,0 +1,292 @@
+import base64
+import hashlib
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+
+from app.rag.cache.store import LruCache
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerCacheEntry(BaseModel):
+    """캐싱된 최종 답변"""
+
+    entry_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    query: str
+    embedding: str = Field(description="float32 쿼리 임베딩 (base64)")
+    answer: str
+    sources: list[dict[str, Any]] = Field(default_factory=list)
+    related_jira_issues: list[dict[str, Any]] = Field(default_factory=list)
+    index_versions: dict[str, str] = Field(
+        default_factory=dict, description="저장 시점의 인덱스별 updatedAt"
+    )
+    created_at: float = Field(default_factory=time.time)
+
+    def vector(self) -> np.ndarray:
+        return np.frombuffer(base64.b64decode(self.embedding), dtype=np.float32)
+
+
+def _encode_vector(vector: list[float]) -> str:
+    return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode()
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class AnswerCache:
+    """
+    index_list + 쿼리 임베딩 기반의 semantic 답변 캐시.
+
+    - 같은 index_list 범위(scope) 안에서 cosine similarity가 threshold 이상인 항목만 적중
+    - 저장 시점과 인덱스 버전(Meilisearch updatedAt)이 다르면 무효
+    - 1차: in-process LRU (바이트 예산 + TTL), 2차: Redis hash (scope 단위 TTL)
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float,
+        max_bytes: int,
+        ttl_seconds: int,
+        max_entries_per_scope: int,
+        index_version_loader: Callable[[list[str]], Awaitable[dict[str, str]]],
+        index_version_ttl_seconds: float,
+        redis_client: Optional[Redis] = None,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_scope = max_entries_per_scope
+        self.redis = redis_client
+
+        # entry_id -> (entry, normalized vector)
+        self.memory = LruCache(max_bytes=max_bytes, ttl_seconds=ttl_seconds)
+        # scope -> entry_id 목록
+        self._scopes: dict[str, list[str]] = {}
+
+        # 인덱스 버전 조회 결과 단기 캐싱 (요청마다 Meilisearch 호출 방지)
+        self._load_index_versions = index_version_loader
+        self._index_versions = LruCache(
+            max_bytes=1024 * 1024, ttl_seconds=index_version_ttl_seconds
+        )
+
+        self.lookups = 0
+        self.hits = 0
+        self.redis_hits = 0
+        self.stale = 0
+        self.stores = 0
+
+    @staticmethod
+    def scope_key(index_list: list[str]) -> str:
+        raw = "|".join(sorted(set(index_list)))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def _redis_key(self, scope: str) -> str:
+        return f"cache:answer:{scope}"
+
+    async def get_index_versions(self, index_list: list[str]) -> dict[str, str]:
+        scope = self.scope_key(index_list)
+        versions = self._index_versions.get(scope)
+
+        if versions is None:
+            versions = await self._load_index_versions(index_list)
+            self._index_versions.set(scope, versions, size=len(str(versions)))
+
+        return versions
+
+    async def lookup(
+        self, index_list: list[str], embedding: list[float]
+    ) -> Optional[AnswerCacheEntry]:
+        self.lookups += 1
+
+        scope = self.scope_key(index_list)
+        query_vector = _normalize(np.asarray(embedding, dtype=np.float32))
+
+        match = self._best_match(self._memory_candidates(scope), query_vector)
+        from_redis = False
+
+        # 다른 worker가 저장한 답변 확인
+        if match is None and self.redis is not None:
+            match = self._best_match(await self._redis_candidates(scope), query_vector)
+            from_redis = match is not None
+
+        if match is None:
+            return None
+
+        entry, similarity = match
+
+        # 답변 저장 이후 인덱스가 갱신된 경우 무효
+        versions = await self.get_index_versions(index_list)
+        if versions != entry.index_versions:
+            self.stale += 1
+            await self._evict(scope, entry.entry_id)
+            return None
+
+        self.memory.get(entry.entry_id)  # LRU 순서 갱신
+        self.hits += 1
+        if from_redis:
+            self.redis_hits += 1
+
+        logger.info(
+            f"Answer cache 적중 (similarity: {similarity:.4f}, "
+            f"cached query: {entry.query})"
+        )
+        return entry
+
+    async def store(
+        self,
+        index_list: list[str],
+        query: str,
+        embedding: list[float],
+        answer: str,
+        sources: list[dict[str, Any]],
+        related_jira_issues: list[dict[str, Any]],
+    ) -> None:
+        scope = self.scope_key(index_list)
+
+        entry = AnswerCacheEntry(
+            query=query,
+            embedding=_encode_vector(embedding),
+            answer=answer,
+            sources=sources,
+            related_jira_issues=related_jira_issues,
+            index_versions=await self.get_index_versions(index_list),
+        )
+        payload = entry.model_dump_json()
+
+        self._remember(scope, entry, size=len(payload))
+        self.stores += 1
+
+        if self.redis is None:
+            return
+
+        key = self._redis_key(scope)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, entry.entry_id, payload)
+                pipe.expire(key, self.ttl_seconds)
+                pipe.hlen(key)
+                _, _, size = await pipe.execute()
+
+            if size > self.max_entries_per_scope:
+                await self._trim_redis_scope(key)
+
+        except Exception as e:
+            logger.warning(f"Answer cache Redis 저장 실패: {e}")
+
+    def _best_match(
+        self,
+        candidates: list[tuple[AnswerCacheEntry, np.ndarray]],
+        query_vector: np.ndarray,
+    ) -> Optional[tuple[AnswerCacheEntry, float]]:
+        if not candidates:
+            return None
+
+        matrix = np.stack([vector for _, vector in candidates])
+        similarities = matrix @ query_vector
+        best = int(np.argmax(similarities))
+
+        if similarities[best] < self.similarity_threshold:
+            return None
+
+        return candidates[best][0], float(similarities[best])
+
+    def _remember(self, scope: str, entry: AnswerCacheEntry, size: int) -> None:
+        self.memory.set(entry.entry_id, (entry, _normalize(entry.vector())), size=size)
+
+        entry_ids = self._scopes.setdefault(scope, [])
+        if entry.entry_id not in entry_ids:
+            entry_ids.append(entry.entry_id)
+
+        # scope당 최대 개수 초과 시 오래된 항목부터 제거
+        while len(entry_ids) > self.max_entries_per_scope:
+            self.memory.delete(entry_ids.pop(0))
+
+    def _memory_candidates(
+        self, scope: str
+    ) -> list[tuple[AnswerCacheEntry, np.ndarray]]:
+        entry_ids = self._scopes.get(scope, [])
+        candidates = []
+        alive_ids = []
+
+        for entry_id in entry_ids:
+            cached = self.memory.peek(entry_id)
+            if cached is None:
+                continue
+            candidates.append(cached)
+            alive_ids.append(entry_id)
+
+        # LRU/TTL로 이미 제거된 항목 정리
+        if alive_ids:
+            self._scopes[scope] = alive_ids
+        else:
+            self._scopes.pop(scope, None)
+
+        return candidates
+
+    async def _redis_candidates(
+        self, scope: str
+    ) -> list[tuple[AnswerCacheEntry, np.ndarray]]:
+        try:
+            raw_entries = await self.redis.hgetall(self._redis_key(scope))
+        except Exception as e:
+            logger.warning(f"Answer cache Redis 조회 실패: {e}")
+            return []
+
+        now = time.time()
+        candidates = []
+
+        for raw in raw_entries.values():
+            try:
+                entry = AnswerCacheEntry.model_validate_json(raw)
+            except Exception:
+                continue
+
+            if now - entry.created_at > self.ttl_seconds:
+                continue
+
+            self._remember(scope, entry, size=len(raw))
+            candidates.append((entry, _normalize(entry.vector())))
+
+        return candidates
+
+    async def _trim_redis_scope(self, key: str) -> None:
+        raw_entries = await self.redis.hgetall(key)
+
+        entries = []
+        for field, raw in raw_entries.items():
+            try:
+                entries.append((AnswerCacheEntry.model_validate_json(raw).created_at, field))
+            except Exception:
+                entries.append((0.0, field))
+
+        entries.sort()
+        overflow = len(entries) - self.max_entries_per_scope
+        if overflow > 0:
+            await self.redis.hdel(key, *[field for _, field in entries[:overflow]])
+
+    async def _evict(self, scope: str, entry_id: str) -> None:
+        self.memory.delete(entry_id)
+
+        if self.redis is not None:
+            try:
+                await self.redis.hdel(self._redis_key(scope), entry_id)
+            except Exception as e:
+                logger.warning(f"Answer cache Redis 삭제 실패: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "hit_rate": round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+            "stale": self.stale,
+            "stores": self.stores,
+            "memory": self.memory.stats(),
+        }
@@ -0,0 +1,194 @@
+import hashlib
+import logging
+import unicodedata
+from typing import Any, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.rag.cache.store import LruCache, RedisCacheStore
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키 생성을 위한 쿼리 정규화 (유니코드 정규화 + 공백 정리)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """
+    (embedding model, dimensions, normalized text) 단위의 2단 임베딩 캐시.
+
+    1차: in-process LRU (바이트 예산)
+    2차: Redis (TTL)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        redis_store: Optional[RedisCacheStore] = None,
+    ):
+        self.memory = LruCache(max_bytes=max_bytes)
+        self.redis = redis_store
+
+        # 요청 단위 통계
+        self.requested_texts = 0
+        self.deduped_texts = 0
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.upstream_calls = 0
+
+    @staticmethod
+    def make_key(model: str, dimensions: Optional[int], normalized_text: str) -> str:
+        raw = f"{model}|{dimensions or 0}|{normalized_text}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """메모리 -> Redis 순서로 조회. Redis에서 찾은 항목은 메모리로 승격한다."""
+        found: dict[str, np.ndarray] = {}
+        remote_keys: list[str] = []
+
+        for key in keys:
+            vector = self.memory.get(key)
+            if vector is not None:
+                found[key] = vector
+                self.memory_hits += 1
+            else:
+                remote_keys.append(key)
+
+        if remote_keys and self.redis is not None:
+            values = await self.redis.get_many(remote_keys)
+            for key, raw in zip(remote_keys, values):
+                if raw is None:
+                    continue
+                vector = np.frombuffer(raw, dtype=np.float32)
+                self.memory.set(key, vector)
+                found[key] = vector
+                self.redis_hits += 1
+
+        self.misses += len(keys) - len(found)
+        return found
+
+    async def set_many(self, vectors: dict[str, np.ndarray]) -> None:
+        for key, vector in vectors.items():
+            self.memory.set(key, vector)
+
+        if self.redis is not None:
+            await self.redis.set_many(
+                {key: vector.tobytes() for key, vector in vectors.items()}
+            )
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.memory_hits + self.redis_hits + self.misses
+        hits = self.memory_hits + self.redis_hits
+        return {
+            "requested_texts": self.requested_texts,
+            "deduped_texts": self.deduped_texts,
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "upstream_calls": self.upstream_calls,
+            "memory": self.memory.stats(),
+            "redis": self.redis.stats() if self.redis is not None else None,
+        }
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    임베딩 캐시를 거쳐 cache miss 문자열만 upstream으로 전달하는 Embeddings 래퍼.
+
+    하나의 배치 안에서 동일한 문자열은 한 번만 임베딩한다.
+    """
+
+    def __init__(self, underlying: Embeddings, cache: EmbeddingCache):
+        self.underlying = underlying
+        self.cache = cache
+
+    @property
+    def model(self) -> str:
+        return getattr(self.underlying, "model", type(self.underlying).__name__)
+
+    @property
+    def dimensions(self) -> Optional[int]:
+        return getattr(self.underlying, "dimensions", None)
+
+    def _keys_for(self, texts: list[str]) -> tuple[list[str], dict[str, str]]:
+        """입력 순서대로의 캐시 키와, 키별 정규화된 대표 문자열"""
+        keys: list[str] = []
+        unique: dict[str, str] = {}
+
+        for text in texts:
+            normalized = normalize_text(text)
+            key = EmbeddingCache.make_key(self.model, self.dimensions, normalized)
+            keys.append(key)
+            unique.setdefault(key, normalized)
+
+        self.cache.requested_texts += len(texts)
+        self.cache.deduped_texts += len(texts) - len(unique)
+
+        return keys, unique
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+
+        keys, unique = self._keys_for(texts)
+
+        found = await self.cache.get_many(list(unique.keys()))
+
+        miss_keys = [key for key in unique if key not in found]
+
+        if miss_keys:
+            self.cache.upstream_calls += 1
+            fresh = await self.underlying.aembed_documents(
+                [unique[key] for key in miss_keys]
+            )
+            fresh_vectors = {
+                key: np.asarray(vector, dtype=np.float32)
+                for key, vector in zip(miss_keys, fresh)
+            }
+            await self.cache.set_many(fresh_vectors)
+            found.update(fresh_vectors)
+
+        logger.info(
+            f"Embedding cache: 요청 {len(texts)}건, 고유 {len(unique)}건, "
+            f"upstream {len(miss_keys)}건"
+        )
+
+        return [found[key].tolist() for key in keys]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        vectors = await self.aembed_documents([text])
+        return vectors[0]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """동기 경로는 in-process 캐시만 사용"""
+        if not texts:
+            return []
+
+        keys, unique = self._keys_for(texts)
+
+        found: dict[str, np.ndarray] = {}
+        for key in unique:
+            vector = self.cache.memory.get(key)
+            if vector is not None:
+                found[key] = vector
+                self.cache.memory_hits += 1
+
+        miss_keys = [key for key in unique if key not in found]
+        self.cache.misses += len(miss_keys)
+
+        if miss_keys:
+            self.cache.upstream_calls += 1
+            fresh = self.underlying.embed_documents([unique[key] for key in miss_keys])
+            for key, vector in zip(miss_keys, fresh):
+                found[key] = np.asarray(vector, dtype=np.float32)
+                self.cache.memory.set(key, found[key])
+
+        return [found[key].tolist() for key in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
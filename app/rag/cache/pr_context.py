@@ -0,0 +1,96 @@
+import logging
+import time
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+from app.rag.cache.store import LruCache, RedisCacheStore
+
+logger = logging.getLogger(__name__)
+
+
+class PrContextEntry(BaseModel):
+    """PR 하나의 files / comments 원본(필요한 필드만)과 ETag"""
+
+    files_data: list[dict[str, Any]] = Field(default_factory=list)
+    comments_data: list[dict[str, Any]] = Field(default_factory=list)
+    files_etag: Optional[str] = None
+    comments_etag: Optional[str] = None
+    files_bytes: int = 0
+    comments_bytes: int = 0
+    fetched_at: float = Field(default_factory=time.time)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.fetched_at
+
+    @property
+    def nbytes(self) -> int:
+        return self.files_bytes + self.comments_bytes
+
+
+class PrContextCache:
+    """
+    owner/repo/number 단위의 GitHub PR context 캐시.
+
+    1차: in-process LRU (바이트 예산), 2차(선택): Redis (TTL)
+    fresh 여부 판단과 ETag 재검증은 GithubService에서 수행한다.
+    """
+
+    def __init__(self, max_bytes: int, redis_store: Optional[RedisCacheStore] = None):
+        self.memory = LruCache(max_bytes=max_bytes)
+        self.redis = redis_store
+
+        self.requests = 0
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+
+    @staticmethod
+    def make_key(owner: str, repo: str, pr_number: int) -> str:
+        return f"{owner}/{repo}#{pr_number}"
+
+    async def get(self, key: str) -> Optional[PrContextEntry]:
+        entry = self.memory.get(key)
+        if entry is not None:
+            return entry
+
+        if self.redis is None:
+            return None
+
+        raw = await self.redis.get(key)
+        if raw is None:
+            return None
+
+        try:
+            entry = PrContextEntry.model_validate_json(raw)
+        except ValueError as e:
+            logger.warning(f"PR context cache 항목 파싱 실패 ({key}): {e}")
+            return None
+
+        self.memory.set(key, entry, size=entry.nbytes)
+        return entry
+
+    async def set(self, key: str, entry: PrContextEntry) -> None:
+        self.memory.set(key, entry, size=entry.nbytes)
+
+        if self.redis is not None:
+            await self.redis.set(key, entry.model_dump_json().encode("utf-8"))
+
+    def stats(self) -> dict[str, Any]:
+        hits = self.fresh_hits + self.stale_hits
+        return {
+            "requests": self.requests,
+            "fresh_hits": self.fresh_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / self.requests, 4) if self.requests else 0.0,
+            "revalidations": self.revalidations,
+            "not_modified": self.not_modified,
+            "bytes_saved": self.bytes_saved,
+            "memory": self.memory.stats(),
+            "redis": self.redis.stats() if self.redis is not None else None,
+        }
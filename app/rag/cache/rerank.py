@@ -0,0 +1,94 @@
+import hashlib
+import logging
+import struct
+from typing import Any, Optional
+
+from app.rag.cache.embedding import normalize_text
+from app.rag.cache.store import LruCache, RedisCacheStore
+from app.rag.models.retrieve import BaseSearchResult
+
+logger = logging.getLogger(__name__)
+
+# 항목당 대략적인 메모리 사용량 (key + float)
+_ENTRY_SIZE = 128
+
+
+def document_key(doc: BaseSearchResult) -> str:
+    """문서 식별자 + 본문 해시 (같은 id라도 내용이 바뀌면 다른 키)"""
+    content_hash = hashlib.sha1(doc.text.encode("utf-8")).hexdigest()
+    return f"{int(doc.source_type)}:{doc.owner}/{doc.repo}:{doc.id}:{content_hash}"
+
+
+class RerankScoreCache:
+    """
+    (backend, normalized query, document id, content hash) 단위의 rerank 점수 캐시.
+
+    1차: in-process LRU (바이트 예산), 2차(선택): Redis (TTL)
+    """
+
+    def __init__(self, max_bytes: int, redis_store: Optional[RedisCacheStore] = None):
+        self.memory = LruCache(max_bytes=max_bytes)
+        self.redis = redis_store
+
+        self.rerank_requests = 0
+        self.avoided_calls = 0
+        self.documents = 0
+        self.cached_documents = 0
+
+    @staticmethod
+    def make_key(backend: str, query: str, doc: BaseSearchResult) -> str:
+        raw = f"{backend}|{normalize_text(query)}|{document_key(doc)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get_many(self, keys: list[str]) -> dict[str, float]:
+        found: dict[str, float] = {}
+        remote_keys: list[str] = []
+
+        for key in keys:
+            score = self.memory.get(key)
+            if score is not None:
+                found[key] = score
+            else:
+                remote_keys.append(key)
+
+        if remote_keys and self.redis is not None:
+            values = await self.redis.get_many(remote_keys)
+            for key, raw in zip(remote_keys, values):
+                if raw is None:
+                    continue
+                score = struct.unpack("<d", raw)[0]
+                self.memory.set(key, score, size=_ENTRY_SIZE)
+                found[key] = score
+
+        return found
+
+    async def set_many(self, scores: dict[str, float]) -> None:
+        for key, score in scores.items():
+            self.memory.set(key, score, size=_ENTRY_SIZE)
+
+        if self.redis is not None:
+            await self.redis.set_many(
+                {key: struct.pack("<d", score) for key, score in scores.items()}
+            )
+
+    def record(self, total: int, cached: int) -> None:
+        self.rerank_requests += 1
+        self.documents += total
+        self.cached_documents += cached
+        if total and cached == total:
+            self.avoided_calls += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "rerank_requests": self.rerank_requests,
+            "avoided_calls": self.avoided_calls,
+            "documents": self.documents,
+            "cached_documents": self.cached_documents,
+            "document_hit_rate": (
+                round(self.cached_documents / self.documents, 4)
+                if self.documents
+                else 0.0
+            ),
+            "memory": self.memory.stats(),
+            "redis": self.redis.stats() if self.redis is not None else None,
+        }
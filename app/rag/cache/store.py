@@ -0,0 +1,212 @@
+import logging
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+def _default_sizeof(value: Any) -> int:
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class LruCache:
+    """
+    바이트 예산(max_bytes)과 TTL을 가지는 in-process LRU 캐시.
+
+    단일 이벤트 루프에서만 접근하므로 별도의 lock을 사용하지 않는다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: Optional[float] = None,
+        sizeof: Callable[[Any], int] = _default_sizeof,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._sizeof = sizeof
+
+        # key -> (value, size, expires_at)
+        self._data: OrderedDict[str, tuple[Any, int, Optional[float]]] = OrderedDict()
+        self._nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return self.peek(key) is not None
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def peek(self, key: str) -> Any:
+        """통계와 LRU 순서에 영향을 주지 않는 조회"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, _, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            return None
+        return value
+
+    def get(self, key: str) -> Any:
+        entry = self._data.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, _, expires_at = entry
+
+        # 만료된 항목 제거
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, size: Optional[int] = None) -> None:
+        size = size if size is not None else self._sizeof(value)
+
+        # 예산보다 큰 단일 항목은 캐싱하지 않음
+        if size > self.max_bytes:
+            return
+
+        if key in self._data:
+            self._remove(key)
+
+        expires_at = (
+            time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        )
+        self._data[key] = (value, size, expires_at)
+        self._nbytes += size
+
+        # 예산 초과 시 가장 오래전에 사용된 항목부터 제거
+        while self._nbytes > self.max_bytes and self._data:
+            oldest_key = next(iter(self._data))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        if key in self._data:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._nbytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._data.pop(key)
+        self._nbytes -= size
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "bytes": self._nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+class RedisCacheStore:
+    """
+    namespace와 TTL을 가지는 Redis 기반 2차 캐시 (bytes 값 저장).
+
+    Redis 장애는 캐시 miss로 취급하며 요청 흐름을 중단시키지 않는다.
+    """
+
+    def __init__(
+        self, client: Redis, namespace: str, ttl_seconds: Optional[int] = None
+    ):
+        self.client = client
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        values = await self.get_many([key])
+        return values[0]
+
+    async def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        if not keys:
+            return []
+
+        try:
+            values = await self.client.mget([self._key(k) for k in keys])
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis cache 조회 실패 ({self.namespace}): {e}")
+            return [None] * len(keys)
+
+        for value in values:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return values
+
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[int] = None):
+        await self.set_many({key: value}, ttl_seconds=ttl_seconds)
+
+    async def set_many(
+        self, items: dict[str, bytes], ttl_seconds: Optional[int] = None
+    ) -> None:
+        if not items:
+            return
+
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self._key(key), value, ex=ttl)
+                await pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis cache 저장 실패 ({self.namespace}): {e}")
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.client.delete(self._key(key))
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis cache 삭제 실패 ({self.namespace}): {e}")
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "errors": self.errors,
+        }
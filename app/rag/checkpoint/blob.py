@@ -0,0 +1,133 @@
+import hashlib
+import logging
+from typing import Any
+
+from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+
+from app.rag.cache.store import LruCache
+
+logger = logging.getLogger(__name__)
+
+
+class BlobRef(BaseModel):
+    """checkpoint에 문서 대신 저장되는 content-addressed 참조"""
+
+    digest: str = Field(description="payload sha256")
+    type: str = Field(description="원본 문서 클래스 이름")
+    size: int = Field(default=0, description="payload 바이트 수")
+
+
+def make_digest(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+class CheckpointBlobStore:
+    """
+    checkpoint에서 분리한 문서 payload 저장소 (key = sha256(payload)).
+
+    - 같은 문서는 checkpoint / 재시도 / 세션이 달라도 한 번만 저장하고 TTL만 갱신
+    - checkpoint 저장 때마다 참조하는 blob의 TTL을 갱신 (blob이 checkpoint보다 먼저 만료되지 않도록)
+    - 최근 사용한 payload는 in-process LRU에 보관해 hydrate 시 Redis 조회 생략
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        ttl_seconds: int,
+        memory_max_bytes: int,
+        namespace: str = "checkpoint_doc",
+        refresh_on_read: bool = False,
+    ):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        # checkpoint TTL을 조회 시에도 갱신하는 경우 hydrate한 blob의 TTL도 함께 갱신
+        self.refresh_on_read = refresh_on_read
+
+        # digest -> payload (Redis에 저장된 것이 확인된 blob)
+        self.memory = LruCache(max_bytes=memory_max_bytes)
+
+        self.writes = 0
+        self.skipped_writes = 0
+        self.restored = 0
+        self.redis_reads = 0
+        self.missing = 0
+
+    def _key(self, digest: str) -> str:
+        return f"{self.namespace}:{digest}"
+
+    async def put_many(self, payloads: dict[str, bytes]) -> None:
+        """
+        digest -> payload 저장. 이미 저장한 blob은 다시 쓰지 않고 TTL만 갱신(EXPIRE)하며,
+        그 사이 만료 / 삭제된 blob은 다시 저장한다.
+
+        Redis 오류는 호출자에게 전달한다 (참조만 남고 원본이 없는 checkpoint 방지).
+        """
+        known, pending = [], []
+        for digest in payloads:
+            (known if self.memory.peek(digest) is not None else pending).append(digest)
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for digest in known:
+                pipe.expire(self._key(digest), self.ttl_seconds)
+            for digest in pending:
+                pipe.set(self._key(digest), payloads[digest], ex=self.ttl_seconds)
+            results = await pipe.execute()
+
+        # EXPIRE 대상 키가 없으면 0 반환 -> 원본 다시 저장
+        expired = [digest for digest, ok in zip(known, results) if not ok]
+        if expired:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for digest in expired:
+                    pipe.set(self._key(digest), payloads[digest], ex=self.ttl_seconds)
+                await pipe.execute()
+            self.restored += len(expired)
+
+        self.skipped_writes += len(known) - len(expired)
+        self.writes += len(pending) + len(expired)
+
+        for digest, payload in payloads.items():
+            self.memory.set(digest, payload, size=len(payload))
+
+    async def get_many(self, digests: list[str]) -> dict[str, bytes]:
+        """메모리 -> Redis(MGET 1회) 순서로 조회. 만료된 blob은 결과에서 빠진다."""
+        found: dict[str, bytes] = {}
+        remote: list[str] = []
+
+        for digest in digests:
+            payload = self.memory.get(digest)
+            if payload is not None:
+                found[digest] = payload
+            else:
+                remote.append(digest)
+
+        if remote:
+            self.redis_reads += 1
+            values = await self.client.mget([self._key(d) for d in remote])
+            for digest, payload in zip(remote, values):
+                if payload is None:
+                    self.missing += 1
+                    continue
+                self.memory.set(digest, payload, size=len(payload))
+                found[digest] = payload
+
+        if self.refresh_on_read and found:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for digest in found:
+                    pipe.expire(self._key(digest), self.ttl_seconds)
+                await pipe.execute()
+
+        return found
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "namespace": self.namespace,
+            "ttl_seconds": self.ttl_seconds,
+            "writes": self.writes,
+            "skipped_writes": self.skipped_writes,
+            "restored": self.restored,
+            "redis_reads": self.redis_reads,
+            "missing": self.missing,
+            "memory": self.memory.stats(),
+        }
@@ -0,0 +1,174 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+
+from app.rag.cache.store import LruCache
+
+logger = logging.getLogger(__name__)
+
+# 직렬화된 값 (type, bytes)
+_Typed = tuple[str, bytes]
+
+
+@dataclass
+class HotEntry:
+    """thread의 최신 checkpoint 스냅샷 (직렬화 상태로 보관해 노드의 in-place 수정과 분리)"""
+
+    checkpoint_id: str
+    parent_checkpoint_id: Optional[str]
+    checkpoint: _Typed
+    metadata: _Typed
+    # (task_id, idx) -> (channel, value). Redis write key와 같은 단위라 개수로 버전 비교 가능
+    writes: dict[tuple[str, int], tuple[str, _Typed]] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return (
+            len(self.checkpoint[1])
+            + len(self.metadata[1])
+            + sum(len(value[1]) + 64 for _, value in self.writes.values())
+            + 256
+        )
+
+
+class HotCheckpointCache:
+    """
+    활성 세션의 최신 checkpoint를 thread_id 단위로 보관하는 in-process write-through LRU.
+
+    - Redis 저장이 끝난 checkpoint / pending write를 그대로 반영하고, Redis에서 읽은 최신 checkpoint도 보관
+    - 메모리 예산(max_bytes)과 TTL을 가지며 root namespace("")만 캐싱
+    - 버전 확인(checkpoint_latest 포인터 / write 개수)은 saver가 Redis 조회 1회로 수행
+    """
+
+    def __init__(self, serde: Any, max_bytes: int, ttl_seconds: float):
+        self.serde = serde
+        self.memory = LruCache(
+            max_bytes=max_bytes,
+            ttl_seconds=ttl_seconds,
+            sizeof=lambda entry: entry.size,
+        )
+
+        # 통계
+        self.stale = 0
+        self.write_through = 0
+        self.read_through = 0
+
+    def get(self, thread_id: str) -> Optional[HotEntry]:
+        return self.memory.get(thread_id)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+    ) -> None:
+        """aput 완료 후 호출. config는 aput 인자 (checkpoint_id가 parent)"""
+        configurable = config["configurable"]
+        parent_checkpoint_id = configurable.get("checkpoint_id")
+        if parent_checkpoint_id == checkpoint["id"]:
+            parent_checkpoint_id = None
+
+        self.memory.set(
+            configurable["thread_id"],
+            HotEntry(
+                checkpoint_id=checkpoint["id"],
+                parent_checkpoint_id=parent_checkpoint_id,
+                checkpoint=self.serde.dumps_typed(checkpoint),
+                metadata=self.serde.dumps_typed(metadata),
+            ),
+        )
+        self.write_through += 1
+
+    def put_writes(
+        self, config: RunnableConfig, writes: list[tuple[str, Any]], task_id: str
+    ) -> None:
+        """aput_writes 완료 후 호출. 캐시된 checkpoint에 대한 write만 반영"""
+        thread_id = config["configurable"]["thread_id"]
+        entry = self.memory.peek(thread_id)
+        if entry is None or entry.checkpoint_id != config["configurable"]["checkpoint_id"]:
+            return
+
+        # Redis write key와 같은 (task_id, idx) 단위로 덮어씀
+        for idx, (channel, value) in enumerate(writes):
+            entry.writes[(task_id, WRITES_IDX_MAP.get(channel, idx))] = (
+                channel,
+                self.serde.dumps_typed(value),
+            )
+
+        # 크기 재계산
+        self.memory.set(thread_id, entry)
+        self.write_through += 1
+
+    def put_tuple(self, checkpoint_tuple: CheckpointTuple) -> None:
+        """Redis에서 읽은 최신 checkpoint 보관 (hydrate 완료된 tuple)"""
+        configurable = checkpoint_tuple.config["configurable"]
+        parent_config = checkpoint_tuple.parent_config
+
+        # write 순서로 idx 재구성 (Pregel은 task의 write를 한 번에 저장)
+        writes = {}
+        task_counts: dict[str, int] = {}
+        for task_id, channel, value in checkpoint_tuple.pending_writes or []:
+            n = task_counts.get(task_id, 0)
+            task_counts[task_id] = n + 1
+            writes[(task_id, WRITES_IDX_MAP.get(channel, n))] = (
+                channel,
+                self.serde.dumps_typed(value),
+            )
+
+        self.memory.set(
+            configurable["thread_id"],
+            HotEntry(
+                checkpoint_id=configurable["checkpoint_id"],
+                parent_checkpoint_id=(
+                    parent_config["configurable"]["checkpoint_id"] if parent_config else None
+                ),
+                checkpoint=self.serde.dumps_typed(checkpoint_tuple.checkpoint),
+                metadata=self.serde.dumps_typed(checkpoint_tuple.metadata),
+                writes=writes,
+            ),
+        )
+        self.read_through += 1
+
+    def load(self, thread_id: str, entry: HotEntry) -> CheckpointTuple:
+        def make_config(checkpoint_id: str) -> RunnableConfig:
+            return {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": "",
+                    "checkpoint_id": checkpoint_id,
+                }
+            }
+
+        return CheckpointTuple(
+            config=make_config(entry.checkpoint_id),
+            checkpoint=self.serde.loads_typed(entry.checkpoint),
+            metadata=self.serde.loads_typed(entry.metadata),
+            parent_config=(
+                make_config(entry.parent_checkpoint_id) if entry.parent_checkpoint_id else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed(value))
+                for (task_id, _), (channel, value) in entry.writes.items()
+            ],
+        )
+
+    def invalidate(self, thread_id: str, stale: bool = False) -> None:
+        self.memory.delete(thread_id)
+        if stale:
+            self.stale += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.memory.stats(),
+            "stale": self.stale,
+            "write_through": self.write_through,
+            "read_through": self.read_through,
+        }
@@ -0,0 +1,297 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from langgraph.checkpoint.base import INTERRUPT, RESUME
+from langgraph.checkpoint.redis.key_registry import CheckpointKeyRegistry
+from redisvl.query import FilterQuery
+from redisvl.query.filter import Tag
+
+from app.rag.checkpoint.saver import CatchUpRedisSaver
+
+logger = logging.getLogger(__name__)
+
+_LATEST_POINTER_PREFIX = "checkpoint_latest:"
+
+# thread 1개에서 한 번에 조회하는 checkpoint / write 수 (AsyncRedisSaver.adelete_thread와 동일)
+_MAX_RESULTS = 10000
+
+
+@dataclass
+class _ThreadPlan:
+    """thread 1개의 compaction 결과: 삭제할 키와 TTL을 부여할 키"""
+
+    checkpoints: int = 0
+    delete_checkpoints: list[str] = field(default_factory=list)
+    delete_writes: list[str] = field(default_factory=list)
+    orphan_writes: int = 0
+    preserved_interrupts: int = 0
+    keep_keys: list[str] = field(default_factory=list)
+
+
+class CheckpointCompactor:
+    """
+    Redis checkpoint 보존 정책을 적용하는 백그라운드 작업.
+
+    - checkpoint_latest 포인터를 SCAN해 thread를 찾고, (thread, namespace)별 최신 keep_last개 checkpoint만 유지
+    - resume되지 않은 interrupt가 남아있는 checkpoint는 keep_last와 무관하게 보존
+    - 삭제된 checkpoint의 write / write registry, checkpoint가 없는 write(orphan), 끊어진 포인터 정리
+    - TTL 없이 저장된 기존 키에 ttl_seconds 부여 (EXPIRE NX, 새 키는 saver의 ttl 설정으로 저장 시 부여)
+
+    분리 저장한 문서 blob(CheckpointBlobStore)은 여러 thread가 공유하므로 자체 TTL로 만료시킨다.
+    """
+
+    def __init__(
+        self,
+        saver: CatchUpRedisSaver,
+        keep_last: int = 5,
+        interval_seconds: float = 600.0,
+        ttl_seconds: Optional[int] = None,
+        scan_count: int = 500,
+    ):
+        self.saver = saver
+        self.redis = saver._redis
+        self.keep_last = max(keep_last, 1)
+        self.interval_seconds = interval_seconds
+        self.ttl_seconds = ttl_seconds
+        self.scan_count = scan_count
+
+        self._task: Optional[asyncio.Task] = None
+
+        # 통계 (누적)
+        self.runs = 0
+        self.failures = 0
+        self.deleted_checkpoints = 0
+        self.deleted_writes = 0
+        self.orphan_writes = 0
+        self.orphan_pointers = 0
+        self.preserved_interrupts = 0
+        self.expire_set = 0
+        self.reclaimed_bytes = 0
+
+        # 통계 (마지막 실행)
+        self.last_run_at: Optional[float] = None
+        self.last_duration_seconds: Optional[float] = None
+        self.last_threads = 0
+        self.last_checkpoints = 0
+        self.last_reclaimed_bytes = 0
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._compact_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _compact_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.run()
+
+    async def run(self) -> None:
+        """전체 thread 1회 compaction. 실패는 로그만 남기고 다음 주기에 재시도"""
+        start = time.perf_counter()
+        threads = checkpoints = reclaimed = 0
+
+        try:
+            # 인덱스 / write key registry 준비 (이미 생성된 인덱스는 유지)
+            if self.saver._key_registry is None:
+                await self.saver.setup()
+
+            seen: set[str] = set()
+            async for pointer_key in self.redis.scan_iter(
+                match=f"{_LATEST_POINTER_PREFIX}*", count=self.scan_count
+            ):
+                if isinstance(pointer_key, bytes):
+                    pointer_key = pointer_key.decode()
+
+                reclaimed += await self._check_pointer(pointer_key)
+
+                # 포인터는 namespace마다 있으므로 thread 단위로 한 번만 처리
+                thread_id = pointer_key[len(_LATEST_POINTER_PREFIX) :].split(":", 1)[0]
+                if thread_id in seen:
+                    continue
+                seen.add(thread_id)
+
+                plan = await self._plan_thread(thread_id)
+                reclaimed += await self._apply(plan)
+                threads += 1
+                checkpoints += plan.checkpoints
+
+            self.runs += 1
+            self.last_run_at = time.time()
+            self.last_threads = threads
+            self.last_checkpoints = checkpoints
+            self.last_reclaimed_bytes = reclaimed
+
+            logger.info(
+                f"Checkpoint compaction 완료: threads={threads}, checkpoints={checkpoints}, "
+                f"reclaimed={reclaimed}B"
+            )
+
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"Checkpoint compaction 실패: {e}")
+
+        finally:
+            self.reclaimed_bytes += reclaimed
+            self.last_duration_seconds = round(time.perf_counter() - start, 3)
+
+    async def _check_pointer(self, pointer_key: str) -> int:
+        """가리키는 checkpoint가 없는 포인터 삭제. 회수한 바이트 수 반환"""
+        checkpoint_key = await self.redis.get(pointer_key)
+        if checkpoint_key is None or await self.redis.exists(checkpoint_key):
+            return 0
+
+        self.orphan_pointers += 1
+        return await self._unlink([pointer_key])
+
+    async def _plan_thread(self, thread_id: str) -> _ThreadPlan:
+        """thread_id는 storage-safe 값 (포인터 / 인덱스에 저장된 형태)"""
+        saver = self.saver
+        plan = _ThreadPlan()
+
+        # write를 먼저 조회: 이후에 저장된 checkpoint의 write를 orphan으로 오인하지 않도록
+        # (checkpoint가 write보다 먼저 저장됨)
+        writes = await saver.checkpoint_writes_index.search(
+            FilterQuery(
+                filter_expression=Tag("thread_id") == thread_id,
+                return_fields=["checkpoint_ns", "checkpoint_id", "task_id", "idx", "channel"],
+                num_results=_MAX_RESULTS,
+            )
+        )
+        checkpoints = await saver.checkpoints_index.search(
+            FilterQuery(
+                filter_expression=Tag("thread_id") == thread_id,
+                return_fields=["checkpoint_ns", "checkpoint_id"],
+                num_results=_MAX_RESULTS,
+            )
+        )
+
+        # (namespace, checkpoint_id) -> write 키 / channel
+        write_keys: defaultdict[tuple[str, str], list[str]] = defaultdict(list)
+        write_channels: defaultdict[tuple[str, str], set[str]] = defaultdict(set)
+        for doc in writes.docs:
+            checkpoint = (getattr(doc, "checkpoint_ns", ""), getattr(doc, "checkpoint_id", ""))
+            write_keys[checkpoint].append(
+                saver._make_redis_checkpoint_writes_key(
+                    thread_id,
+                    checkpoint[0],
+                    checkpoint[1],
+                    getattr(doc, "task_id", ""),
+                    getattr(doc, "idx", 0),
+                )
+            )
+            write_channels[checkpoint].add(getattr(doc, "channel", ""))
+
+        by_namespace: defaultdict[str, list[str]] = defaultdict(list)
+        for doc in checkpoints.docs:
+            by_namespace[getattr(doc, "checkpoint_ns", "")].append(getattr(doc, "checkpoint_id", ""))
+            plan.checkpoints += 1
+
+        existing: set[tuple[str, str]] = set()
+        for checkpoint_ns, checkpoint_ids in by_namespace.items():
+            # checkpoint id(uuid6)는 시간순 정렬 가능
+            checkpoint_ids.sort(reverse=True)
+
+            for i, checkpoint_id in enumerate(checkpoint_ids):
+                checkpoint = (checkpoint_ns, checkpoint_id)
+                existing.add(checkpoint)
+
+                checkpoint_key = saver._make_redis_checkpoint_key(
+                    thread_id, checkpoint_ns, checkpoint_id
+                )
+                zset_key = CheckpointKeyRegistry.make_write_keys_zset_key(
+                    thread_id, checkpoint_ns, checkpoint_id
+                )
+
+                channels = write_channels.get(checkpoint, set())
+                pending_interrupt = INTERRUPT in channels and RESUME not in channels
+
+                if i < self.keep_last or pending_interrupt:
+                    if i >= self.keep_last:
+                        plan.preserved_interrupts += 1
+                    plan.keep_keys.append(checkpoint_key)
+                    plan.keep_keys.append(zset_key)
+                    plan.keep_keys.extend(write_keys.get(checkpoint, []))
+                else:
+                    plan.delete_checkpoints.append(checkpoint_key)
+                    plan.delete_checkpoints.append(zset_key)
+                    plan.delete_writes.extend(write_keys.get(checkpoint, []))
+
+        # 보존 대상 checkpoint가 없는 write (checkpoint만 만료 / 삭제된 경우)
+        for checkpoint, keys in write_keys.items():
+            if checkpoint not in existing:
+                plan.orphan_writes += len(keys)
+                plan.delete_writes.extend(keys)
+
+        if plan.checkpoints:
+            plan.keep_keys.extend(
+                saver._latest_pointer_key(thread_id, checkpoint_ns)
+                for checkpoint_ns in by_namespace
+            )
+
+        return plan
+
+    async def _apply(self, plan: _ThreadPlan) -> int:
+        reclaimed = await self._unlink(plan.delete_checkpoints + plan.delete_writes)
+
+        # registry(zset) 키도 함께 세므로 checkpoint 수는 절반
+        self.deleted_checkpoints += len(plan.delete_checkpoints) // 2
+        self.deleted_writes += len(plan.delete_writes)
+        self.orphan_writes += plan.orphan_writes
+        self.preserved_interrupts += plan.preserved_interrupts
+
+        if self.ttl_seconds and plan.keep_keys:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in plan.keep_keys:
+                    pipe.expire(key, self.ttl_seconds, nx=True)
+                results = await pipe.execute()
+            self.expire_set += sum(1 for r in results if r)
+
+        return reclaimed
+
+    async def _unlink(self, keys: list[str]) -> int:
+        """키 삭제 후 회수한 메모리(MEMORY USAGE 합) 반환. MEMORY 명령을 막아둔 환경은 0으로 집계"""
+        if not keys:
+            return 0
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.memory_usage(key)
+            pipe.unlink(*keys)
+            results = await pipe.execute(raise_on_error=False)
+
+        if isinstance(results[-1], Exception):
+            raise results[-1]
+        return sum(size for size in results[:-1] if isinstance(size, int))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "keep_last": self.keep_last,
+            "interval_seconds": self.interval_seconds,
+            "ttl_seconds": self.ttl_seconds,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_run_at": self.last_run_at,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_threads": self.last_threads,
+            "last_checkpoints": self.last_checkpoints,
+            "last_reclaimed_bytes": self.last_reclaimed_bytes,
+            "reclaimed_bytes": self.reclaimed_bytes,
+            "deleted_checkpoints": self.deleted_checkpoints,
+            "deleted_writes": self.deleted_writes,
+            "orphan_writes": self.orphan_writes,
+            "orphan_pointers": self.orphan_pointers,
+            "preserved_interrupts": self.preserved_interrupts,
+            "expire_set": self.expire_set,
+        }
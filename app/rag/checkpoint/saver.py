@@ -0,0 +1,461 @@
+import logging
+from typing import Any, AsyncIterator, Optional
+
+import orjson
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.redis.aio import AsyncRedisSaver
+from langgraph.checkpoint.redis.key_registry import CheckpointKeyRegistry
+from langgraph.checkpoint.redis.util import to_storage_safe_id, to_storage_safe_str
+
+from app.rag.checkpoint.blob import BlobRef, CheckpointBlobStore, make_digest
+from app.rag.checkpoint.hot_cache import HotCheckpointCache
+from app.rag.checkpoint.serde import CompactSerializer, is_compact
+from app.rag.checkpoint.write_behind import WriteBehindQueue
+from app.rag.models.retrieve import (
+    BaseSearchResult,
+    CodeSearchResult,
+    IssueSearchResult,
+    JiraIssueSearchResult,
+    PullRequestSearchResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# BlobRef.type -> 복원할 문서 클래스
+_DOC_TYPES: dict[str, type[BaseSearchResult]] = {
+    cls.__name__: cls
+    for cls in (
+        BaseSearchResult,
+        CodeSearchResult,
+        PullRequestSearchResult,
+        IssueSearchResult,
+        JiraIssueSearchResult,
+    )
+}
+
+# hydrate 중 blob이 만료된 문서 표시
+_MISSING = object()
+
+
+class CatchUpRedisSaver(AsyncRedisSaver):
+    """
+    checkpoint 경량화를 적용한 AsyncRedisSaver.
+
+    retrieved_docs / candidate_pool 등에 들어있는 큰 검색 결과(PR 본문, 커밋 메시지, diff)는
+    CheckpointBlobStore에 한 번만 저장하고 checkpoint / pending write에는 BlobRef만 남긴다.
+    참조는 checkpoint를 읽는 시점(aget_tuple / alist)에 원래 문서로 복원한다.
+
+    compact_serde가 켜져 있으면 channel value / pending write를 CompactSerializer로 인코딩한다.
+    checkpoint 문서는 RedisJSON이므로 channel value는 {"__bytes__": base64} 형태로 저장된다.
+
+    write_behind가 켜져 있으면 저장은 WriteBehindQueue를 거쳐 비동기로 수행하고,
+    조회(aget_tuple / alist) 전에 해당 thread의 대기 중인 저장을 먼저 flush한다.
+
+    hot_cache_max_bytes > 0이면 thread별 최신 checkpoint를 HotCheckpointCache에 보관하고,
+    aget_tuple은 checkpoint_latest 포인터와 write 개수만 Redis에서 확인해 일치하면 캐시로 응답한다.
+    (다른 worker가 새 checkpoint / write를 저장했다면 불일치로 Redis에서 다시 읽음)
+    """
+
+    def __init__(
+        self,
+        *,
+        blob_store: CheckpointBlobStore,
+        blob_min_bytes: int = 2048,
+        offload_enabled: bool = True,
+        compact_serde: bool = False,
+        compress_min_bytes: int = 4096,
+        zstd_level: int = 3,
+        write_behind: bool = False,
+        write_behind_max_delay_seconds: float = 0.05,
+        hot_cache_max_bytes: int = 0,
+        hot_cache_ttl_seconds: float = 300,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.blob_store = blob_store
+        self.blob_min_bytes = blob_min_bytes
+        # 비활성화해도 기존 checkpoint의 참조 복원은 계속 수행
+        self.offload_enabled = offload_enabled
+
+        # 비활성화해도 compact 포맷 checkpoint는 읽을 수 있도록 항상 감싸고, 인코딩만 on/off
+        self.compact_serde = compact_serde
+        self.serde = CompactSerializer(
+            self.serde,
+            compress_min_bytes=compress_min_bytes,
+            zstd_level=zstd_level,
+            enabled=compact_serde,
+        )
+
+        self.write_behind = (
+            WriteBehindQueue(
+                put=self._aput_now,
+                put_writes=self._aput_writes_now,
+                max_delay_seconds=write_behind_max_delay_seconds,
+            )
+            if write_behind
+            else None
+        )
+
+        self.hot_cache = (
+            HotCheckpointCache(
+                # 메모리 예산을 아끼도록 compact_serde 설정과 무관하게 compact 포맷으로 보관
+                CompactSerializer(
+                    self.serde.inner,
+                    compress_min_bytes=compress_min_bytes,
+                    zstd_level=zstd_level,
+                ),
+                max_bytes=hot_cache_max_bytes,
+                ttl_seconds=hot_cache_ttl_seconds,
+            )
+            if hot_cache_max_bytes > 0
+            else None
+        )
+
+        # 통계
+        self.checkpoints = 0
+        self.checkpoint_bytes = 0
+        self.max_checkpoint_bytes = 0
+        self.last_checkpoint_bytes = 0
+        self.offloaded_docs = 0
+        self.offloaded_bytes = 0
+        self.offload_failures = 0
+        self.hydrated_docs = 0
+        self.missing_docs = 0
+
+    # 저장
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+        stream_mode: str = "values",
+    ) -> RunnableConfig:
+        if self.write_behind is not None:
+            return self.write_behind.put(config, checkpoint, metadata, new_versions)
+        return await self._aput_now(config, checkpoint, metadata, new_versions, stream_mode)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: list[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        if self.write_behind is not None:
+            self.write_behind.put_writes(config, writes, task_id, task_path)
+            return
+        await self._aput_writes_now(config, writes, task_id, task_path)
+
+    async def flush(self, thread_id: Optional[str] = None) -> None:
+        """write-behind 큐에 남은 저장을 완료 (interrupt 응답 전 / 종료 시 호출)"""
+        if self.write_behind is not None:
+            await self.write_behind.flush(thread_id)
+
+    async def aclose(self) -> None:
+        if self.write_behind is not None:
+            await self.write_behind.aclose()
+
+    async def _aput_now(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+        stream_mode: str = "values",
+    ) -> RunnableConfig:
+        stored = checkpoint
+        if self.offload_enabled:
+            stored = {
+                **checkpoint,
+                "channel_values": await self._offload(checkpoint["channel_values"]),
+            }
+
+        next_config = await super().aput(config, stored, metadata, new_versions, stream_mode)
+
+        if self.hot_cache is not None and not config["configurable"].get("checkpoint_ns"):
+            self.hot_cache.put(config, checkpoint, metadata)
+
+        return next_config
+
+    async def _aput_writes_now(
+        self,
+        config: RunnableConfig,
+        writes: list[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        stored = writes
+        if self.offload_enabled and writes:
+            stored = await self._offload(list(writes))
+
+        await super().aput_writes(config, stored, task_id, task_path)
+
+        if self.hot_cache is not None and not config["configurable"].get("checkpoint_ns"):
+            self.hot_cache.put_writes(config, writes, task_id)
+
+    def _dump_checkpoint(self, checkpoint: Checkpoint) -> dict[str, Any]:
+        if self.compact_serde:
+            dumped = self._dump_compact_checkpoint(checkpoint)
+        else:
+            dumped = super()._dump_checkpoint(checkpoint)
+
+        # Redis에 저장되는 checkpoint JSON 크기 (경량화 전후 비교용)
+        size = len(orjson.dumps(dumped))
+        self.checkpoints += 1
+        self.checkpoint_bytes += size
+        self.last_checkpoint_bytes = size
+        self.max_checkpoint_bytes = max(self.max_checkpoint_bytes, size)
+
+        return dumped
+
+    def _dump_compact_checkpoint(self, checkpoint: Checkpoint) -> dict[str, Any]:
+        channel_values = {}
+        for channel, value in checkpoint.get("channel_values", {}).items():
+            # 작은 scalar 값은 JSON 그대로 유지
+            data = (
+                None
+                if value is None or isinstance(value, (str, int, float, bool))
+                else self.serde.encode(value)
+            )
+            channel_values[channel] = (
+                value if data is None else {"__bytes__": self._encode_blob(data)}
+            )
+
+        dumped = super()._dump_checkpoint({**checkpoint, "channel_values": {}})
+        dumped["channel_values"] = channel_values
+        return dumped
+
+    # metadata는 RedisJSON 필드 / 검색 필터로 쓰이므로 JSON serializer 유지
+    def _dump_metadata(self, metadata: CheckpointMetadata) -> str:
+        _, data = self.serde.inner.dumps_typed(metadata)
+        return data.decode().replace("\\u0000", "")
+
+    def _load_metadata(self, metadata: dict[str, Any]) -> CheckpointMetadata:
+        return self.serde.inner.loads_typed(self.serde.inner.dumps_typed(metadata))
+
+    def _doc_payload(self, doc: BaseSearchResult) -> bytes:
+        if self.compact_serde:
+            payload = self.serde.encode(doc)
+            if payload is not None:
+                return payload
+        return doc.model_dump_json().encode("utf-8")
+
+    async def _offload(self, value: Any) -> Any:
+        """큰 문서를 blob store로 옮기고 BlobRef로 치환한 값을 반환"""
+        payloads: dict[str, bytes] = {}
+
+        def replace(item: Any) -> Any:
+            if isinstance(item, BaseSearchResult) and type(item).__name__ in _DOC_TYPES:
+                payload = self._doc_payload(item)
+                if len(payload) < self.blob_min_bytes:
+                    return item
+                digest = make_digest(payload)
+                payloads[digest] = payload
+                return BlobRef(digest=digest, type=type(item).__name__, size=len(payload))
+            if isinstance(item, list):
+                return [replace(v) for v in item]
+            if isinstance(item, tuple):
+                return tuple(replace(v) for v in item)
+            if isinstance(item, dict):
+                return {k: replace(v) for k, v in item.items()}
+            return item
+
+        replaced = replace(value)
+        if not payloads:
+            return value
+
+        try:
+            await self.blob_store.put_many(payloads)
+        except Exception as e:
+            # blob 저장 실패 시 원본을 그대로 checkpoint에 저장
+            self.offload_failures += 1
+            logger.warning(f"Checkpoint 문서 분리 저장 실패, 원본 유지: {e}")
+            return value
+
+        self.offloaded_docs += len(payloads)
+        self.offloaded_bytes += sum(len(p) for p in payloads.values())
+        return replaced
+
+    # 조회
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        await self.flush(thread_id)
+
+        use_hot_cache = self.hot_cache is not None and not config["configurable"].get(
+            "checkpoint_ns"
+        )
+        if use_hot_cache:
+            checkpoint_tuple = await self._get_hot(thread_id, get_checkpoint_id(config))
+            if checkpoint_tuple is not None:
+                return checkpoint_tuple
+
+        checkpoint_tuple = await super().aget_tuple(config)
+        if checkpoint_tuple is None:
+            return None
+        checkpoint_tuple = await self._hydrate_tuple(checkpoint_tuple)
+
+        # 최신 checkpoint 조회 결과만 캐싱
+        if use_hot_cache and not get_checkpoint_id(config):
+            self.hot_cache.put_tuple(checkpoint_tuple)
+
+        return checkpoint_tuple
+
+    async def _get_hot(
+        self, thread_id: str, checkpoint_id: Optional[str]
+    ) -> Optional[CheckpointTuple]:
+        """캐시된 checkpoint가 Redis의 최신 상태와 같을 때만 반환 (Redis 조회 1회)"""
+        entry = self.hot_cache.get(thread_id)
+        if entry is None or (checkpoint_id and checkpoint_id != entry.checkpoint_id):
+            return None
+
+        # AsyncRedisSaver.aget_tuple과 같은 checkpoint_latest 포인터 / write key registry 사용
+        checkpoint_key = self._make_redis_checkpoint_key_cached(
+            thread_id, "", entry.checkpoint_id
+        )
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(self._latest_pointer_key(thread_id))
+            if self._key_registry is not None:
+                pipe.zcard(
+                    CheckpointKeyRegistry.make_write_keys_zset_key(
+                        thread_id, "", entry.checkpoint_id
+                    )
+                )
+            results = await pipe.execute()
+
+        latest = results[0].decode() if isinstance(results[0], bytes) else results[0]
+        write_count = results[1] if len(results) > 1 else len(entry.writes)
+        if latest != checkpoint_key or write_count != len(entry.writes):
+            self.hot_cache.invalidate(thread_id, stale=True)
+            return None
+
+        return self.hot_cache.load(thread_id, entry)
+
+    @staticmethod
+    def _latest_pointer_key(thread_id: str, checkpoint_ns: str = "") -> str:
+        return (
+            f"checkpoint_latest:{to_storage_safe_id(thread_id)}:"
+            f"{to_storage_safe_str(checkpoint_ns)}"
+        )
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        await self.flush((config or {}).get("configurable", {}).get("thread_id"))
+
+        async for checkpoint_tuple in super().alist(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield await self._hydrate_tuple(checkpoint_tuple)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        if self.write_behind is not None:
+            # 대기 중인 저장은 버리고, 이미 저장 중인 것은 완료를 기다린 뒤 삭제
+            self.write_behind.discard(thread_id)
+            await self.write_behind.flush(thread_id)
+        if self.hot_cache is not None:
+            self.hot_cache.invalidate(thread_id)
+        await super().adelete_thread(thread_id)
+
+    async def _hydrate_tuple(self, checkpoint_tuple: CheckpointTuple) -> CheckpointTuple:
+        checkpoint = checkpoint_tuple.checkpoint
+        channel_values = checkpoint.get("channel_values", {})
+
+        # compact 포맷 channel value 복원
+        if any(is_compact(v) for v in channel_values.values()):
+            channel_values = {
+                k: self.serde.decode(v) if is_compact(v) else v
+                for k, v in channel_values.items()
+            }
+
+        channel_values, pending_writes = await self._hydrate(
+            (channel_values, checkpoint_tuple.pending_writes or [])
+        )
+
+        return checkpoint_tuple._replace(
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            pending_writes=pending_writes,
+        )
+
+    async def _hydrate(self, value: Any) -> Any:
+        """BlobRef를 원래 문서로 복원. blob이 만료된 문서는 목록에서 제외한다."""
+        digests: set[str] = set()
+
+        def collect(item: Any) -> None:
+            if isinstance(item, BlobRef):
+                digests.add(item.digest)
+            elif isinstance(item, (list, tuple)):
+                for v in item:
+                    collect(v)
+            elif isinstance(item, dict):
+                for v in item.values():
+                    collect(v)
+
+        collect(value)
+        if not digests:
+            return value
+
+        payloads = await self.blob_store.get_many(list(digests))
+
+        def restore(item: Any) -> Any:
+            if isinstance(item, BlobRef):
+                payload = payloads.get(item.digest)
+                doc_type = _DOC_TYPES.get(item.type)
+                if payload is None or doc_type is None:
+                    self.missing_docs += 1
+                    return _MISSING
+                self.hydrated_docs += 1
+                if is_compact(payload):
+                    return self.serde.decode(payload)
+                return doc_type.model_validate_json(payload)
+            if isinstance(item, list):
+                return [r for v in item if (r := restore(v)) is not _MISSING]
+            if isinstance(item, tuple):
+                return tuple(restore(v) for v in item)
+            if isinstance(item, dict):
+                return {k: restore(v) for k, v in item.items()}
+            return item
+
+        missing_before = self.missing_docs
+        restored = restore(value)
+        if self.missing_docs > missing_before:
+            logger.warning(
+                f"만료된 checkpoint 문서 {self.missing_docs - missing_before}건 제외"
+            )
+
+        return restored
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "offload_enabled": self.offload_enabled,
+            "blob_min_bytes": self.blob_min_bytes,
+            "checkpoints": self.checkpoints,
+            "avg_checkpoint_bytes": (
+                self.checkpoint_bytes // self.checkpoints if self.checkpoints else 0
+            ),
+            "last_checkpoint_bytes": self.last_checkpoint_bytes,
+            "max_checkpoint_bytes": self.max_checkpoint_bytes,
+            "offloaded_docs": self.offloaded_docs,
+            "offloaded_bytes": self.offloaded_bytes,
+            "offload_failures": self.offload_failures,
+            "hydrated_docs": self.hydrated_docs,
+            "missing_docs": self.missing_docs,
+            "blob_store": self.blob_store.stats(),
+            "serde": self.serde.stats(),
+            "write_behind": self.write_behind.stats() if self.write_behind is not None else None,
+            "hot_cache": self.hot_cache.stats() if self.hot_cache is not None else None,
+        }
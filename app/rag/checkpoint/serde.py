@@ -0,0 +1,241 @@
+import logging
+from functools import cache
+from typing import Any, Callable, Optional
+
+import ormsgpack
+import zstandard
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from app.rag.checkpoint.blob import BlobRef
+from app.rag.models.dto import CodeSource, JiraSource, PullRequestSource
+from app.rag.models.plan import SearchQuery
+from app.rag.models.pr_base import PRComment, PRFileContext
+from app.rag.models.retrieve import (
+    BaseSearchResult,
+    CodeSearchResult,
+    IssueSearchResult,
+    JiraIssueSearchResult,
+    PullRequestSearchResult,
+    SourceType,
+)
+
+logger = logging.getLogger(__name__)
+
+# 직렬화 결과 식별자 (checkpoint channel value / pending write 공통)
+COMPACT_TYPE = "compact"
+_MAGIC = b"CUc"
+_RAW = 0
+_ZSTD = 1
+
+# msgpack ext type tag -> 클래스. 태그 번호는 저장 포맷이므로 변경 / 재사용 금지
+_MODEL_TAGS: dict[int, type[BaseModel]] = {
+    1: BaseSearchResult,
+    2: CodeSearchResult,
+    3: PullRequestSearchResult,
+    4: IssueSearchResult,
+    5: JiraIssueSearchResult,
+    10: CodeSource,
+    11: PullRequestSource,
+    12: JiraSource,
+    20: SearchQuery,
+    21: PRFileContext,
+    22: PRComment,
+    30: BlobRef,
+}
+_MESSAGE_TAGS: dict[int, type[BaseModel]] = {
+    40: HumanMessage,
+    41: AIMessage,
+    42: SystemMessage,
+    43: ToolMessage,
+}
+_TAG_TUPLE = 100
+_TAG_SET = 101
+_TAG_SOURCE_TYPE = 102
+
+_TYPE_TAGS = {cls: tag for tag, cls in (_MODEL_TAGS | _MESSAGE_TAGS).items()}
+
+# tuple / dataclass / enum / datetime 등은 default로 넘겨 타입을 보존하거나 fallback 처리
+_PACK_OPTIONS = (
+    ormsgpack.OPT_NON_STR_KEYS
+    | ormsgpack.OPT_PASSTHROUGH_TUPLE
+    | ormsgpack.OPT_PASSTHROUGH_DATACLASS
+    | ormsgpack.OPT_PASSTHROUGH_DATETIME
+    | ormsgpack.OPT_PASSTHROUGH_UUID
+    | ormsgpack.OPT_PASSTHROUGH_ENUM
+    | ormsgpack.OPT_PASSTHROUGH_SUBCLASS
+)
+
+
+class UnsupportedType(TypeError):
+    pass
+
+
+@cache
+def _field_defaults(cls: type[BaseModel]) -> list[tuple[str, Any, Optional[Callable[[], Any]]]]:
+    """(필드 이름, 기본값, default_factory) 목록. 기본값과 같은 필드는 인코딩에서 생략"""
+    return [
+        (name, field.get_default(call_default_factory=True), field.default_factory)
+        for name, field in cls.model_fields.items()
+    ]
+
+
+def _model_fields(obj: BaseModel) -> dict[str, Any]:
+    fields = {}
+    for name, default, _ in _field_defaults(type(obj)):
+        value = getattr(obj, name)
+        if default is PydanticUndefined or value != default:
+            fields[name] = value
+
+    if obj.__pydantic_extra__:
+        fields.update(obj.__pydantic_extra__)
+
+    return fields
+
+
+def _default(obj: Any) -> ormsgpack.Ext:
+    tag = _TYPE_TAGS.get(type(obj))
+    if tag is not None:
+        return ormsgpack.Ext(tag, _pack(_model_fields(obj)))
+    if type(obj) is SourceType:
+        return ormsgpack.Ext(_TAG_SOURCE_TYPE, _pack(int(obj)))
+    if type(obj) is tuple:
+        return ormsgpack.Ext(_TAG_TUPLE, _pack(list(obj)))
+    if type(obj) in (set, frozenset):
+        return ormsgpack.Ext(_TAG_SET, _pack(list(obj)))
+    raise UnsupportedType(f"{type(obj).__qualname__}")
+
+
+def _construct(cls: type[BaseModel], values: dict[str, Any]) -> BaseModel:
+    """직접 인코딩한 값이므로 검증 없이 생성. 생략된 필드는 기본값으로 채움
+    (model_construct의 기본값 계산은 default_factory마다 signature를 검사해 느림)"""
+    fields_set = set(values)
+    for name, default, factory in _field_defaults(cls):
+        if name not in values:
+            values[name] = factory() if factory is not None else default
+    return cls.model_construct(fields_set, **values)
+
+
+def _ext_hook(tag: int, data: bytes) -> Any:
+    value = _unpack(data)
+
+    if tag in _MODEL_TAGS:
+        return _construct(_MODEL_TAGS[tag], value)
+    if tag in _MESSAGE_TAGS:
+        return _MESSAGE_TAGS[tag].model_validate(value)
+    if tag == _TAG_SOURCE_TYPE:
+        return SourceType(value)
+    if tag == _TAG_TUPLE:
+        return tuple(value)
+    if tag == _TAG_SET:
+        return set(value)
+    raise ValueError(f"Unknown compact ext tag: {tag}")
+
+
+def _pack(value: Any) -> bytes:
+    return ormsgpack.packb(value, default=_default, option=_PACK_OPTIONS)
+
+
+def _unpack(data: bytes) -> Any:
+    return ormsgpack.unpackb(data, ext_hook=_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+def is_compact(value: Any) -> bool:
+    return isinstance(value, bytes) and value[:3] == _MAGIC
+
+
+class CompactSerializer:
+    """
+    checkpoint 전용 serializer (LangGraph SerializerProtocol).
+
+    - 검색 결과 / 출처 / 검색 계획 / LangChain 메시지 등 알려진 타입은 msgpack ext tag + 필드 값으로 인코딩
+      (기본값과 같은 필드 생략, 클래스 경로 / 중첩 dict 구조를 저장하지 않음)
+    - compress_min_bytes 이상이면 zstd 압축
+    - 알 수 없는 타입이 포함된 값과 기존 checkpoint("json", "msgpack" 등)는 inner serializer가 처리
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        compress_min_bytes: int = 4096,
+        zstd_level: int = 3,
+        enabled: bool = True,
+    ):
+        self.inner = inner
+        # False면 인코딩은 inner에 맡기고 compact 포맷 읽기만 지원
+        self.enabled = enabled
+        self.compress_min_bytes = compress_min_bytes
+        self._compressor = zstandard.ZstdCompressor(level=zstd_level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+        # 통계
+        self.encoded = 0
+        self.compressed = 0
+        self.packed_bytes = 0
+        self.encoded_bytes = 0
+        self.fallbacks = 0
+        self.decoded = 0
+
+    def encode(self, obj: Any) -> Optional[bytes]:
+        """compact 포맷 bytes. 지원하지 않는 타입이 포함되어 있으면 None"""
+        try:
+            packed = _pack(obj)
+        except (UnsupportedType, ormsgpack.MsgpackEncodeError) as e:
+            self.fallbacks += 1
+            logger.debug(f"Compact 직렬화 불가, 기본 serializer 사용: {e}")
+            return None
+
+        if len(packed) >= self.compress_min_bytes:
+            data = _MAGIC + bytes([_ZSTD]) + self._compressor.compress(packed)
+            self.compressed += 1
+        else:
+            data = _MAGIC + bytes([_RAW]) + packed
+
+        self.encoded += 1
+        self.packed_bytes += len(packed)
+        self.encoded_bytes += len(data)
+        return data
+
+    def decode(self, data: bytes) -> Any:
+        if not is_compact(data):
+            raise ValueError("Not a compact payload")
+
+        payload = data[4:]
+        if data[3] == _ZSTD:
+            payload = self._decompressor.decompress(payload)
+
+        self.decoded += 1
+        return _unpack(payload)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        if not self.enabled or obj is None or isinstance(obj, (bytes, bytearray)):
+            return self.inner.dumps_typed(obj)
+
+        data = self.encode(obj)
+        if data is None:
+            return self.inner.dumps_typed(obj)
+        return COMPACT_TYPE, data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_ == COMPACT_TYPE:
+            return self.decode(payload)
+        return self.inner.loads_typed(data)
+
+    def _revive_if_needed(self, obj: Any) -> Any:
+        # 기존 JSON checkpoint의 LangChain constructor 포맷 복원 (AsyncRedisSaver가 직접 호출)
+        return self.inner._revive_if_needed(obj)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "encoded": self.encoded,
+            "compressed": self.compressed,
+            "fallbacks": self.fallbacks,
+            "decoded": self.decoded,
+            "compression_ratio": (
+                round(self.encoded_bytes / self.packed_bytes, 4) if self.packed_bytes else None
+            ),
+            "encoded_bytes": self.encoded_bytes,
+        }
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+logger = logging.getLogger(__name__)
+
+# (thread_id, checkpoint_ns)
+_Key = tuple[str, str]
+
+
+@dataclass
+class _PendingWrites:
+    config: RunnableConfig
+    writes: list[tuple[str, Any]]
+    task_id: str
+    task_path: str
+
+    @property
+    def checkpoint_id(self) -> Optional[str]:
+        return self.config["configurable"].get("checkpoint_id")
+
+
+@dataclass
+class _PendingThread:
+    # 큐에 남아있는 가장 최신 checkpoint (aput 인자)
+    checkpoint: Optional[tuple[RunnableConfig, Any, Any, Any]] = None
+    writes: list[_PendingWrites] = field(default_factory=list)
+
+
+class WriteBehindQueue:
+    """
+    thread 단위 checkpoint write-behind 큐.
+
+    - aput / aput_writes는 큐에만 넣고 바로 반환, max_delay_seconds 이내에 한 번에 Redis로 저장
+    - 아직 저장되지 않은 checkpoint가 새 checkpoint로 대체되면 최신 것만 저장 (중간 checkpoint와 그 write 생략)
+    - 같은 thread의 flush는 순서대로 실행. 조회 전 / interrupt 응답 전에는 호출자가 flush(thread_id)로 저장을 보장
+    - 저장 실패 시 큐에 되돌려 다음 flush에서 재시도 (연속 실패 시 재시도 간격을 늘림)
+    """
+
+    # 연속 저장 실패 시 최대 재시도 간격
+    MAX_RETRY_DELAY_SECONDS = 5.0
+
+    def __init__(
+        self,
+        put: Callable[..., Awaitable[RunnableConfig]],
+        put_writes: Callable[..., Awaitable[None]],
+        max_delay_seconds: float = 0.05,
+    ):
+        self._put = put
+        self._put_writes = put_writes
+        self.max_delay_seconds = max_delay_seconds
+
+        self._pending: dict[_Key, _PendingThread] = {}
+        self._locks: defaultdict[_Key, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._timer: Optional[asyncio.Task] = None
+
+        # 통계
+        self.checkpoints = 0
+        self.coalesced_checkpoints = 0
+        self.writes = 0
+        self.dropped_writes = 0
+        self.flushes = 0
+        self.flush_failures = 0
+        self.requeued = 0
+
+    @staticmethod
+    def _key(config: RunnableConfig) -> _Key:
+        configurable = config["configurable"]
+        return configurable["thread_id"], configurable.get("checkpoint_ns", "")
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Any,
+        metadata: Any,
+        new_versions: Any,
+    ) -> RunnableConfig:
+        key = self._key(config)
+        pending = self._pending.setdefault(key, _PendingThread())
+
+        if pending.checkpoint is not None:
+            # 저장 전에 대체된 checkpoint: parent는 이미 저장된 checkpoint를 가리키도록 첫 config 유지
+            first_config, replaced, _, _ = pending.checkpoint
+            config = first_config
+
+            before = len(pending.writes)
+            pending.writes = [w for w in pending.writes if w.checkpoint_id != replaced["id"]]
+            self.dropped_writes += before - len(pending.writes)
+            self.coalesced_checkpoints += 1
+
+        pending.checkpoint = (config, checkpoint, metadata, new_versions)
+        self.checkpoints += 1
+        self._schedule()
+
+        thread_id, checkpoint_ns = key
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: list[tuple[str, Any]],
+        task_id: str,
+        task_path: str,
+    ) -> None:
+        pending = self._pending.setdefault(self._key(config), _PendingThread())
+        pending.writes.append(_PendingWrites(config, list(writes), task_id, task_path))
+        self.writes += 1
+        self._schedule()
+
+    def discard(self, thread_id: str) -> None:
+        for key in [k for k in self._pending if k[0] == thread_id]:
+            del self._pending[key]
+
+    def _schedule(self) -> None:
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        delay = self.max_delay_seconds
+        while self._pending:
+            await asyncio.sleep(delay)
+            try:
+                await self.flush()
+                delay = self.max_delay_seconds
+            except Exception as e:
+                logger.warning(f"Checkpoint write-behind 저장 실패 (재시도 예정): {e}")
+                delay = min(delay * 2, self.MAX_RETRY_DELAY_SECONDS)
+
+    async def flush(self, thread_id: Optional[str] = None) -> None:
+        """대기 중인 checkpoint 저장 (thread_id 미지정 시 전체). 저장 실패는 호출자에게 전달"""
+        # 이미 저장 중인(lock을 잡은) thread도 완료될 때까지 대기
+        keys = [
+            k
+            for k in self._pending.keys() | self._locks.keys()
+            if thread_id is None or k[0] == thread_id
+        ]
+        if not keys:
+            return
+
+        results = await asyncio.gather(
+            *(self._flush_key(key) for key in keys), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            raise errors[0]
+
+    async def _flush_key(self, key: _Key) -> None:
+        try:
+            async with self._locks[key]:
+                pending = self._pending.pop(key, None)
+                if pending is not None:
+                    try:
+                        await self._write(pending)
+                    except Exception:
+                        self._requeue(key, pending)
+                        raise
+        finally:
+            self._release_lock(key)
+
+    async def _write(self, pending: _PendingThread) -> None:
+        try:
+            # checkpoint를 먼저 저장해야 write가 해당 checkpoint에 연결됨
+            if pending.checkpoint is not None:
+                await self._put(*pending.checkpoint)
+            await asyncio.gather(
+                *(
+                    self._put_writes(w.config, w.writes, w.task_id, w.task_path)
+                    for w in pending.writes
+                )
+            )
+            self.flushes += 1
+        except Exception:
+            self.flush_failures += 1
+            raise
+
+    def _requeue(self, key: _Key, failed: _PendingThread) -> None:
+        """저장에 실패한 항목을 큐에 되돌림. 저장 중에 들어온 더 최신 항목과 병합"""
+        self.requeued += 1
+        newer = self._pending.get(key)
+        if newer is None:
+            self._pending[key] = failed
+        elif newer.checkpoint is None or failed.checkpoint is None:
+            newer.checkpoint = newer.checkpoint or failed.checkpoint
+            newer.writes = failed.writes + newer.writes
+        else:
+            # 최신 checkpoint가 실패한 checkpoint를 대체 (put과 동일하게 parent는 첫 config 유지)
+            first_config, replaced, _, _ = failed.checkpoint
+            newer.checkpoint = (first_config, *newer.checkpoint[1:])
+
+            writes = failed.writes + newer.writes
+            newer.writes = [w for w in writes if w.checkpoint_id != replaced["id"]]
+            self.dropped_writes += len(writes) - len(newer.writes)
+            self.coalesced_checkpoints += 1
+
+        self._schedule()
+
+    def _release_lock(self, key: _Key) -> None:
+        # 대기 중인 flush가 없으면 lock 제거 (세션 수만큼 lock이 쌓이지 않도록)
+        lock = self._locks.get(key)
+        if (
+            lock is not None
+            and key not in self._pending
+            and not lock.locked()
+            and not getattr(lock, "_waiters", None)
+        ):
+            del self._locks[key]
+
+    async def aclose(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            try:
+                await self._timer
+            except asyncio.CancelledError:
+                pass
+            self._timer = None
+
+        await self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_delay_seconds": self.max_delay_seconds,
+            "pending_threads": len(self._pending),
+            "checkpoints": self.checkpoints,
+            "coalesced_checkpoints": self.coalesced_checkpoints,
+            "writes": self.writes,
+            "dropped_writes": self.dropped_writes,
+            "flushes": self.flushes,
+            "flush_failures": self.flush_failures,
+            "requeued": self.requeued,
+        }
@@ -1,25 +1,281 @@
 from functools import lru_cache
 
+from redis.asyncio import Redis
+
+from app.core.clients import ClientRegistry
+from app.core.config import VectorBackendType, settings
+from app.observability.metrics import register_stats
+from app.rag.cache.answer import AnswerCache
+from app.rag.cache.embedding import EmbeddingCache
+from app.rag.cache.pr_context import PrContextCache
+from app.rag.cache.rerank import RerankScoreCache
+from app.rag.cache.store import RedisCacheStore
+from app.rag.checkpoint.blob import CheckpointBlobStore
+from app.rag.checkpoint.retention import CheckpointCompactor
+from app.rag.checkpoint.saver import CatchUpRedisSaver
+from app.rag.repository.local_hybrid import LocalHybridRepository
 from app.rag.repository.meili import LangChainMeiliRepository
+from app.rag.service.budget import RetrievalBudgetAllocator
+from app.rag.service.context import ContextPacker
+from app.rag.service.diff import DiffCondenser
 from app.rag.service.github import GithubService
+from app.rag.service.intent import LocalIntentRouter
 from app.rag.service.llm import LlmService
-from app.rag.service.rerank import RerankService
+from app.rag.service.rerank import RerankService, create_rerank_backend
+from app.rag.service.retrieval import RetrievalCoordinator
+from app.rag.service.speculative import SpeculativeRetriever
+from app.rag.service.summary import ConversationSummarizer
+
+
+@lru_cache(maxsize=1)
+def get_client_registry() -> ClientRegistry:
+    registry = ClientRegistry()
+    register_stats("clients", registry.stats)
+
+    return registry
+
+
+def get_redis_client() -> Redis:
+    return get_client_registry().redis
+
+
+@lru_cache(maxsize=1)
+def get_checkpointer() -> CatchUpRedisSaver:
+    blob_store = CheckpointBlobStore(
+        client=get_redis_client(),
+        ttl_seconds=settings.CHECKPOINT_BLOB_TTL_SECONDS,
+        memory_max_bytes=settings.CHECKPOINT_BLOB_CACHE_MAX_BYTES,
+        refresh_on_read=settings.CHECKPOINT_TTL_REFRESH_ON_READ,
+    )
+
+    checkpointer = CatchUpRedisSaver(
+        redis_client=get_redis_client(),
+        ttl=(
+            {
+                "default_ttl": settings.CHECKPOINT_TTL_SECONDS / 60,  # 분 단위
+                "refresh_on_read": settings.CHECKPOINT_TTL_REFRESH_ON_READ,
+            }
+            if settings.CHECKPOINT_TTL_SECONDS > 0
+            else None
+        ),
+        blob_store=blob_store,
+        blob_min_bytes=settings.CHECKPOINT_BLOB_MIN_BYTES,
+        offload_enabled=settings.CHECKPOINT_OFFLOAD_ENABLED,
+        compact_serde=settings.CHECKPOINT_COMPACT_SERDE_ENABLED,
+        compress_min_bytes=settings.CHECKPOINT_COMPRESS_MIN_BYTES,
+        zstd_level=settings.CHECKPOINT_ZSTD_LEVEL,
+        write_behind=settings.CHECKPOINT_WRITE_BEHIND_ENABLED,
+        write_behind_max_delay_seconds=settings.CHECKPOINT_WRITE_BEHIND_MAX_DELAY_SECONDS,
+        hot_cache_max_bytes=(
+            settings.CHECKPOINT_HOT_CACHE_MAX_BYTES if settings.CHECKPOINT_HOT_CACHE_ENABLED else 0
+        ),
+        hot_cache_ttl_seconds=settings.CHECKPOINT_HOT_CACHE_TTL_SECONDS,
+    )
+    register_stats("checkpoint", checkpointer.stats)
+
+    return checkpointer
+
+
+@lru_cache(maxsize=1)
+def get_checkpoint_compactor() -> CheckpointCompactor:
+    compactor = CheckpointCompactor(
+        get_checkpointer(),
+        keep_last=settings.CHECKPOINT_KEEP_LAST,
+        interval_seconds=settings.CHECKPOINT_COMPACTION_INTERVAL_SECONDS,
+        ttl_seconds=settings.CHECKPOINT_TTL_SECONDS or None,
+    )
+    register_stats("checkpoint_compaction", compactor.stats)
+
+    return compactor
+
+
+@lru_cache(maxsize=1)
+def get_embedding_cache() -> EmbeddingCache:
+    redis_store = None
+    if settings.EMBEDDING_CACHE_REDIS_ENABLED:
+        redis_store = RedisCacheStore(
+            client=get_redis_client(),
+            namespace="cache:embedding",
+            ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS,
+        )
+
+    cache = EmbeddingCache(
+        max_bytes=settings.EMBEDDING_CACHE_MAX_BYTES, redis_store=redis_store
+    )
+    register_stats("embedding_cache", cache.stats)
+
+    return cache
+
+
+@lru_cache(maxsize=1)
+def get_vector_repository() -> LangChainMeiliRepository | LocalHybridRepository:
+    embedding_cache = (
+        get_embedding_cache() if settings.EMBEDDING_CACHE_ENABLED else None
+    )
+
+    if settings.VECTOR_BACKEND == VectorBackendType.local_hybrid:
+        return LocalHybridRepository(
+            embedding_cache=embedding_cache, clients=get_client_registry()
+        )
+
+    return LangChainMeiliRepository(
+        embedding_cache=embedding_cache, clients=get_client_registry()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_retrieval_coordinator() -> RetrievalCoordinator:
+    coordinator = RetrievalCoordinator(
+        repository=get_vector_repository(),
+        max_wait_seconds=settings.RETRIEVAL_BATCH_MAX_WAIT_SECONDS,
+    )
+    register_stats("retrieval_coordinator", coordinator.stats)
+
+    return coordinator
+
+
+@lru_cache(maxsize=1)
+def get_budget_allocator() -> RetrievalBudgetAllocator:
+    allocator = RetrievalBudgetAllocator(
+        document_count_loader=get_vector_repository().get_index_document_counts,
+        redis_client=get_redis_client(),
+        refresh_interval_seconds=settings.RETRIEVAL_BUDGET_REFRESH_SECONDS,
+        prior_strength=settings.RETRIEVAL_BUDGET_PRIOR_STRENGTH,
+    )
+    register_stats("retrieval_budget", allocator.stats)
+
+    return allocator
+
+
+@lru_cache(maxsize=1)
+def get_speculative_retriever() -> SpeculativeRetriever:
+    retriever = SpeculativeRetriever(
+        repository=get_vector_repository(),
+        reuse_similarity=settings.SPECULATIVE_REUSE_SIMILARITY,
+    )
+    register_stats("speculative_retrieval", retriever.stats)
+
+    return retriever
 
 
 @lru_cache(maxsize=1)
-def get_vector_repository() -> LangChainMeiliRepository:
-    return LangChainMeiliRepository()
+def get_answer_cache() -> AnswerCache:
+    cache = AnswerCache(
+        similarity_threshold=settings.ANSWER_CACHE_SIMILARITY_THRESHOLD,
+        max_bytes=settings.ANSWER_CACHE_MAX_BYTES,
+        ttl_seconds=settings.ANSWER_CACHE_TTL_SECONDS,
+        max_entries_per_scope=settings.ANSWER_CACHE_MAX_ENTRIES_PER_SCOPE,
+        index_version_loader=get_vector_repository().get_index_versions,
+        index_version_ttl_seconds=settings.ANSWER_CACHE_INDEX_VERSION_TTL_SECONDS,
+        redis_client=(
+            get_redis_client() if settings.ANSWER_CACHE_REDIS_ENABLED else None
+        ),
+    )
+    register_stats("answer_cache", cache.stats)
+
+    return cache
 
 
 @lru_cache(maxsize=1)
 def get_llm_service() -> LlmService:
-    return LlmService()
+    return LlmService(clients=get_client_registry())
+
+
+@lru_cache(maxsize=1)
+def get_intent_router() -> LocalIntentRouter:
+    router = LocalIntentRouter(
+        confidence_threshold=settings.INTENT_ROUTER_CONFIDENCE_THRESHOLD,
+        shadow_sample_rate=settings.INTENT_ROUTER_SHADOW_SAMPLE_RATE,
+    )
+    register_stats("intent_router", router.stats)
+
+    return router
+
+
+@lru_cache(maxsize=1)
+def get_rerank_score_cache() -> RerankScoreCache:
+    redis_store = None
+    if settings.RERANK_CACHE_REDIS_ENABLED:
+        redis_store = RedisCacheStore(
+            client=get_redis_client(),
+            namespace="cache:rerank",
+            ttl_seconds=settings.RERANK_CACHE_TTL_SECONDS,
+        )
+
+    cache = RerankScoreCache(
+        max_bytes=settings.RERANK_CACHE_MAX_BYTES, redis_store=redis_store
+    )
+    register_stats("rerank_cache", cache.stats)
+
+    return cache
 
 
 @lru_cache(maxsize=1)
 def get_rerank_service() -> RerankService:
-    return RerankService()
+    score_cache = get_rerank_score_cache() if settings.RERANK_CACHE_ENABLED else None
+    backend = create_rerank_backend(
+        settings.RERANK_BACKEND, cohere_client=get_client_registry().cohere_client()
+    )
+    return RerankService(backend=backend, score_cache=score_cache)
+
 
 @lru_cache(maxsize=1)
 def get_github_service() -> GithubService:
-    return GithubService()
\ No newline at end of file
+    if not settings.PR_CONTEXT_CACHE_ENABLED:
+        return GithubService(client=get_client_registry().github)
+
+    redis_store = None
+    if settings.PR_CONTEXT_CACHE_REDIS_ENABLED:
+        redis_store = RedisCacheStore(
+            client=get_redis_client(),
+            namespace="cache:pr_context",
+            ttl_seconds=settings.PR_CONTEXT_CACHE_MAX_STALE_SECONDS,
+        )
+
+    cache = PrContextCache(
+        max_bytes=settings.PR_CONTEXT_CACHE_MAX_BYTES, redis_store=redis_store
+    )
+    register_stats("pr_context_cache", cache.stats)
+
+    return GithubService(
+        cache=cache,
+        fresh_seconds=settings.PR_CONTEXT_CACHE_FRESH_SECONDS,
+        max_stale_seconds=settings.PR_CONTEXT_CACHE_MAX_STALE_SECONDS,
+        client=get_client_registry().github,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_context_packer() -> ContextPacker:
+    packer = ContextPacker(
+        model=settings.OPENAI_CHAT_MODEL,
+        min_tail_tokens=settings.CONTEXT_MIN_TAIL_TOKENS,
+    )
+    register_stats("context_packer", packer.stats)
+
+    return packer
+
+
+@lru_cache(maxsize=1)
+def get_conversation_summarizer() -> ConversationSummarizer:
+    summarizer = ConversationSummarizer(
+        llm=get_llm_service().get_llm(),
+        count_tokens=get_context_packer().count_tokens,
+        trigger_tokens=settings.CONVERSATION_SUMMARY_TRIGGER_TOKENS,
+        keep_turns=settings.CONVERSATION_SUMMARY_KEEP_TURNS,
+        max_summary_tokens=settings.CONVERSATION_SUMMARY_MAX_TOKENS,
+    )
+    register_stats("conversation_summary", summarizer.stats)
+
+    return summarizer
+
+
+@lru_cache(maxsize=1)
+def get_diff_condenser() -> DiffCondenser:
+    condenser = DiffCondenser(
+        token_counter=get_context_packer().count_tokens,
+        token_cap=settings.PR_DIFF_TOKEN_CAP,
+    )
+    register_stats("diff_condenser", condenser.stats)
+
+    return condenser
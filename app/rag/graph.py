@@ -1,10 +1,10 @@
-from langgraph.checkpoint.redis.aio import AsyncRedisSaver
 from langgraph.graph import END, StateGraph
-from redis.asyncio import Redis
 
-from app.core.config import settings
+from app.core.config import QueryAnalysisMode, settings
 from app.observability.langfuse_client import langfuse_handler
+from app.rag.factory import get_checkpointer
 from app.rag.node import (
+    analyze_node,
     chitchat_node,
     generate_node,
     grade_node,
@@ -26,6 +26,13 @@ def route_question(state: AgentState):
     return "rewrite"
 
 
+def route_analyzed_question(state: AgentState):
+    # fused 모드는 rewrite / plan 결과가 이미 있으므로 검색 단계로 바로 분기
+    if route_question(state) == "chitchat":
+        return ["chitchat"]
+    return ["retrieve", "search_related_jira"]
+
+
 def route_after_grade(state: AgentState):
     grade_status = state.get("grade_status")
     if grade_status == "bad":
@@ -36,8 +43,13 @@ def route_after_grade(state: AgentState):
 async def get_compiled_graph():
     workflow = StateGraph(AgentState)
 
+    fused = settings.QUERY_ANALYSIS_MODE == QueryAnalysisMode.fused
+
     # 노드 추가
-    workflow.add_node("router", router_node)
+    if fused:
+        workflow.add_node("analyze", analyze_node)
+    else:
+        workflow.add_node("router", router_node)
     workflow.add_node("chitchat", chitchat_node)
     workflow.add_node("rewrite", rewrite_node)
     workflow.add_node("plan", plan_node)
@@ -48,11 +60,19 @@ async def get_compiled_graph():
     workflow.add_node("generate", generate_node)
     workflow.add_node("search_related_jira", search_related_jira_node)
 
-    workflow.set_entry_point("router")
-
-    workflow.add_conditional_edges(
-        "router", route_question, {"rewrite": "rewrite", "chitchat": "chitchat"}
-    )
+    if fused:
+        # router + rewrite + plan을 LLM 1회로 처리 (재시도 시에는 rewrite -> plan 사용)
+        workflow.set_entry_point("analyze")
+        workflow.add_conditional_edges(
+            "analyze",
+            route_analyzed_question,
+            ["chitchat", "retrieve", "search_related_jira"],
+        )
+    else:
+        workflow.set_entry_point("router")
+        workflow.add_conditional_edges(
+            "router", route_question, {"rewrite": "rewrite", "chitchat": "chitchat"}
+        )
     workflow.add_edge("chitchat", END)
 
     workflow.add_edge("rewrite", "search_related_jira")
@@ -71,10 +91,8 @@ async def get_compiled_graph():
 
     workflow.add_edge("generate", END)
 
-    redis_client = Redis.from_url(settings.REDIS_URL)
-
-    # Thread(session)-level 단기 영속성
-    checkpointer = AsyncRedisSaver(redis_client=redis_client)
+    # Thread(session)-level 단기 영속성 (큰 검색 결과는 blob으로 분리 저장)
+    checkpointer = get_checkpointer()
 
     await checkpointer.setup()  # 인덱스 생성
 
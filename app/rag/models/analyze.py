@@ -0,0 +1,23 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from app.rag.models.plan import SearchQuery
+
+
+# router + rewrite + plan을 한 번의 LLM 호출로 수행하는 경우의 출력
+class QueryAnalysis(BaseModel):
+    datasource: Literal["chitchat", "search_pipeline"] = Field(
+        ...,
+        description=(
+            "'chitchat': 검색이 필요 없는 일상 대화, "
+            "'search_pipeline': 프로젝트와 관련된 모든 기술적인 질문"
+        ),
+    )
+    rewritten_query: str = Field(
+        ..., description="대화 맥락이 복원된 한 문장의 한국어 질문"
+    )
+    queries: list[SearchQuery] = Field(
+        default_factory=list,
+        description="search_pipeline인 경우 수행해야 할 모든 검색 쿼리의 목록 (chitchat이면 빈 목록)",
+    )
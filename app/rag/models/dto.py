@@ -128,6 +128,9 @@ class ChatRequest(BaseModel):
         default_factory=lambda: str(uuid.uuid4()), description="대화 세션 ID"
     )
     index_list: list[str] = Field(description="검색 대상 인덱스 리스트")
+    stream_tokens: bool = Field(
+        default=False, description="(Streaming) 답변 토큰 delta 이벤트 수신 여부"
+    )
 
 
 # 최종 채팅 응답
@@ -137,6 +140,7 @@ class ChatResponse(BaseModel):
         default_factory=list, description="참고한 문서 출처 목록"
     )
     process_time: float = Field(..., description="답변 생성 시간")
+    cached: bool = Field(default=False, description="Answer cache 적중 여부")
 
 
 # (Streaming) 중간 과정 응답
@@ -157,6 +161,7 @@ class ChatStreamingInterruptResponse(BaseModel):
 class ChatStreamingResumeRequest(BaseModel):
     session_id: str = Field(..., description="PR 수동 선택 후 재개할 세션 ID")
     user_selected_pull_requests: list[PullRequestUserSelected] = Field(..., description="사용자가 선택한 PR 번호 리스트")
+    stream_tokens: bool = Field(default=False, description="답변 토큰 delta 이벤트 수신 여부")
     
 
 # (Streaming) Keep-alive Ping
@@ -165,6 +170,49 @@ class ChatStreamingKeepAliveResponse(BaseModel):
     type: Literal["ping"] = Field(..., description="Keep-Alive 핑")
 
 
+# (Streaming) 답변 토큰 delta (여러 토큰을 묶어서 전송)
+class ChatStreamingTokenResponse(BaseModel):
+    session_id: str = Field(..., description="PR 수동 선택 후 재개할 세션 ID")
+    type: Literal["token"] = Field(default="token", description="답변 토큰 delta")
+    node: Literal["generate", "chitchat"] = Field(..., description="답변 생성 노드 이름")
+    delta: str = Field(..., description="이전 이벤트 이후 생성된 답변 텍스트")
+
+
+# (Streaming) rerank 직후의 잠정 출처 (최종 출처/인용 여부는 citations 이벤트로 확정)
+class ChatStreamingSourcesResponse(BaseModel):
+    session_id: str = Field(..., description="PR 수동 선택 후 재개할 세션 ID")
+    type: Literal["sources"] = Field(default="sources", description="잠정 출처")
+    node: Literal["rerank"] = Field(default="rerank", description="출처를 생성한 노드 이름")
+    sources: list[SourceResponse] = Field(
+        default_factory=list, description="rerank로 선별된 문서 출처 목록 (재검색 시 교체)"
+    )
+
+
+# (Streaming) 관련 Jira 이슈 (search_related_jira 완료 직후)
+class ChatStreamingJiraResponse(BaseModel):
+    session_id: str = Field(..., description="PR 수동 선택 후 재개할 세션 ID")
+    type: Literal["jira"] = Field(default="jira", description="관련 Jira 이슈")
+    node: Literal["search_related_jira"] = Field(
+        default="search_related_jira", description="Jira 이슈를 검색한 노드 이름"
+    )
+    related_jira_issues: list[JiraSource] = Field(
+        default_factory=list, description="사용자 쿼리와 관련 있는 Jira 티켓 목록"
+    )
+
+
+# (Streaming) 답변 완료 후 최종 출처 및 인용 여부 patch
+class ChatStreamingCitationResponse(BaseModel):
+    session_id: str = Field(..., description="PR 수동 선택 후 재개할 세션 ID")
+    type: Literal["citations"] = Field(default="citations", description="최종 출처 patch")
+    node: Literal["generate"] = Field(default="generate", description="답변 생성 노드 이름")
+    sources: list[SourceResponse] = Field(
+        default_factory=list, description="인용 여부가 표시된 최종 출처 목록"
+    )
+    cited_indices: list[int] = Field(
+        default_factory=list, description="답변에서 인용된 출처 번호"
+    )
+
+
 # (Streaming) 최종 채팅 응답
 class ChatStreamingFinalResponse(ChatResponse):
     session_id: str = Field(..., description="PR 수동 선택 후 재개할 세션 ID")
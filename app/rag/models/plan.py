@@ -8,6 +8,11 @@ class SearchQuery(BaseModel):
         ..., description="검색할 데이터 소스 유형 선택"
     )
     query: str = Field(..., description="검색어")
+    weight: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="이 검색의 상대적 중요도 (기본 1.0, 핵심 검색일수록 크게)",
+    )
 
 
 class SearchPlan(BaseModel):
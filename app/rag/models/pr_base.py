@@ -20,5 +20,6 @@ class PRFileContext(BaseModel):
     additions: int
     deletions: int
     previous_filename: Optional[str] = Field(default=None, description="Renaming의 경우 이전 파일 이름 포함")
+    sha: Optional[str] = Field(default=None, description="변경된 파일의 blob SHA")
     patch: str = Field(default="", description="변경된 코드 내용 (Diff)")
     comments: list[PRComment] = Field(default_factory=list, description="해당 파일에 달린 리뷰 코멘트 목록")
\ No newline at end of file
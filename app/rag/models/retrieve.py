@@ -26,6 +26,10 @@ class BaseSearchResult(BaseModel):
     text: str = Field(default="", description="문서 본문")
     html_url: str = Field(default="", description="출처 원본 url")
     relevance_score: Optional[float] = Field(None, description="Rerank 점수")
+    index_name: Optional[str] = Field(None, description="검색된 인덱스 이름")
+    is_partial: bool = Field(
+        default=False, description="본문 snippet만 검색된 문서 (rerank 이후 hydrate 필요)"
+    )
 
     @classmethod
     def _base_kwargs_from_doc(cls, doc: Document) -> dict:
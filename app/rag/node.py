@@ -2,24 +2,35 @@ import asyncio
 from collections import defaultdict
 import logging
 import re
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal, Optional
 
 from langchain_core.documents import Document
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph.message import add_messages
 from langgraph.types import interrupt
 from numpy import full
 
-from app.core.config import settings
+from app.core.config import GradeStrategy, QueryAnalysisMode, settings
 from app.observability.langfuse_client import langfuse_handler
+from app.observability.metrics import register_stats
+from app.rag.cache.embedding import normalize_text
 from app.rag.factory import (
+    get_budget_allocator,
+    get_context_packer,
+    get_conversation_summarizer,
+    get_diff_condenser,
     get_github_service,
+    get_intent_router,
     get_llm_service,
     get_rerank_service,
+    get_retrieval_coordinator,
+    get_speculative_retriever,
     get_vector_repository
 )
+from app.rag.models.analyze import QueryAnalysis
 from app.rag.models.dto import BaseSource, JiraSource
 from app.rag.models.grade import GradeDocuments
 from app.rag.models.plan import SearchPlan, SearchQuery
@@ -39,11 +50,30 @@ from app.rag.prompts.system import (
     SYSTEM_QUERY_ROUTER_PROMPT,
 )
 from app.rag.prompts.utils import get_prompt_template
+from app.rag.service.speculative import speculation_key
+from app.rag.service.summary import conversation_messages, unsummarized_messages
 from app.rag.state import AgentState
 
 logger = logging.getLogger(__name__)
 
 
+# grade 판단 경로별 횟수 (score_good, score_bad, llm)
+_grade_decisions: defaultdict[str, int] = defaultdict(int)
+register_stats("grade", lambda: dict(_grade_decisions))
+
+
+# 2단계 검색 hydrate 횟수
+_two_phase_stats: defaultdict[str, int] = defaultdict(int)
+register_stats("two_phase_retrieval", lambda: dict(_two_phase_stats))
+
+
+# 노드별 대화 히스토리 토큰 (before: 요약 없이 보냈을 히스토리, after: 요약 + 요약 이후 메시지)
+_history_tokens: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+register_stats(
+    "history_tokens", lambda: {node: dict(tokens) for node, tokens in _history_tokens.items()}
+)
+
+
 # llm 호출 Rate Limit 방어
 llm_semaphore = asyncio.Semaphore(10)
 rerank_semaphore = asyncio.Semaphore(10)
@@ -57,13 +87,44 @@ INDEX_MAPPING_RULES = {
 }
 
 
-async def router_node(state: AgentState):
+async def router_node(state: AgentState, config: RunnableConfig):
     logger.info("router node 진입")
     messages = state["messages"]
     question = get_latest_query(messages)  # 반드시 가장 최근의 질문을 기반으로 답변
 
     logger.info(f"질문: {question}")
 
+    # 확실한 경우 로컬 분류만으로 라우팅 (LLM 호출 생략)
+    decision = None
+    if settings.INTENT_ROUTER_ENABLED:
+        intent_router = get_intent_router()
+        decision = intent_router.classify(question)
+
+        if intent_router.is_confident(decision):
+            intent_router.record_local(decision)
+            intent_router.maybe_shadow(decision, lambda: _llm_route(question, state))
+
+            # rewrite / plan LLM 호출 동안 원본 질문으로 미리 검색 (일상 대화는 검색하지 않음)
+            if decision.datasource != "chitchat":
+                _start_speculation(state, config, question)
+
+            return {"datasource": decision.datasource, **_new_turn_state()}
+
+    # router / rewrite / plan LLM 호출 동안 원본 질문으로 미리 검색
+    _start_speculation(state, config, question)
+
+    datasource = await _llm_route(question, state)
+
+    if decision is not None:
+        get_intent_router().record_fallback(decision, datasource)
+
+    if datasource == "chitchat":
+        _cancel_speculation(config, question)
+
+    return {"datasource": datasource, **_new_turn_state()}
+
+
+async def _llm_route(question: str, state: AgentState) -> str:
     llm_service = get_llm_service()
     llm = llm_service.get_llm()
 
@@ -77,11 +138,7 @@ async def router_node(state: AgentState):
         ]
     )
 
-    filtered_messages = [
-        m for m in messages if isinstance(m, (HumanMessage, AIMessage))
-    ]
-
-    history_messages = filtered_messages[:-1][-6:]
+    history_messages = _history_messages(state, "router", window=6)
 
     chain = prompt | structured_llm
 
@@ -91,7 +148,57 @@ async def router_node(state: AgentState):
             config={"callbacks": [langfuse_handler]},
         )
 
-    return {"datasource": answer.datasource}
+    return answer.datasource
+
+
+async def analyze_node(state: AgentState, config: RunnableConfig):
+    """router + rewrite + plan을 한 번의 structured output 호출로 수행 (fused 모드)"""
+    logger.info("analyze node 진입")
+    messages = state["messages"]
+    question = get_latest_query(messages)
+
+    logger.info(f"질문: {question}")
+
+    # 확실한 일상 대화는 분석 LLM 호출 생략 (검색 질문은 rewrite / plan이 필요하므로 그대로 진행)
+    if settings.INTENT_ROUTER_ENABLED:
+        intent_router = get_intent_router()
+        decision = intent_router.classify(question)
+        if decision.datasource == "chitchat" and intent_router.is_confident(decision):
+            intent_router.record_local(decision)
+            return {"datasource": "chitchat", **_new_turn_state()}
+
+    _start_speculation(state, config, question)
+
+    llm_service = get_llm_service()
+    llm = llm_service.get_llm()
+
+    structured_llm = llm.with_structured_output(QueryAnalysis, method="function_calling")
+
+    prompt = get_prompt_template("analyze")
+
+    chain = prompt | structured_llm
+
+    async with llm_semaphore:
+        analysis: QueryAnalysis = await chain.ainvoke(
+            input={"history": _format_history(state, "analyze"), "question": question},
+            config={"callbacks": [langfuse_handler]},
+        )
+
+    if analysis.datasource == "chitchat":
+        _cancel_speculation(config, question)
+        return {"datasource": analysis.datasource, **_new_turn_state()}
+
+    logger.info(f"원본 쿼리: {question}\n재작성된 쿼리: {analysis.rewritten_query}")
+    for q in analysis.queries:
+        logger.info(f"query plan: [{q.datasource}] {q.query}")
+
+    return {
+        **_new_turn_state(),
+        "datasource": analysis.datasource,
+        "current_query": analysis.rewritten_query,
+        "retry_count": 1,
+        "search_queries": analysis.queries,
+    }
 
 
 async def chitchat_node(state: AgentState):
@@ -101,9 +208,14 @@ async def chitchat_node(state: AgentState):
 
     messages = state["messages"]
 
-    filtered_messages = [
-        m for m in messages if isinstance(m, (HumanMessage, AIMessage))
-    ]
+    # 단순 인사/감사는 정형화된 응답 사용
+    if settings.INTENT_ROUTER_ENABLED:
+        canned = get_intent_router().canned_response(get_latest_query(messages))
+        if canned is not None:
+            return {"messages": [AIMessage(content=canned)], "sources": []}
+
+    # 요약 + 요약 이후 대화 + 현재 질문
+    filtered_messages = _history_messages(state, "chitchat") + conversation_messages(messages)[-1:]
 
     prompt = ChatPromptTemplate.from_messages(
         [
@@ -132,14 +244,7 @@ async def rewrite_node(state: AgentState):
     original_question = get_latest_query(messages)
     current_try_cnt = state.get("retry_count", 0)
 
-    conversation_history = []
-    for m in messages[:-1][-6:]:
-        if isinstance(m, HumanMessage):
-            conversation_history.append(f"User: {m.content}")
-        elif isinstance(m, AIMessage):
-            conversation_history.append(f"Assistant: {m.content}")
-
-    history_text = "\n".join(conversation_history)
+    history_text = _format_history(state, "rewrite")
 
     prompt = get_prompt_template("rewrite")
 
@@ -184,11 +289,9 @@ async def plan_node(state: AgentState):
     return {"search_queries": plan.queries}
 
 
-async def retrieve_node(state: AgentState):
+async def retrieve_node(state: AgentState, config: RunnableConfig):
     logger.info("retrieve 노드 진입")
 
-    meili_repo = get_vector_repository()
-
     plans = state.get("search_queries", [])
     user_scope = state.get("index_list", [])
 
@@ -200,39 +303,66 @@ async def retrieve_node(state: AgentState):
         plans = [SearchQuery(datasource="codebase", query=current_query)]
 
     search_requests = []
-
-    total_target_indicies = 0
-    resolved_plans: list[tuple[str, str]] = []
+    plan_weights: list[float] = []
 
     for plan in plans:
         target_indices = _resolve_indices(plan.datasource, user_scope)
-        if target_indices:
-            total_target_indicies += len(target_indices)
-            resolved_plans.append((plan, target_indices))
-        else:
+        if not target_indices:
             logger.info(f"Skip: {plan.datasource} (User Scope 없음)")
+            continue
 
-    if total_target_indicies == 0:
-        logger.warning("실행할 검색 작업이 없습니다.")
-
-    dynamic_k = max(
-        settings.MEILISEARCH_MIN_K_PER_INDEX,
-        settings.MEILISEARCH_GLOBAL_RETRIEVAL_BUDGET // total_target_indicies,
-    )
-    logger.info(
-        f"Dynmic K 적용 중: 총 {total_target_indicies}개 인덱스 (각 {dynamic_k}개 문서 검색)"
-    )
-
-    for plan, indicies in resolved_plans:
-        for index_name in indicies:
+        for index_name in target_indices:
             search_requests.append(
                 {
                     "index_name": index_name,
                     "query": plan.query,
-                    "k": dynamic_k,
                     "semantic_ratio": settings.MEILISEARCH_SEMANTIC_RATIO,
                 }
             )
+            plan_weights.append(plan.weight)
+
+    if not search_requests:
+        logger.warning("실행할 검색 작업이 없습니다.")
+
+    # 인덱스별 통계에 따라 전체 예산을 요청별 k로 분배
+    if settings.RETRIEVAL_BUDGET_ALLOCATOR_ENABLED:
+        k_list = get_budget_allocator().allocate(
+            [(req["index_name"], weight) for req, weight in zip(search_requests, plan_weights)],
+            total_budget=settings.MEILISEARCH_GLOBAL_RETRIEVAL_BUDGET,
+            min_k=settings.MEILISEARCH_MIN_K_PER_INDEX,
+        )
+    else:
+        k_list = [_dynamic_k(len(search_requests))] * len(search_requests)
+
+    for req, k in zip(search_requests, k_list):
+        req["k"] = k
+        # 1단계는 snippet만 검색하고 rerank 이후 살아남은 문서만 전체 조회
+        if settings.TWO_PHASE_RETRIEVAL_ENABLED:
+            req["light"] = True
+
+    logger.info(
+        f"Dynamic K 적용 중: 총 {len(search_requests)}개 요청 (k: {k_list})"
+    )
+
+    # 재시도 시 이번 턴에 이미 실행한 (query, index) 쌍은 제외
+    executed_searches: list[str] = []
+    if settings.INCREMENTAL_RETRIEVAL_ENABLED:
+        executed_searches = list(state.get("executed_searches") or [])
+        executed = set(executed_searches)
+
+        new_requests = []
+        for req in search_requests:
+            key = _search_key(req)
+            if key not in executed:
+                executed.add(key)
+                executed_searches.append(key)
+                new_requests.append(req)
+
+        if len(new_requests) < len(search_requests):
+            logger.info(
+                f"증분 검색: 계획된 요청 {len(search_requests)}건 중 {len(new_requests)}건만 실행"
+            )
+        search_requests = new_requests
 
     search_plan = [
         {
@@ -243,35 +373,40 @@ async def retrieve_node(state: AgentState):
     ]
     logger.info("검색 계획: %s", search_plan)
 
-    search_results: list[list[Document]] = await meili_repo.multi_search(
-        search_requests
+    # 새 요청이 없어도 호출 (같은 배치의 search_related_jira가 기다리지 않도록)
+    search_results: list[list[Document]] = await _coordinated_multi_search(
+        state, config, consumer="retrieve", search_requests=search_requests
     )
     
     flat_docs: list[BaseSearchResult]= []
 
-    for docs in search_results:
+    for req, docs in zip(search_requests, search_results):
         for doc in docs:
-            source_type = doc.metadata.get("source_type")
-            try:
-                if source_type == SourceType.CODE:                   
-                    flat_docs.append(CodeSearchResult.from_search_result_doc(doc))
-                    
-                elif source_type == SourceType.PULL_REQUEST:
-                    flat_docs.append(PullRequestSearchResult.from_search_result_doc(doc))
-                    
-                elif source_type == SourceType.ISSUE:
-                    flat_docs.append(IssueSearchResult.from_search_result_doc(doc))
-                
-                elif source_type == SourceType.JIRA_ISSUE:
-                    flat_docs.append(JiraIssueSearchResult.from_search_result_doc(doc))
-            except Exception as e:
-                logger.warning(f"Failed to parse document {doc.metadata.get("id")}: {e}")            
+            parsed = _parse_search_result(doc, req["index_name"])
+            if parsed is not None:
+                flat_docs.append(parsed)
 
     logger.info(
         f"총 검색된 문서 수: {len(flat_docs)} (Budget: {settings.MEILISEARCH_GLOBAL_RETRIEVAL_BUDGET})"
     )
 
-    return {"retrieved_docs": flat_docs}
+    if not settings.INCREMENTAL_RETRIEVAL_ENABLED:
+        _record_retrieved(flat_docs)
+        return {"retrieved_docs": flat_docs}
+
+    # 누적 후보에 이미 있는 문서는 제외 (rerank 대상은 새로 발견된 문서만)
+    seen = {_doc_key(doc) for doc in state.get("candidate_pool") or []}
+    new_docs: list[BaseSearchResult] = []
+    for doc in flat_docs:
+        key = _doc_key(doc)
+        if key not in seen:
+            seen.add(key)
+            new_docs.append(doc)
+
+    logger.info(f"새로 발견된 문서 수: {len(new_docs)}")
+    _record_retrieved(new_docs)
+
+    return {"retrieved_docs": new_docs, "executed_searches": executed_searches}
 
 
 async def rerank_node(state: AgentState):
@@ -281,24 +416,92 @@ async def rerank_node(state: AgentState):
     query = state.get("current_query") or state["messages"][-1].content
 
     retrieved_docs: list[BaseSearchResult] = state.get("retrieved_docs", [])
-    
-    if not retrieved_docs:
+
+    # 이전 시도에서 rerank된 후보 (점수 재계산 없이 그대로 합침)
+    candidate_pool: list[BaseSearchResult] = (
+        list(state.get("candidate_pool") or [])
+        if settings.INCREMENTAL_RETRIEVAL_ENABLED
+        else []
+    )
+
+    if not retrieved_docs and not candidate_pool:
         return {"retrieved_docs": []}
 
-    async with rerank_semaphore:
-        reranked_docs = await rerank_service.rerank(
-            query=query,
-            documents=retrieved_docs,
-            top_n=len(retrieved_docs)
-        )
-        
+    reranked_docs: list[BaseSearchResult] = []
+    if retrieved_docs:
+        async with rerank_semaphore:
+            reranked_docs = await rerank_service.rerank(
+                query=query,
+                documents=retrieved_docs,
+                top_n=len(retrieved_docs)
+            )
+
+    candidate_pool.extend(reranked_docs)
+    candidate_pool.sort(key=lambda doc: doc.relevance_score or 0.0, reverse=True)
+
     final_docs = select_diverse_top_k(
-        reranked_docs=reranked_docs,
+        reranked_docs=candidate_pool,
         total_k=settings.CUSTOM_RERANK_TOTAL_K,  # 최종 10개
         min_guarantee=2  # 최소 2개 보장
     )
-        
-    return {"retrieved_docs": final_docs}
+
+    # snippet만 검색된 문서는 최종 선정된 것만 전체 조회
+    final_docs = await _hydrate_documents(final_docs)
+
+    if not settings.INCREMENTAL_RETRIEVAL_ENABLED:
+        return {"retrieved_docs": final_docs}
+
+    hydrated = {_doc_key(doc): doc for doc in final_docs}
+    candidate_pool = [hydrated.get(_doc_key(doc), doc) for doc in candidate_pool]
+
+    return {"retrieved_docs": final_docs, "candidate_pool": candidate_pool}
+
+
+async def _hydrate_documents(docs: list[BaseSearchResult]) -> list[BaseSearchResult]:
+    """is_partial 문서를 인덱스별로 묶어 전체 문서로 교체 (실패 시 snippet 그대로 사용)"""
+    partial_by_index: defaultdict[str, list[BaseSearchResult]] = defaultdict(list)
+    for doc in docs:
+        if doc.is_partial and doc.index_name:
+            partial_by_index[doc.index_name].append(doc)
+
+    if not partial_by_index:
+        return docs
+
+    repository = get_vector_repository()
+    results = await asyncio.gather(
+        *(
+            repository.get_documents(index_name, [doc.id for doc in partial])
+            for index_name, partial in partial_by_index.items()
+        ),
+        return_exceptions=True,
+    )
+
+    hydrated: dict[tuple, BaseSearchResult] = {}
+    for index_name, result in zip(partial_by_index.keys(), results):
+        if isinstance(result, Exception):
+            _two_phase_stats["hydrate_failures"] += 1
+            logger.warning(f"문서 hydrate 실패 ({index_name}): {result}")
+            continue
+
+        for raw in result:
+            hydrated_doc = _parse_search_result(raw, index_name)
+            if hydrated_doc is not None:
+                hydrated[_doc_key(hydrated_doc)] = hydrated_doc
+
+    final_docs = []
+    for doc in docs:
+        hydrated_doc = hydrated.get(_doc_key(doc)) if doc.is_partial else None
+        if hydrated_doc is None:
+            final_docs.append(doc)
+            continue
+
+        hydrated_doc.relevance_score = doc.relevance_score
+        final_docs.append(hydrated_doc)
+
+    _two_phase_stats["hydrated_docs"] += len(hydrated)
+    logger.info(f"문서 hydrate 완료: {len(hydrated)}개")
+
+    return final_docs
 
 
 async def manage_pr_context_node(state: AgentState):
@@ -313,6 +516,14 @@ async def manage_pr_context_node(state: AgentState):
         if doc.source_type == SourceType.PULL_REQUEST
     ]
 
+    # 재시도 시 이번 턴에 이미 context를 붙였거나 사용자 선택을 거친 PR은 제외
+    reviewed_prs: list[str] = []
+    if settings.INCREMENTAL_RETRIEVAL_ENABLED:
+        reviewed_prs = list(state.get("reviewed_prs") or [])
+        reviewed = set(reviewed_prs)
+        pr_docs = [pr for pr in pr_docs if _pr_key(pr) not in reviewed]
+        reviewed_prs.extend(_pr_key(pr) for pr in pr_docs)
+
     if not pr_docs:
         logger.info("Skip: PR 관련 문서 없음")
         return {"retrieved_docs": retrieved_docs}
@@ -336,7 +547,7 @@ async def manage_pr_context_node(state: AgentState):
         
         if not user_selected_prs:
             logger.info("Skip: 사용자가 선택한 PR이 없음.")
-            return {"retrieved_docs": retrieved_docs}
+            return _pr_context_update(retrieved_docs, state, reviewed_prs)
         
         selected_pr_numbers = {item.pr_number for item in user_selected_prs}
         
@@ -351,12 +562,46 @@ async def manage_pr_context_node(state: AgentState):
     ]
     
     results = await asyncio.gather(*tasks)
-    
+
+    question = state.get("current_query") or get_latest_query(state["messages"])
+
     for pr, context_data in zip(target_prs, results):
+        # 질문과 관련된 hunk만 남겨 PR당 diff 토큰 제한
+        if settings.PR_DIFF_CONDENSE_ENABLED:
+            context_data = get_diff_condenser().condense(
+                pr.owner, pr.repo, pr.pr_number, context_data, question
+            )
+
         pr.file_context = context_data
         logger.info(f"PR #{pr.pr_number} 컨텍스트 업데이트 완료 ({len(context_data)} 파일)")
     
-    return {"retrieved_docs": retrieved_docs}
+    return _pr_context_update(retrieved_docs, state, reviewed_prs)
+
+
+def _pr_context_update(
+    retrieved_docs: list[BaseSearchResult],
+    state: AgentState,
+    reviewed_prs: list[str],
+) -> dict[str, Any]:
+    """조회한 PR context를 누적 후보에도 반영해 재시도 시 재사용"""
+    if not settings.INCREMENTAL_RETRIEVAL_ENABLED:
+        return {"retrieved_docs": retrieved_docs}
+
+    contexts = {
+        _pr_key(doc): doc.file_context
+        for doc in retrieved_docs
+        if doc.source_type == SourceType.PULL_REQUEST and doc.file_context
+    }
+    candidate_pool: list[BaseSearchResult] = state.get("candidate_pool") or []
+    for doc in candidate_pool:
+        if doc.source_type == SourceType.PULL_REQUEST and _pr_key(doc) in contexts:
+            doc.file_context = contexts[_pr_key(doc)]
+
+    return {
+        "retrieved_docs": retrieved_docs,
+        "candidate_pool": candidate_pool,
+        "reviewed_prs": reviewed_prs,
+    }
 
 
 async def grade_node(state: AgentState):
@@ -375,16 +620,25 @@ async def grade_node(state: AgentState):
 
     retrieved_docs: list[BaseSearchResult] = state.get("retrieved_docs", [])
 
-    context_text = "\n\n".join(
-        [
-            doc.to_context_text(index=i) 
-            for i, doc in enumerate(retrieved_docs, start=1)
-        ]
-    )
+    strategy = settings.GRADE_STRATEGY
+
+    # rerank 점수 분포로 판단 (hybrid는 애매한 경우에만 LLM 호출)
+    if strategy != GradeStrategy.llm:
+        score_status = _grade_by_scores(retrieved_docs, hybrid=strategy == GradeStrategy.hybrid)
+        if score_status is not None:
+            _grade_decisions[f"score_{score_status}"] += 1
+            return {"grade_status": score_status}
+
+    # 토큰 예산 내에서 relevance 순서대로 context 구성
+    context_text = get_context_packer().pack(
+        retrieved_docs, token_budget=settings.GRADE_CONTEXT_TOKEN_BUDGET
+    ).text
 
     if not context_text:
         return {"grade_status": "bad"}
 
+    _grade_decisions["llm"] += 1
+
     prompt = get_prompt_template("grade")
 
     chain = prompt | llm.with_structured_output(
@@ -402,6 +656,35 @@ async def grade_node(state: AgentState):
     return {"grade_status": "good" if is_relevant else "bad"}
 
 
+def _grade_by_scores(
+    retrieved_docs: list[BaseSearchResult], hybrid: bool
+) -> Literal["good", "bad"] | None:
+    """
+    rerank relevance_score 분포로 검색 품질 판단.
+    hybrid인 경우 good / bad가 명확하지 않으면 None (LLM 평가 필요)
+    """
+    scores = sorted(
+        (doc.relevance_score or 0.0 for doc in retrieved_docs), reverse=True
+    )
+    if not scores:
+        return "bad"
+
+    top_scores = scores[: settings.GRADE_SCORE_TOP_K]
+    top_mean = sum(top_scores) / len(top_scores)
+
+    logger.info(
+        f"Grade score 분포: max={scores[0]:.3f}, top{len(top_scores)} mean={top_mean:.3f}"
+    )
+
+    if top_mean >= settings.RERANK_THRESHOLD or scores[0] >= settings.GRADE_SCORE_MAX_THRESHOLD:
+        return "good"
+
+    if not hybrid or scores[0] < settings.GRADE_SCORE_BAD_THRESHOLD:
+        return "bad"
+
+    return None
+
+
 async def generate_node(state: AgentState):
     logger.info("generate node 진입")
     llm_service = get_llm_service()
@@ -425,7 +708,9 @@ async def generate_node(state: AgentState):
     retrieved_docs: list[BaseSearchResult] = state.get("retrieved_docs", [])
 
     # 문서 전처리 (Context 텍스트 생성 및 Source 객체 초기화)
-    context_text, processed_sources = _preprocess_documents(retrieved_docs)
+    context_text, processed_sources, packed_docs = _preprocess_documents(
+        retrieved_docs, token_budget=settings.GENERATE_CONTEXT_TOKEN_BUDGET
+    )
 
     # 프롬프트 생성
     prompt = ChatPromptTemplate.from_messages(
@@ -439,16 +724,20 @@ async def generate_node(state: AgentState):
     # 체인
     chain = prompt | llm | StrOutputParser()
 
-    # 사용자-어시스턴트 대화 필터링
-    conversation_messages = [
-        m for m in messages if isinstance(m, (HumanMessage, AIMessage))
-    ]
+    # 마지막 대화를 제외한 사용자-어시스턴트 대화 (누적 요약이 있으면 요약 + 요약 이후 대화)
+    summary, history_messages = _split_history(state)
+    if summary:
+        history_messages = [_summary_message(summary)] + history_messages
 
-    # 마지막 대화를 제외한 모든 사용자-어시스턴트 대화 내용
-    history_messages = conversation_messages[:-1]
-
-    # 대화 히스토리 trim
+    # 대화 히스토리 trim (요약은 system 메시지라 trim 대상에서 제외)
     trimmed_history = trimmer.invoke(history_messages)
+    if settings.CONVERSATION_SUMMARY_ENABLED:
+        full_history = conversation_messages(messages)[:-1]
+        _record_history_tokens(
+            "generate",
+            before=trimmer.invoke(full_history) if summary else trimmed_history,
+            after=trimmed_history,
+        )
 
     # LLM 호출
     async with llm_semaphore:
@@ -474,23 +763,30 @@ async def generate_node(state: AgentState):
         sanity_threshold=settings.FINAL_SOURCES_SANITY_THRESHOLD,
     )
 
+    # 인덱스별 rerank 생존 / 인용 이력 (검색 예산 분배에 사용)
+    if settings.RETRIEVAL_BUDGET_ALLOCATOR_ENABLED:
+        get_budget_allocator().record_outcome(
+            survived=_count_by_index(retrieved_docs),
+            cited=_count_by_index(
+                packed_docs[i - 1] for i in cited_indices if 0 < i <= len(packed_docs)
+            ),
+        )
+
     return {"messages": [AIMessage(content=answer)], "sources": final_sources}
 
 
-async def search_related_jira_node(state: AgentState):
+async def search_related_jira_node(state: AgentState, config: RunnableConfig):
     logger.info("search_related_jira node 진입")
     
     query = state.get("current_query") or get_latest_query(state["messages"])
     
     user_index_list = state.get("index_list", [])
     
-    jira_indices = [idx for idx in user_index_list if "_jira_issue" in idx]
+    jira_indices = _jira_indices(user_index_list)
     
     if not jira_indices:
         return {"related_jira_issues": []}
     
-    meili_repo = get_vector_repository()
-    
     limit = 20
     search_requests = [
         {
@@ -503,7 +799,12 @@ async def search_related_jira_node(state: AgentState):
     ]
     
     try:
-        search_result_docs = await meili_repo.multi_search(search_requests)
+        search_result_docs = await _coordinated_multi_search(
+            state,
+            config,
+            consumer="search_related_jira",
+            search_requests=search_requests,
+        )
         
         scored_issues: list[tuple[float, JiraIssueSearchResult]] = []
         
@@ -532,6 +833,73 @@ async def search_related_jira_node(state: AgentState):
         return {"related_jira_issues": []}
 
 
+async def _coordinated_multi_search(
+    state: AgentState,
+    config: RunnableConfig,
+    consumer: str,
+    search_requests: list[dict[str, Any]],
+) -> list[list[Document]]:
+    """
+    retrieve와 search_related_jira의 검색 요청을 같은 턴 단위로 묶어
+    한 번의 임베딩 배치 + 한 번의 multi_search로 실행
+    (추측 검색 결과로 대체 가능한 요청은 검색하지 않음)
+    """
+    # 추측 검색 결과 중 재사용 가능한 요청은 제외하고 나머지만 검색
+    if settings.SPECULATIVE_RETRIEVAL_ENABLED:
+        spec_key = _speculation_key(config, get_latest_query(state["messages"]))
+        reused = await get_speculative_retriever().resolve(spec_key, search_requests)
+    else:
+        reused = [None] * len(search_requests)
+
+    missing_requests = [
+        req for req, docs in zip(search_requests, reused) if docs is None
+    ]
+    fetched = iter(
+        await _multi_search(state, config, consumer, missing_requests)
+    )
+
+    return [docs if docs is not None else next(fetched) for docs in reused]
+
+
+async def _multi_search(
+    state: AgentState,
+    config: RunnableConfig,
+    consumer: str,
+    search_requests: list[dict[str, Any]],
+) -> list[list[Document]]:
+    if not settings.RETRIEVAL_COORDINATOR_ENABLED or not _same_superstep_search(state):
+        if not search_requests:
+            return []
+        return await get_vector_repository().multi_search(search_requests)
+
+    # 같은 턴(같은 analyze 결과)에서 실행되는 검색끼리 병합
+    thread_id = config.get("configurable", {}).get("thread_id")
+    batch_key = f"{thread_id}:{state.get('retry_count', 0)}" if thread_id else None
+
+    expected_consumers = {"retrieve"}
+    if _jira_indices(state.get("index_list", [])):
+        expected_consumers.add("search_related_jira")
+
+    return await get_retrieval_coordinator().search(
+        consumer=consumer,
+        search_requests=search_requests,
+        batch_key=batch_key,
+        expected_consumers=expected_consumers,
+    )
+
+
+def _same_superstep_search(state: AgentState) -> bool:
+    """
+    retrieve와 search_related_jira가 같은 superstep에서 실행되는지 여부.
+    fused 모드의 analyze 직후(retry_count == 1)만 해당하며, sequential 모드와 재시도(rewrite 이후)는
+    search_related_jira가 plan과 함께 먼저 끝나므로 병합을 기다리면 대기 시간만 늘어난다.
+    """
+    return (
+        settings.QUERY_ANALYSIS_MODE == QueryAnalysisMode.fused
+        and state.get("retry_count", 0) == 1
+    )
+
+
 def select_diverse_top_k(
     reranked_docs: list[BaseSearchResult],
     total_k: int,
@@ -590,27 +958,23 @@ def select_diverse_top_k(
 
 def _preprocess_documents(
     retrieved_docs: list[BaseSearchResult],
-) -> tuple[str, list[dict[str, Any]]]:
+    token_budget: int,
+) -> tuple[str, list[dict[str, Any]], list[BaseSearchResult]]:
     """
     검색 결과를 LLM용 Context Text와 Frontend용 Source 객체로 변환
+
+    토큰 예산 안에 포함된 문서만 Source로 만들어 context의 [번호]와 Source index를 일치시킨다.
+    (세 번째 값은 Source index 순서의 원본 문서)
     """
-    # context_text 생성을 위한 임시 리스트
-    context_text_list = []
+    packed = get_context_packer().pack(retrieved_docs, token_budget=token_budget)
 
     # 사용자 제공용 Source 리스트
-    processed_sources = []
-
-    for i, doc in enumerate(retrieved_docs, start=1):
-        formatted_text = doc.to_context_text(index=i)
-        context_text_list.append(formatted_text)
-        
-        source_dto = BaseSource.from_search_result(index=i, doc=doc)
-        processed_sources.append(source_dto)
+    processed_sources = [
+        BaseSource.from_search_result(index=i, doc=doc)
+        for i, doc in enumerate(packed.documents, start=1)
+    ]
 
-    # LLM 제공용 context 연결
-    full_context_text = "\n\n".join(context_text_list)
-    
-    return full_context_text, processed_sources
+    return packed.text, processed_sources, packed.documents
 
 
 def _select_final_sources(
@@ -685,6 +1049,164 @@ def extract_citation(text: str) -> set[int]:
     return indices
 
 
+def _format_history(state: AgentState, node: str) -> str:
+    """최근 질문을 제외한 직전 6개 메시지를 텍스트로 변환 (누적 요약이 있으면 맨 앞에 포함)"""
+    conversation_history = []
+    for m in _history_messages(state, node, window=6):
+        if isinstance(m, SystemMessage):
+            conversation_history.append(m.content)
+        elif isinstance(m, HumanMessage):
+            conversation_history.append(f"User: {m.content}")
+        elif isinstance(m, AIMessage):
+            conversation_history.append(f"Assistant: {m.content}")
+
+    return "\n".join(conversation_history)
+
+
+def _split_history(state: AgentState) -> tuple[Optional[str], list]:
+    """현재 질문을 제외한 이전 대화를 (누적 요약, 요약되지 않은 메시지)로 분리"""
+    history = conversation_messages(state["messages"])[:-1]
+
+    summary = state.get("conversation_summary")
+    if not settings.CONVERSATION_SUMMARY_ENABLED or not summary:
+        return None, history
+
+    return summary, unsummarized_messages(history, state.get("summarized_until"))
+
+
+def _summary_message(summary: str) -> SystemMessage:
+    return SystemMessage(content=f"[이전 대화 요약]\n{summary}")
+
+
+def _history_messages(state: AgentState, node: str, window: Optional[int] = None) -> list:
+    """프롬프트에 넣을 이전 대화. 요약 이후 메시지 중 최근 window개 + 맨 앞에 요약 메시지"""
+    summary, history = _split_history(state)
+    if window is not None:
+        history = history[-window:]
+
+    result = [_summary_message(summary)] + history if summary else history
+
+    if settings.CONVERSATION_SUMMARY_ENABLED:
+        before = conversation_messages(state["messages"])[:-1]
+        _record_history_tokens(
+            node,
+            before=before[-window:] if window is not None else before,
+            after=result,
+        )
+
+    return result
+
+
+def _record_history_tokens(node: str, before: list, after: list) -> None:
+    message_tokens = get_conversation_summarizer().message_tokens
+    tokens = _history_tokens[node]
+    tokens["calls"] += 1
+    tokens["before"] += message_tokens(before)
+    tokens["after"] += message_tokens(after)
+
+
+def _start_speculation(state: AgentState, config: RunnableConfig, question: str) -> None:
+    user_scope = state.get("index_list", [])
+    if not settings.SPECULATIVE_RETRIEVAL_ENABLED or not user_scope:
+        return
+
+    get_speculative_retriever().start(
+        key=_speculation_key(config, question),
+        question=question,
+        index_list=user_scope,
+        k=_dynamic_k(len(user_scope)),
+        semantic_ratio=settings.MEILISEARCH_SEMANTIC_RATIO,
+    )
+
+
+def _cancel_speculation(config: RunnableConfig, question: str) -> None:
+    if settings.SPECULATIVE_RETRIEVAL_ENABLED:
+        get_speculative_retriever().cancel(_speculation_key(config, question))
+
+
+def _speculation_key(config: RunnableConfig, question: str) -> str | None:
+    thread_id = config.get("configurable", {}).get("thread_id")
+    return speculation_key(thread_id, question)
+
+
+def _new_turn_state() -> dict[str, Any]:
+    """새 질문이 들어오면 재시도 횟수와 턴 단위 누적 검색 상태 초기화"""
+    return {
+        "retry_count": 0,
+        "candidate_pool": [],
+        "executed_searches": [],
+        "reviewed_prs": [],
+    }
+
+
+def _search_key(search_request: dict[str, Any]) -> str:
+    return f"{search_request['index_name']}|{normalize_text(search_request['query'])}"
+
+
+def _doc_key(doc: BaseSearchResult) -> tuple:
+    # PR id(pr_number)는 레포 간 중복될 수 있으므로 owner/repo 포함
+    return (doc.source_type, doc.owner, doc.repo, doc.id)
+
+
+def _pr_key(pr: PullRequestSearchResult) -> str:
+    return f"{pr.owner}/{pr.repo}#{pr.pr_number}"
+
+
+def _dynamic_k(total_target_indices: int) -> int:
+    """인덱스 수에 따라 전체 검색 예산을 나눈 인덱스당 k"""
+    return max(
+        settings.MEILISEARCH_MIN_K_PER_INDEX,
+        settings.MEILISEARCH_GLOBAL_RETRIEVAL_BUDGET // max(1, total_target_indices),
+    )
+
+
+def _parse_search_result(doc: Document, index_name: str) -> BaseSearchResult | None:
+    source_type = doc.metadata.get("source_type")
+    try:
+        if source_type == SourceType.CODE:
+            parsed = CodeSearchResult.from_search_result_doc(doc)
+
+        elif source_type == SourceType.PULL_REQUEST:
+            parsed = PullRequestSearchResult.from_search_result_doc(doc)
+
+        elif source_type == SourceType.ISSUE:
+            parsed = IssueSearchResult.from_search_result_doc(doc)
+
+        elif source_type == SourceType.JIRA_ISSUE:
+            parsed = JiraIssueSearchResult.from_search_result_doc(doc)
+
+        else:
+            return None
+
+    except Exception as e:
+        logger.warning(f"Failed to parse document {doc.metadata.get("id")}: {e}")
+        return None
+
+    if parsed is None:
+        return None
+
+    parsed.index_name = index_name
+    parsed.is_partial = bool(doc.metadata.get("_partial"))
+    return parsed
+
+
+def _count_by_index(docs) -> dict[str, int]:
+    counts: defaultdict[str, int] = defaultdict(int)
+    for doc in docs:
+        if doc.index_name:
+            counts[doc.index_name] += 1
+    return dict(counts)
+
+
+def _record_retrieved(docs: list[BaseSearchResult]) -> None:
+    if settings.RETRIEVAL_BUDGET_ALLOCATOR_ENABLED:
+        get_budget_allocator().record_retrieved(_count_by_index(docs))
+
+
+def _jira_indices(user_scope: list[str]) -> list[str]:
+    return [idx for idx in user_scope if "_jira_issue" in idx]
+
+
 def _resolve_indices(datasource_type: str, user_scope: list[str]) -> list[str]:
     valid_suffix = INDEX_MAPPING_RULES.get(datasource_type, [])
     resolved = []
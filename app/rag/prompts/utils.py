@@ -1,8 +1,10 @@
 from langchain_core.prompts import ChatPromptTemplate
 
+from app.rag.prompts.analyze import QUERY_ANALYZE_PROMPT
 from app.rag.prompts.grade import DOCUMENT_GRADE_PROMPT
 from app.rag.prompts.plan import PLANNER_PROMPT
 from app.rag.prompts.rewrite import REWRITE_PROMPT
+from app.rag.prompts.summary import CONVERSATION_SUMMARY_PROMPT
 
 
 def get_prompt_template(prompt_name: str) -> ChatPromptTemplate:
@@ -10,6 +12,8 @@ def get_prompt_template(prompt_name: str) -> ChatPromptTemplate:
         "plan": PLANNER_PROMPT,
         "rewrite": REWRITE_PROMPT,
         "grade": DOCUMENT_GRADE_PROMPT,
+        "analyze": QUERY_ANALYZE_PROMPT,
+        "summary": CONVERSATION_SUMMARY_PROMPT,
     }
 
     prompt_str = prompts.get(prompt_name, "")
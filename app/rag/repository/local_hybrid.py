@@ -0,0 +1,320 @@
+import asyncio
+import json
+import logging
+import math
+import os
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Optional
+
+import faiss
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_openai import OpenAIEmbeddings
+
+from app.core.clients import ClientRegistry
+from app.core.config import settings
+from app.rag.cache.embedding import CachedEmbeddings, EmbeddingCache
+from app.rag.repository.meili import hit_to_document
+from app.rag.text import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+VECTORS_FILE = "vectors.faiss"
+DOCUMENTS_FILE = "documents.jsonl"
+
+
+class Bm25Index:
+    """메모리 상의 BM25 (Okapi) sparse 인덱스"""
+
+    def __init__(self, corpus: list[list[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.doc_count = len(corpus)
+        self.doc_len = np.array([len(tokens) for tokens in corpus], dtype=np.float32)
+        self.avg_doc_len = float(self.doc_len.mean()) if self.doc_count else 0.0
+
+        # token -> [(doc_idx, term frequency)]
+        self.postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for doc_idx, tokens in enumerate(corpus):
+            for token, tf in Counter(tokens).items():
+                self.postings[token].append((doc_idx, tf))
+
+        self.idf = {
+            token: math.log(1 + (self.doc_count - len(p) + 0.5) / (len(p) + 0.5))
+            for token, p in self.postings.items()
+        }
+
+    def score(self, query_tokens: list[str]) -> np.ndarray:
+        scores = np.zeros(self.doc_count, dtype=np.float32)
+        if not self.doc_count or not self.avg_doc_len:
+            return scores
+
+        for token in set(query_tokens):
+            idf = self.idf.get(token)
+            if idf is None:
+                continue
+            for doc_idx, tf in self.postings[token]:
+                norm = self.k1 * (
+                    1 - self.b + self.b * self.doc_len[doc_idx] / self.avg_doc_len
+                )
+                scores[doc_idx] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return scores
+
+
+class _LocalIndex:
+    """단일 인덱스의 FAISS(dense) + BM25(sparse) 데이터"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.hits: list[dict[str, Any]] = []
+
+        documents_path = path / DOCUMENTS_FILE
+        if documents_path.exists():
+            with open(documents_path, encoding="utf-8") as f:
+                self.hits = [json.loads(line) for line in f if line.strip()]
+
+        vectors_path = path / VECTORS_FILE
+        self.vectors: Optional[faiss.Index] = None
+        if vectors_path.exists():
+            # 디스크의 벡터 인덱스를 메모리에 올리지 않고 mmap으로 접근
+            self.vectors = faiss.read_index(
+                str(vectors_path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+
+        self.bm25 = Bm25Index([tokenize(_hit_text(hit)) for hit in self.hits])
+
+        # 문서 파일 갱신 시각을 인덱스 버전으로 사용 (Meilisearch updatedAt 대응)
+        self.version = (
+            str(os.path.getmtime(documents_path)) if documents_path.exists() else ""
+        )
+
+    def search(
+        self,
+        query: str,
+        vector: np.ndarray,
+        k: int,
+        semantic_ratio: float,
+        filters: Optional[dict] = None,
+    ) -> list[dict[str, Any]]:
+        if not self.hits:
+            return []
+
+        candidate_count = min(len(self.hits), max(k * 4, 50))
+
+        # Sparse 후보
+        keyword_scores = self.bm25.score(tokenize(query))
+        keyword_candidates = np.argsort(-keyword_scores)[:candidate_count]
+        keyword_candidates = keyword_candidates[keyword_scores[keyword_candidates] > 0]
+
+        # Dense 후보
+        semantic_candidates = np.array([], dtype=np.int64)
+        if self.vectors is not None and semantic_ratio > 0:
+            _, ids = self.vectors.search(vector.reshape(1, -1), candidate_count)
+            semantic_candidates = ids[0][ids[0] >= 0]
+
+        candidates = np.union1d(keyword_candidates, semantic_candidates).astype(np.int64)
+        if filters:
+            candidates = np.array(
+                [i for i in candidates if _match_filters(self.hits[i], filters)],
+                dtype=np.int64,
+            )
+
+        if len(candidates) == 0:
+            return []
+
+        # Meilisearch hybrid와 같이 semantic_ratio로 두 점수를 가중합
+        semantic_scores = np.zeros(len(candidates), dtype=np.float32)
+        if self.vectors is not None:
+            candidate_vectors = self.vectors.reconstruct_batch(candidates)
+            semantic_scores = np.clip((candidate_vectors @ vector + 1) / 2, 0, 1)
+
+        candidate_keyword_scores = keyword_scores[candidates]
+        max_keyword_score = candidate_keyword_scores.max()
+        if max_keyword_score > 0:
+            candidate_keyword_scores = candidate_keyword_scores / max_keyword_score
+
+        combined = (
+            semantic_ratio * semantic_scores
+            + (1 - semantic_ratio) * candidate_keyword_scores
+        )
+
+        results = []
+        for position in np.argsort(-combined)[:k]:
+            hit = dict(self.hits[candidates[position]])
+            hit["_rankingScore"] = float(combined[position])
+            results.append(hit)
+
+        return results
+
+
+def _hit_text(hit: dict[str, Any]) -> str:
+    return hit.get("text") or hit.get("body") or hit.get("summary") or ""
+
+
+def _match_filters(hit: dict[str, Any], filters: dict) -> bool:
+    """단순 equality 필터 ({"field": value} 또는 {"field": [values]})"""
+    for key, expected in filters.items():
+        value = hit.get(key)
+        if isinstance(expected, (list, tuple, set)):
+            if value not in expected:
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+class LocalHybridRepository:
+    """
+    LangChainMeiliRepository와 같은 search / multi_search 계약을 가지는
+    in-process 하이브리드 검색 저장소 (FAISS + BM25).
+
+    인덱스별 디렉터리 구성:
+        {base_dir}/{index_name}/documents.jsonl  Meilisearch에 색인하는 것과 같은 형태의 문서
+        {base_dir}/{index_name}/vectors.faiss    documents.jsonl 순서와 같은 IndexFlatIP
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[str] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        embeddings: Optional[Embeddings] = None,
+        clients: Optional[ClientRegistry] = None,
+    ):
+        self.base_dir = Path(base_dir or settings.LOCAL_INDEX_DIR)
+
+        if embeddings is None:
+            http_kwargs = (
+                {"http_client": clients.openai_sync, "http_async_client": clients.openai_async}
+                if clients is not None
+                else {}
+            )
+            embeddings = OpenAIEmbeddings(
+                model=settings.OPENAI_EMBEDDING_MODEL, **http_kwargs
+            )
+            embeddings.dimensions = 3072
+
+        self.embeddings = embeddings
+
+        if embedding_cache is not None:
+            self.embeddings = CachedEmbeddings(self.embeddings, embedding_cache)
+
+        self._indexes: dict[str, _LocalIndex] = {}
+
+    async def initialize(self, index_list: list[str] = None):
+        """존재하는 로컬 인덱스를 미리 로딩"""
+        targets = index_list or [settings.MEILI_DEFAULT_INDEX]
+        for index_name in targets:
+            index = await asyncio.to_thread(self._get_index, index_name)
+            logger.info(f"Loaded local index '{index_name}' ({len(index.hits)} docs)")
+
+    def _get_index(self, index_name: str) -> _LocalIndex:
+        index = self._indexes.get(index_name)
+        if index is None:
+            index = _LocalIndex(self.base_dir / index_name)
+            self._indexes[index_name] = index
+        return index
+
+    async def get_index_versions(self, index_list: list[str]) -> dict[str, str]:
+        return {uid: self._get_index(uid).version for uid in index_list}
+
+    async def get_index_document_counts(self, index_list: list[str]) -> dict[str, int]:
+        return {uid: len(self._get_index(uid).hits) for uid in index_list}
+
+    async def add_documents(self, index_name: str, hits: list[dict[str, Any]]) -> None:
+        """문서 추가/갱신 (id 기준 upsert) 후 인덱스 파일 재작성"""
+        index = self._get_index(index_name)
+
+        merged: dict[Any, dict[str, Any]] = {hit.get("id"): hit for hit in index.hits}
+        merged.update({hit.get("id"): hit for hit in hits})
+        all_hits = list(merged.values())
+
+        vectors = await self.embeddings.aembed_documents(
+            [_hit_text(hit) for hit in all_hits]
+        )
+        matrix = np.asarray(vectors, dtype=np.float32)
+        faiss.normalize_L2(matrix)
+
+        await asyncio.to_thread(self._write_index, index_name, all_hits, matrix)
+
+        # 새 파일로 다시 로딩
+        self._indexes.pop(index_name, None)
+        self._get_index(index_name)
+
+    def _write_index(
+        self, index_name: str, hits: list[dict[str, Any]], matrix: np.ndarray
+    ) -> None:
+        path = self.base_dir / index_name
+        path.mkdir(parents=True, exist_ok=True)
+
+        flat_index = faiss.IndexFlatIP(matrix.shape[1])
+        flat_index.add(matrix)
+
+        # 임시 파일에 쓴 뒤 교체 (읽는 중인 mmap 보호)
+        faiss.write_index(flat_index, str(path / f"{VECTORS_FILE}.tmp"))
+        with open(path / f"{DOCUMENTS_FILE}.tmp", "w", encoding="utf-8") as f:
+            for hit in hits:
+                f.write(json.dumps(hit, ensure_ascii=False) + "\n")
+
+        os.replace(path / f"{VECTORS_FILE}.tmp", path / VECTORS_FILE)
+        os.replace(path / f"{DOCUMENTS_FILE}.tmp", path / DOCUMENTS_FILE)
+
+    async def _embed(self, queries: list[str]) -> list[np.ndarray]:
+        vectors = await self.embeddings.aembed_documents(queries)
+        result = []
+        for vector in vectors:
+            array = np.asarray(vector, dtype=np.float32)
+            norm = np.linalg.norm(array)
+            result.append(array / norm if norm else array)
+        return result
+
+    async def search(
+        self,
+        query: str,
+        index_name: Optional[str] = None,
+        k: int = 3,
+        semantic_ratio: float = 0.5,
+        filters: Optional[dict] = None,
+    ) -> list[Document]:
+        """단일 쿼리, 단일 인덱스 검색"""
+        results = await self.multi_search(
+            [
+                {
+                    "index_name": index_name or settings.MEILI_DEFAULT_INDEX,
+                    "query": query,
+                    "k": k,
+                    "semantic_ratio": semantic_ratio,
+                    "filter": filters,
+                }
+            ]
+        )
+        return results[0]
+
+    async def multi_search(
+        self, search_requests: list[dict[str, Any]]
+    ) -> list[list[Document]]:
+        """다중 쿼리, 다중 인덱스 검색"""
+
+        if not search_requests:
+            return []
+
+        vectors = await self._embed([req["query"] for req in search_requests])
+
+        def run_all() -> list[list[dict[str, Any]]]:
+            return [
+                self._get_index(req["index_name"]).search(
+                    query=req["query"],
+                    vector=vector,
+                    k=req.get("k", 5),
+                    semantic_ratio=req.get("semantic_ratio", 0.5),
+                    filters=req.get("filter"),
+                )
+                for req, vector in zip(search_requests, vectors)
+            ]
+
+        hit_sets = await asyncio.to_thread(run_all)
+
+        return [[hit_to_document(hit) for hit in hits] for hits in hit_sets]
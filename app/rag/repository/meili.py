@@ -7,7 +7,9 @@ from langchain_openai import OpenAIEmbeddings
 from meilisearch_python_sdk import AsyncClient
 from meilisearch_python_sdk.models.search import Hybrid, SearchParams
 
+from app.core.clients import ClientRegistry
 from app.core.config import settings
+from app.rag.cache.embedding import CachedEmbeddings, EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
@@ -15,14 +17,85 @@ logger = logging.getLogger(__name__)
 embedding_semaphore = asyncio.Semaphore(10)
 
 
+def hit_to_document(hit: dict[str, Any]) -> Document:
+    """검색 hit -> Document (본문은 page_content, 나머지 필드는 metadata)"""
+    content = hit.get("text") or hit.get("body") or hit.get("summary") or ""
+
+    excluded_keys = [
+        "text",
+        "body",
+        "_vectors",
+        "_semantics",
+        "_formatted",
+    ]
+    metadata = {k: v for k, v in hit.items() if k not in excluded_keys}
+
+    return Document(page_content=content, metadata=metadata)
+
+
+# 1단계(light) 검색에서 가져올 필드. 본문 / 커밋 메시지 / 변경 파일 목록 등 큰 필드는 제외
+LIGHT_ATTRIBUTES = [
+    # 공통
+    "id", "source_type", "owner", "repo", "html_url",
+    # Code
+    "file_path", "chunk_number", "category", "language", "branch",
+    # PR
+    "pr_number", "title", "state", "author", "base_branch", "head_branch",
+    "created_at", "updated_at", "merged_at", "closed_at", "additions", "deletions",
+    "labels", "milestone",
+    # Jira
+    "summary", "project_name", "project_key", "self_url", "issue_type_name",
+    "status_id", "priority_id", "assignee_name", "reporter_name",
+    "resolution_date", "parent_key", "parent_summary",
+]
+
+# 1단계 검색에서 잘라서(_formatted) 받을 본문 필드 (rerank용 snippet)
+SNIPPET_ATTRIBUTES = ["text", "body", "description"]
+
+
+def light_hit_to_document(hit: dict[str, Any]) -> Document:
+    """1단계 검색 hit -> Document (본문은 snippet, rerank 이후 hydrate 필요)"""
+    formatted = hit.get("_formatted") or {}
+    content = (
+        formatted.get("text")
+        or formatted.get("body")
+        or formatted.get("description")
+        or hit.get("summary")
+        or ""
+    )
+
+    metadata = {k: v for k, v in hit.items() if not k.startswith("_")}
+    metadata["_partial"] = True
+
+    return Document(page_content=content, metadata=metadata)
+
+
 class LangChainMeiliRepository:
-    def __init__(self):
-        self.embeddings = OpenAIEmbeddings(model=settings.OPENAI_EMBEDDING_MODEL)
+    def __init__(
+        self,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        clients: Optional[ClientRegistry] = None,
+    ):
+        http_kwargs = (
+            {"http_client": clients.openai_sync, "http_async_client": clients.openai_async}
+            if clients is not None
+            else {}
+        )
+        self.embeddings = OpenAIEmbeddings(
+            model=settings.OPENAI_EMBEDDING_MODEL, **http_kwargs
+        )
 
         self.embeddings.dimensions = 3072
 
-        self.client = AsyncClient(
-            settings.MEILI_HTTP_ADDR, settings.MEILI_KEY, timeout=30
+        # 쿼리 임베딩 캐시 (retry, 반복 질문 시 OpenAI 호출 생략)
+        if embedding_cache is not None:
+            self.embeddings = CachedEmbeddings(self.embeddings, embedding_cache)
+
+        # lifespan에서 관리하는 pooled client 우선 사용
+        self.client = (
+            clients.meili
+            if clients is not None
+            else AsyncClient(settings.MEILI_HTTP_ADDR, settings.MEILI_KEY, timeout=30)
         )
 
     async def initialize(self, index_list: list[str] = None):
@@ -74,6 +147,33 @@ class LangChainMeiliRepository:
 
             logger.info(f"embedders: {await index.get_embedders()}")
 
+    async def get_index_versions(self, index_list: list[str]) -> dict[str, str]:
+        """인덱스별 마지막 갱신 시각(updatedAt). 조회 실패한 인덱스는 빈 문자열."""
+        indexes = await asyncio.gather(
+            *(self.client.get_index(uid) for uid in index_list),
+            return_exceptions=True,
+        )
+
+        versions = {}
+        for uid, index in zip(index_list, indexes):
+            if isinstance(index, Exception):
+                logger.warning(f"Failed to get index version for '{uid}': {index}")
+                versions[uid] = ""
+            else:
+                versions[uid] = str(index.updated_at or "")
+
+        return versions
+
+    async def get_index_document_counts(self, index_list: list[str]) -> dict[str, int]:
+        """인덱스별 문서 수. 존재하지 않는 인덱스는 0."""
+        stats = await self.client.get_all_stats()
+        indexes = stats.indexes or {}
+
+        return {
+            uid: indexes[uid].number_of_documents if uid in indexes else 0
+            for uid in index_list
+        }
+
     async def search(
         self,
         query: str,
@@ -153,27 +253,33 @@ class LangChainMeiliRepository:
             if req.get("filter"):
                 search_query.filter = req.get("filter")
 
+            # 2단계 검색: 식별/랭킹 필드와 본문 snippet만 전송받음
+            if req.get("light"):
+                search_query.attributes_to_retrieve = LIGHT_ATTRIBUTES
+                search_query.attributes_to_crop = SNIPPET_ATTRIBUTES
+                search_query.crop_length = settings.RETRIEVAL_SNIPPET_CROP_LENGTH
+                search_query.retrieve_vectors = False
+
             multisearch_queries.append(search_query)
 
         response = await self.client.multi_search(multisearch_queries)
 
         all_results = []
 
-        for result_set in response:
-            docs = []
-            for hit in result_set.hits:
-                content = hit.get("text") or hit.get("body") or hit.get("summary") or ""
-
-                excluded_keys = [
-                    "text",
-                    "body",
-                    "_vectors",
-                    "_semantics",
-                    "_formatted",
-                ]
-                metadata = {k: v for k, v in hit.items() if k not in excluded_keys}
-
-                docs.append(Document(page_content=content, metadata=metadata))
+        for req, result_set in zip(search_requests, response):
+            to_document = light_hit_to_document if req.get("light") else hit_to_document
+            docs = [to_document(hit) for hit in result_set.hits]
             all_results.append(docs)
 
-        return all_results
\ No newline at end of file
+        return all_results
+
+    async def get_documents(self, index_name: str, ids: list[str | int]) -> list[Document]:
+        """id 목록으로 전체 문서 일괄 조회 (2단계 검색의 hydrate 단계)"""
+        if not ids:
+            return []
+
+        result = await self.client.index(index_name).get_documents(
+            ids=[str(doc_id) for doc_id in ids], limit=len(ids)
+        )
+
+        return [hit_to_document(hit) for hit in result.results]
\ No newline at end of file
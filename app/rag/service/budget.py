@@ -0,0 +1,243 @@
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Optional
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# 인덱스별 누적 지표
+_FIELDS = ("retrieved", "survived", "cited")
+
+# 이력이 없을 때 가정하는 유효 문서 비율 (survived + cited) / retrieved
+_DEFAULT_PRIOR = 0.3
+
+
+class RetrievalBudgetAllocator:
+    """
+    전체 검색 예산(MEILISEARCH_GLOBAL_RETRIEVAL_BUDGET)을 검색 요청별 k로 나눈다.
+
+    - 모든 요청에 min_k를 보장하고, 남는 예산을 요청 점수에 비례해 분배 (합계는 예산과 동일)
+    - 점수 = 계획 가중치 x 인덱스 유효 비율 x log(인덱스 문서 수)
+    - 유효 비율: 검색된 문서 중 rerank 이후 살아남거나 인용된 비율 (이력이 적으면 전체 평균 쪽으로 보정)
+    - 문서 수(Meilisearch stats)와 누적 지표는 백그라운드에서 주기적으로 갱신하고 Redis에 저장
+    """
+
+    def __init__(
+        self,
+        document_count_loader: Callable[[list[str]], Awaitable[dict[str, int]]],
+        redis_client: Optional[Redis] = None,
+        refresh_interval_seconds: float = 300.0,
+        prior_strength: float = 20.0,
+        namespace: str = "stats:retrieval_budget",
+    ):
+        self.document_count_loader = document_count_loader
+        self.redis = redis_client
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.prior_strength = prior_strength
+        self.namespace = namespace
+
+        self._doc_counts: dict[str, int] = {}
+        # Redis에 반영된 누적 지표 / 아직 반영하지 않은 증분
+        self._totals: defaultdict[str, dict[str, int]] = defaultdict(lambda: dict.fromkeys(_FIELDS, 0))
+        self._pending: defaultdict[str, dict[str, int]] = defaultdict(lambda: dict.fromkeys(_FIELDS, 0))
+
+        self._known_indices: set[str] = set()
+        self._refresh_requested = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.allocations = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.last_refresh_at: Optional[float] = None
+
+    def allocate(
+        self,
+        requests: list[tuple[str, float]],
+        total_budget: int,
+        min_k: int,
+    ) -> list[int]:
+        """(index_name, 계획 가중치) 목록 -> 요청별 k"""
+        if not requests:
+            return []
+
+        self.allocations += 1
+        self._track([index_name for index_name, _ in requests])
+
+        spare = total_budget - min_k * len(requests)
+        if spare <= 0:
+            return [min_k] * len(requests)
+
+        scores = [max(weight, 0.0) * self._index_score(index_name) for index_name, weight in requests]
+        total_score = sum(scores)
+        if total_score <= 0:
+            scores = [1.0] * len(requests)
+            total_score = float(len(requests))
+
+        # 최대 잉여 방식으로 정수 분배 (합계 = total_budget)
+        shares = [spare * score / total_score for score in scores]
+        extra = [int(share) for share in shares]
+        remainder = spare - sum(extra)
+        for i in sorted(range(len(shares)), key=lambda i: shares[i] - extra[i], reverse=True)[:remainder]:
+            extra[i] += 1
+
+        return [min_k + e for e in extra]
+
+    def record_retrieved(self, counts: dict[str, int]) -> None:
+        self._add("retrieved", counts)
+
+    def record_outcome(self, survived: dict[str, int], cited: dict[str, int]) -> None:
+        self._add("survived", survived)
+        self._add("cited", cited)
+
+    def _add(self, field: str, counts: dict[str, int]) -> None:
+        for index_name, count in counts.items():
+            if index_name:
+                self._pending[index_name][field] += count
+
+    def _track(self, index_list: list[str]) -> None:
+        new_indices = set(index_list) - self._known_indices
+        if new_indices:
+            self._known_indices.update(new_indices)
+            self._refresh_requested.set()
+
+    def _history(self, index_name: str) -> dict[str, int]:
+        totals = self._totals.get(index_name, {})
+        pending = self._pending.get(index_name, {})
+        return {f: totals.get(f, 0) + pending.get(f, 0) for f in _FIELDS}
+
+    def _prior(self) -> float:
+        retrieved = useful = 0
+        for index_name in self._totals.keys() | self._pending.keys():
+            history = self._history(index_name)
+            retrieved += history["retrieved"]
+            useful += history["survived"] + history["cited"]
+        return useful / retrieved if retrieved else _DEFAULT_PRIOR
+
+    def _index_score(self, index_name: str) -> float:
+        history = self._history(index_name)
+        useful = history["survived"] + history["cited"]
+
+        # 이력이 적은 인덱스는 전체 평균 비율에 가깝게 보정
+        utility = (useful + self.prior_strength * self._prior()) / (
+            history["retrieved"] + self.prior_strength
+        )
+
+        # 문서 수를 아직 모르면 중립값, 빈 인덱스는 min_k만 받음
+        doc_count = self._doc_counts.get(index_name)
+        size = math.log1p(doc_count) if doc_count is not None else self._mean_log_size()
+
+        return utility * size
+
+    def _mean_log_size(self) -> float:
+        if not self._doc_counts:
+            return 1.0
+        return sum(math.log1p(c) for c in self._doc_counts.values()) / len(self._doc_counts)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        # 남은 증분 저장
+        await self.refresh()
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._refresh_requested.wait(), timeout=self.refresh_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            self._refresh_requested.clear()
+            await self.refresh()
+
+    async def refresh(self) -> None:
+        """인덱스 문서 수 조회 + 누적 지표를 Redis와 동기화"""
+        try:
+            if self._known_indices:
+                self._doc_counts.update(
+                    await self.document_count_loader(sorted(self._known_indices))
+                )
+
+            await self._sync_history()
+
+            self.refreshes += 1
+            self.last_refresh_at = time.time()
+
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning(f"Retrieval budget 통계 갱신 실패: {e}")
+
+    async def _sync_history(self) -> None:
+        # 대기 중 쌓이는 증분은 다음 동기화에 반영
+        pending, self._pending = self._pending, defaultdict(lambda: dict.fromkeys(_FIELDS, 0))
+
+        if self.redis is None:
+            for index_name, counts in pending.items():
+                for f, value in counts.items():
+                    self._totals[index_name][f] += value
+            return
+
+        indices = sorted(self._known_indices | pending.keys())
+        try:
+            # 여러 서버 인스턴스가 같은 통계를 공유하도록 증분만 더함
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for index_name, counts in pending.items():
+                    for f, value in counts.items():
+                        if value:
+                            pipe.hincrby(self._key(index_name), f, value)
+                for index_name in indices:
+                    pipe.hgetall(self._key(index_name))
+                results = await pipe.execute()
+        except Exception:
+            # 실패한 증분은 다음 동기화 때 다시 시도
+            for index_name, counts in pending.items():
+                for f, value in counts.items():
+                    self._pending[index_name][f] += value
+            raise
+
+        for index_name, stored in zip(indices, results[-len(indices):] if indices else []):
+            self._totals[index_name] = {
+                f: int(stored.get(f.encode(), stored.get(f, 0)) or 0) for f in _FIELDS
+            }
+
+    def _key(self, index_name: str) -> str:
+        return f"{self.namespace}:{index_name}"
+
+    def stats(self) -> dict[str, Any]:
+        indices = {}
+        for index_name in sorted(self._known_indices | self._totals.keys()):
+            history = self._history(index_name)
+            indices[index_name] = {
+                "documents": self._doc_counts.get(index_name),
+                **history,
+                "survival_rate": (
+                    round(history["survived"] / history["retrieved"], 4)
+                    if history["retrieved"]
+                    else None
+                ),
+                "score": round(self._index_score(index_name), 4),
+            }
+
+        return {
+            "allocations": self.allocations,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "last_refresh_at": self.last_refresh_at,
+            "indices": indices,
+        }
@@ -1,20 +1,32 @@
 import asyncio
 import logging
 import time
-from typing import AsyncGenerator, Any
+from typing import AsyncGenerator, Any, Optional
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage
 from langgraph.types import Command
 from langfuse import observe
 from requests import session
 
-from app.rag.factory import get_vector_repository
+from app.core.config import settings
+from app.rag.cache.answer import AnswerCacheEntry
+from app.rag.factory import (
+    get_answer_cache,
+    get_checkpointer,
+    get_conversation_summarizer,
+    get_vector_repository,
+)
 from app.rag.graph import get_compiled_graph
 from app.rag.models.dto import (
+    BaseSource,
     ChatResponse,
+    ChatStreamingCitationResponse,
     ChatStreamingFinalResponse,
+    ChatStreamingJiraResponse,
     ChatStreamingKeepAliveResponse,
     ChatStreamingResponse,
+    ChatStreamingSourcesResponse,
+    ChatStreamingTokenResponse,
     ChatStreamingInterruptResponse,
     JiraSource
 )
@@ -24,6 +36,7 @@ logger = logging.getLogger(__name__)
 
 NODE_STATUS_MAP = {
     "router": "질문을 분석하고 있습니다...",
+    "analyze": "질문을 분석하고 검색 계획을 수립하고 있습니다...",
     "rewrite": "질문을 최적화하고 있습니다...",
     "chitchat": "답변을 생성하고 있습니다...",
     "plan": "검색 계획을 수립하고 있습니다...",
@@ -34,13 +47,49 @@ NODE_STATUS_MAP = {
     "generate": "최종 답변을 생성하고 있습니다...",
 }
 
+# 토큰 delta를 스트리밍하는 답변 노드
+ANSWER_NODES = ("generate", "chitchat")
+
+
+class TokenCoalescer:
+    """LLM 토큰을 모아서 일정 길이 / 일정 시간마다 한 번에 내보낸다. (SSE frame 수 절감)"""
+
+    def __init__(self, min_chars: int, max_interval_seconds: float):
+        self.min_chars = min_chars
+        self.max_interval_seconds = max_interval_seconds
+        self._buffer: list[str] = []
+        self._size = 0
+        self._last_flush = time.perf_counter()
+
+    def add(self, token: str) -> Optional[str]:
+        self._buffer.append(token)
+        self._size += len(token)
+
+        if (
+            self._size >= self.min_chars
+            or time.perf_counter() - self._last_flush >= self.max_interval_seconds
+        ):
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        if not self._buffer:
+            return None
+
+        delta = "".join(self._buffer)
+        self._buffer.clear()
+        self._size = 0
+        self._last_flush = time.perf_counter()
+        return delta
+
 
 class ChatService:
     # Compiled Graph
     _app = None
 
     def __init__(self):
-        pass
+        # 응답 이후 수행하는 작업(answer cache 저장 등) 참조 유지
+        self._background_tasks: set[asyncio.Task] = set()
 
     async def _get_app(self):
         # 싱글톤
@@ -63,7 +112,33 @@ class ChatService:
         config = {"configurable": {"thread_id": session_id}}
 
         start = time.perf_counter()
-        final_state = await app.ainvoke(inputs, config)
+
+        self._cancel_summary(session_id)
+
+        # Answer cache 조회
+        query_embedding, cached = await self._lookup_answer_cache(
+            app, config, query, index_list
+        )
+        if cached is not None:
+            await self._record_cached_turn(app, config, query, index_list, cached)
+            self._schedule_summary(app, config)
+            return ChatResponse(
+                answer=cached.answer,
+                sources=cached.sources,
+                process_time=time.perf_counter() - start,
+                cached=True,
+            )
+
+        final_state = await app.ainvoke(
+            inputs, config, durability=settings.CHAT_CHECKPOINT_DURABILITY
+        )
+
+        # write-behind 사용 시에도 resume 요청 전에 interrupt 상태가 저장되어 있어야 함
+        if "__interrupt__" in final_state:
+            await get_checkpointer().flush(session_id)
+        else:
+            self._schedule_summary(app, config)
+
         end = time.perf_counter()
 
         elapsed_time = end - start
@@ -77,6 +152,21 @@ class ChatService:
             else "답변을 생성하지 못했습니다."
         )
 
+        # HITL 인터럽트로 답변 없이 종료된 경우는 저장하지 않음
+        if (
+            query_embedding is not None
+            and isinstance(last_message, AIMessage)
+            and final_state.get("datasource") != "chitchat"
+        ):
+            self._store_answer_cache(
+                query=query,
+                index_list=index_list,
+                embedding=query_embedding,
+                answer=answer_text,
+                sources=sources,
+                related_jira_issues=final_state.get("related_jira_issues", []),
+            )
+
         return ChatResponse(
             answer=answer_text, sources=sources, process_time=elapsed_time
         )
@@ -88,7 +178,8 @@ class ChatService:
         query: str = None,
         role: str = "user",
         index_list: list[str] = None,
-        resume_data: Any = None
+        resume_data: Any = None,
+        stream_tokens: bool = False,
     ) -> AsyncGenerator[dict, None]:
         # Compiled Graph
         app = await self._get_app()
@@ -113,10 +204,70 @@ class ChatService:
         # 마지막으로 Ping 보낸 시각
         last_ping_time = time.perf_counter()
 
+        # 첫 답변 토큰까지의 시간 (TTFT)
+        first_token_time = None
+
+        # search_related_jira 노드 결과 (이번 스트림에서 관찰하지 못한 경우 None)
+        related_jira_issues: Optional[list[JiraSource]] = None
+
+        # 실행 중인 그래프 노드 (interrupt 발생 노드 판별용)
+        active_nodes: dict[str, None] = {}
+        interrupts = None
+        answered = False
+
+        coalescer = TokenCoalescer(
+            min_chars=settings.STREAM_TOKEN_COALESCE_CHARS,
+            max_interval_seconds=settings.STREAM_TOKEN_COALESCE_INTERVAL_SECONDS,
+        )
+
+        self._cancel_summary(session_id)
+
         try:
-            async for event in app.astream_events(inputs, config, version="v2"):
+            # Answer cache 조회 (resume 요청은 제외)
+            query_embedding = None
+            if resume_data is None:
+                query_embedding, cached = await self._lookup_answer_cache(
+                    app, config, query, index_list
+                )
+                if cached is not None:
+                    await self._record_cached_turn(
+                        app, config, query, index_list, cached
+                    )
+                    self._schedule_summary(app, config)
+                    yield ChatStreamingFinalResponse(
+                        session_id=session_id,
+                        type="result",
+                        node="generate",
+                        answer=cached.answer,
+                        sources=cached.sources,
+                        related_jira_issues=cached.related_jira_issues,
+                        process_time=time.perf_counter() - start,
+                        cached=True,
+                    ).model_dump()
+                    return
+
+            async for event in app.astream_events(
+                inputs,
+                config,
+                version="v2",
+                durability=settings.STREAM_CHECKPOINT_DURABILITY,
+            ):
                 kind = event["event"]  # 이벤트 종류
                 name = event["name"]  # 이벤트 이름
+                is_graph_node = event["metadata"].get("langgraph_node") == name
+
+                if is_graph_node and kind == "on_chain_start":
+                    active_nodes[name] = None
+                elif is_graph_node and kind == "on_chain_end":
+                    active_nodes.pop(name, None)
+
+                # 그래프 최상위 stream에 interrupt가 실려 옴
+                if (
+                    kind == "on_chain_stream"
+                    and not event.get("parent_ids")
+                    and "__interrupt__" in (chunk := event["data"].get("chunk") or {})
+                ):
+                    interrupts = chunk["__interrupt__"]
 
                 # 각 노드에 진입할 때마다 반환
                 if kind == "on_chain_start" and name in NODE_STATUS_MAP:
@@ -127,15 +278,29 @@ class ChatService:
                         message=NODE_STATUS_MAP[name]
                     ).model_dump()
 
-                # Keep-alive
+                # 답변 토큰 (token delta 혹은 keep-alive)
                 elif (
                     kind == "on_chat_model_stream"
-                    and event["metadata"].get("langgraph_node") == "generate"
+                    and (node := event["metadata"].get("langgraph_node")) in ANSWER_NODES
                 ):
                     current_time = time.perf_counter()
+                    token = event["data"]["chunk"].content
+
+                    if first_token_time is None and token:
+                        first_token_time = current_time - start
+                        logger.info(
+                            f"Session {session_id}: TTFT ===> {first_token_time:.4f}s ({node})"
+                        )
+
+                    if stream_tokens:
+                        delta = coalescer.add(token) if isinstance(token, str) and token else None
+                        if delta:
+                            yield ChatStreamingTokenResponse(
+                                session_id=session_id, node=node, delta=delta
+                            ).model_dump()
 
                     # 최소 1초 간격으로 ping을 보냄
-                    if current_time - last_ping_time > 1.0:
+                    elif current_time - last_ping_time > 1.0:
                         yield ChatStreamingKeepAliveResponse(
                                 session_id=session_id,
                                 type="ping"
@@ -143,8 +308,40 @@ class ChatService:
 
                         last_ping_time = current_time
 
+                # rerank 직후 잠정 출처 전송 (grade 후 재검색되면 다시 전송)
+                elif kind == "on_chain_end" and is_graph_node and name == "rerank":
+                    node_output = event["data"].get("output") or {}
+                    yield ChatStreamingSourcesResponse(
+                        session_id=session_id,
+                        sources=[
+                            BaseSource.from_search_result(index=i, doc=doc)
+                            for i, doc in enumerate(
+                                node_output.get("retrieved_docs", []), start=1
+                            )
+                        ],
+                    ).model_dump()
+
+                # 관련 Jira 이슈 전송
+                elif (
+                    kind == "on_chain_end"
+                    and is_graph_node
+                    and name == "search_related_jira"
+                ):
+                    node_output = event["data"].get("output") or {}
+                    related_jira_issues = node_output.get("related_jira_issues", [])
+                    yield ChatStreamingJiraResponse(
+                        session_id=session_id,
+                        related_jira_issues=related_jira_issues,
+                    ).model_dump()
+
                 # generate node 종료 시점에 수행할 작업
-                elif kind == "on_chain_end" and name in ("generate", "chitchat"):
+                elif kind == "on_chain_end" and name in ANSWER_NODES:
+                    # 남은 토큰을 먼저 보낸 뒤 최종 결과 전송
+                    if stream_tokens and (delta := coalescer.flush()):
+                        yield ChatStreamingTokenResponse(
+                            session_id=session_id, node=name, delta=delta
+                        ).model_dump()
+
                     end = time.perf_counter()
                     elapsed_time = end - start
                     
@@ -152,14 +349,27 @@ class ChatService:
                     node_output = event["data"].get("output")
 
                     if node_output:
+                        answered = True
                         last_message = node_output["messages"][-1]
                         answer_text = last_message.content  # 최종 답변
                         sources = node_output.get("sources", [])  # 출처
-                        
-                        snapshot = await app.aget_state(config)
-                        current_state = snapshot.values
-                        related_jira_issues = current_state.get("related_jira_issues", [])  # 관련 Jira 이슈
-                        
+
+                        if name == "chitchat":
+                            related_jira_issues = []
+                        elif related_jira_issues is None:
+                            # resume 요청은 interrupt 이전 요청에서 Jira 검색이 끝나 있음
+                            snapshot = await app.aget_state(config)
+                            related_jira_issues = snapshot.values.get("related_jira_issues", [])
+
+                        if name == "generate":
+                            yield ChatStreamingCitationResponse(
+                                session_id=session_id,
+                                sources=sources,
+                                cited_indices=sorted(
+                                    source.index for source in sources if source.is_cited
+                                ),
+                            ).model_dump()
+
                         yield ChatStreamingFinalResponse(
                             session_id=session_id,
                             type="result",
@@ -169,21 +379,51 @@ class ChatService:
                             related_jira_issues=related_jira_issues,
                             process_time=elapsed_time,
                         ).model_dump()
+
+                        if query_embedding is not None and name == "generate":
+                            self._store_answer_cache(
+                                query=query,
+                                index_list=index_list,
+                                embedding=query_embedding,
+                                answer=answer_text,
+                                sources=sources,
+                                related_jira_issues=related_jira_issues,
+                            )
                         
-            snapshot = await app.aget_state(config)
-                        
-            if snapshot.next and ((payload := snapshot.tasks[0].interrupts) is not None):
-                interrupt_value = payload[0].value
-                
-                logger.info(f"Session {session_id}: Interrupted at {snapshot.next}")
-                
+            if interrupts and len(active_nodes) == 1:
+                interrupted_node = next(iter(active_nodes))
+
+                logger.info(f"Session {session_id}: Interrupted at {interrupted_node}")
+
+                # write-behind 사용 시 resume 요청 전에 interrupt 상태 저장 보장
+                await get_checkpointer().flush(session_id)
+
                 yield ChatStreamingInterruptResponse(
                     session_id=session_id,
                     type="interrupt",
-                    node=list(snapshot.next)[0],
-                    payload=interrupt_value,
+                    node=interrupted_node,
+                    payload=interrupts[0].value,
                 ).model_dump()
 
+            # 이벤트만으로 판별할 수 없는 경우에만 checkpoint 조회
+            elif not answered:
+                snapshot = await app.aget_state(config)
+
+                if snapshot.next and ((payload := snapshot.tasks[0].interrupts) is not None):
+                    interrupt_value = payload[0].value
+
+                    logger.info(f"Session {session_id}: Interrupted at {snapshot.next}")
+
+                    yield ChatStreamingInterruptResponse(
+                        session_id=session_id,
+                        type="interrupt",
+                        node=list(snapshot.next)[0],
+                        payload=interrupt_value,
+                    ).model_dump()
+
+            if answered:
+                self._schedule_summary(app, config)
+
         except asyncio.CancelledError:
             logger.warning("클라이언트 연결이 종료되었습니다.")
             raise
@@ -193,4 +433,97 @@ class ChatService:
 
         finally:
             elapsed_time = time.perf_counter() - start;
-            logger.info(f"Streaming 종료. ===> duration: {elapsed_time:.4f}s")
\ No newline at end of file
+            ttft = f"{first_token_time:.4f}s" if first_token_time is not None else "-"
+            logger.info(
+                f"Streaming 종료. ===> duration: {elapsed_time:.4f}s, TTFT: {ttft}"
+            )
+
+    async def _lookup_answer_cache(
+        self, app, config: dict, query: str, index_list: list[str]
+    ) -> tuple[Optional[list[float]], Optional[AnswerCacheEntry]]:
+        """
+        Answer cache 조회. (쿼리 임베딩, 적중 항목)을 반환한다.
+
+        이전 대화 맥락에 따라 답변이 달라질 수 있으므로 세션의 첫 질문만 대상으로 한다.
+        """
+        if not settings.ANSWER_CACHE_ENABLED or not query or not index_list:
+            return None, None
+
+        try:
+            snapshot = await app.aget_state(config)
+            if snapshot.values.get("messages"):
+                return None, None
+
+            embedding = await get_vector_repository().embeddings.aembed_query(query)
+            entry = await get_answer_cache().lookup(index_list, embedding)
+
+            return embedding, entry
+
+        except Exception as e:
+            logger.warning(f"Answer cache 조회 실패: {e}")
+            return None, None
+
+    async def _record_cached_turn(
+        self,
+        app,
+        config: dict,
+        query: str,
+        index_list: list[str],
+        entry: AnswerCacheEntry,
+    ) -> None:
+        """캐시된 답변을 대화 기록에 남겨 후속 질문이 맥락을 이어갈 수 있도록 함"""
+        await app.aupdate_state(
+            config,
+            {
+                "messages": [HumanMessage(content=query), AIMessage(content=entry.answer)],
+                "index_list": index_list,
+                "datasource": "search_pipeline",
+                "sources": entry.sources,
+                "related_jira_issues": entry.related_jira_issues,
+            },
+            as_node="generate",
+        )
+
+    def _store_answer_cache(
+        self,
+        query: str,
+        index_list: list[str],
+        embedding: list[float],
+        answer: str,
+        sources: list[Any],
+        related_jira_issues: list[Any],
+    ) -> None:
+        """응답 지연에 영향을 주지 않도록 answer cache 저장은 background에서 수행"""
+
+        def to_jsonable(items: list[Any]) -> list[dict[str, Any]]:
+            return [
+                item.model_dump(mode="json") if hasattr(item, "model_dump") else item
+                for item in items
+            ]
+
+        async def store():
+            try:
+                await get_answer_cache().store(
+                    index_list=index_list,
+                    query=query,
+                    embedding=embedding,
+                    answer=answer,
+                    sources=to_jsonable(sources),
+                    related_jira_issues=to_jsonable(related_jira_issues),
+                )
+            except Exception as e:
+                logger.warning(f"Answer cache 저장 실패: {e}")
+
+        task = asyncio.create_task(store())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _schedule_summary(self, app, config: dict) -> None:
+        """턴 종료 후 오래된 대화를 누적 요약에 합침 (background, 응답 지연 없음)"""
+        if settings.CONVERSATION_SUMMARY_ENABLED:
+            get_conversation_summarizer().schedule(app, config)
+
+    def _cancel_summary(self, session_id: str) -> None:
+        # 새 턴의 checkpoint와 경합하지 않도록 같은 세션의 진행 중인 요약 취소
+        if settings.CONVERSATION_SUMMARY_ENABLED:
+            get_conversation_summarizer().cancel(session_id)
@@ -0,0 +1,153 @@
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+import tiktoken
+
+from app.rag.cache.store import LruCache
+from app.rag.models.retrieve import BaseSearchResult
+
+logger = logging.getLogger(__name__)
+
+# 토큰 수 캐시 항목당 대략적인 메모리 사용량
+_COUNT_ENTRY_SIZE = 96
+
+TRUNCATION_MARKER = "\n... (토큰 예산 초과로 이하 생략)"
+
+
+@dataclass
+class PackedContext:
+    text: str
+    documents: list[BaseSearchResult] = field(default_factory=list)
+    packed_tokens: int = 0
+    dropped_tokens: int = 0
+    truncated: bool = False
+    dropped_documents: int = 0
+
+
+class ContextPacker:
+    """
+    검색 문서를 토큰 예산 안에서 relevance 순서대로 LLM context로 패킹한다.
+
+    - 문서별 토큰 수는 tiktoken으로 계산 후 캐싱
+    - 예산을 넘는 마지막 문서는 남은 토큰만큼 잘라서 포함 (min_tail_tokens 미만이면 제외)
+    - 반환된 documents의 순서가 곧 context의 [번호]이므로 source 번호와 항상 일치
+    """
+
+    def __init__(
+        self,
+        model: str,
+        min_tail_tokens: int = 200,
+        cache_max_bytes: int = 4 * 1024 * 1024,
+    ):
+        try:
+            self.encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self.encoding = tiktoken.get_encoding("o200k_base")
+
+        self.min_tail_tokens = min_tail_tokens
+        self._token_counts = LruCache(max_bytes=cache_max_bytes)
+
+        self.calls = 0
+        self.total_packed_tokens = 0
+        self.total_dropped_tokens = 0
+        self.truncated_documents = 0
+        self.dropped_documents = 0
+
+    def count_tokens(self, text: str) -> int:
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        count = self._token_counts.get(key)
+
+        if count is None:
+            count = len(self.encoding.encode(text, disallowed_special=()))
+            self._token_counts.set(key, count, size=_COUNT_ENTRY_SIZE)
+
+        return count
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        marker_tokens = len(self.encoding.encode(TRUNCATION_MARKER))
+        tokens = self.encoding.encode(text, disallowed_special=())
+        return (
+            self.encoding.decode(tokens[: max(0, max_tokens - marker_tokens)])
+            + TRUNCATION_MARKER
+        )
+
+    def pack(self, documents: list[BaseSearchResult], token_budget: int) -> PackedContext:
+        self.calls += 1
+
+        # relevance 순서 (동점이면 기존 순서 유지)
+        ordered = sorted(
+            documents, key=lambda doc: doc.relevance_score or 0.0, reverse=True
+        )
+
+        parts: list[str] = []
+        packed_docs: list[BaseSearchResult] = []
+        packed_tokens = 0
+        dropped_tokens = 0
+        exhausted = False
+        truncated = False
+
+        # 문서 사이 구분자("\n\n") 토큰
+        separator_tokens = 1
+
+        for doc in ordered:
+            index = len(packed_docs) + 1
+            text = doc.to_context_text(index=index)
+            tokens = self.count_tokens(text)
+            remaining = token_budget - packed_tokens - (separator_tokens if parts else 0)
+
+            # 예산이 이미 소진된 이후 문서는 제외
+            if exhausted or remaining <= 0:
+                dropped_tokens += tokens
+                continue
+
+            if tokens <= remaining:
+                parts.append(text)
+                packed_docs.append(doc)
+                packed_tokens += tokens + (separator_tokens if len(parts) > 1 else 0)
+                continue
+
+            # 마지막 문서는 남은 예산만큼만 포함
+            if remaining >= self.min_tail_tokens:
+                parts.append(self._truncate(text, remaining))
+                packed_docs.append(doc)
+                packed_tokens += remaining
+                dropped_tokens += tokens - remaining
+                self.truncated_documents += 1
+                truncated = True
+            else:
+                dropped_tokens += tokens
+
+            exhausted = True
+
+        dropped_count = len(ordered) - len(packed_docs)
+
+        self.total_packed_tokens += packed_tokens
+        self.total_dropped_tokens += dropped_tokens
+        self.dropped_documents += dropped_count
+
+        logger.info(
+            f"Context packing: {len(packed_docs)}/{len(ordered)}개 문서, "
+            f"{packed_tokens} tokens 포함, {dropped_tokens} tokens 제외 "
+            f"(budget: {token_budget})"
+        )
+
+        return PackedContext(
+            text="\n\n".join(parts),
+            documents=packed_docs,
+            packed_tokens=packed_tokens,
+            dropped_tokens=dropped_tokens,
+            truncated=truncated,
+            dropped_documents=dropped_count,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "packed_tokens": self.total_packed_tokens,
+            "dropped_tokens": self.total_dropped_tokens,
+            "truncated_documents": self.truncated_documents,
+            "dropped_documents": self.dropped_documents,
+            "token_count_cache": self._token_counts.stats(),
+        }
@@ -0,0 +1,242 @@
+import hashlib
+import logging
+import math
+import re
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Any, Callable
+
+from app.rag.cache.embedding import normalize_text
+from app.rag.cache.store import LruCache
+from app.rag.models.pr_base import PRFileContext
+from app.rag.text import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+# 리뷰/답변에 거의 도움이 되지 않는 변경 파일 (lockfile, 생성 코드, 번들 등)
+NOISE_PATH_PATTERNS = [
+    "*package-lock.json",
+    "*yarn.lock",
+    "*pnpm-lock.yaml",
+    "*poetry.lock",
+    "*Pipfile.lock",
+    "*uv.lock",
+    "*Cargo.lock",
+    "*go.sum",
+    "*composer.lock",
+    "*Gemfile.lock",
+    "*gradle.lockfile",
+    "*.min.js",
+    "*.min.css",
+    "*.map",
+    "*.snap",
+    "*_pb2.py",
+    "*_pb2_grpc.py",
+    "*.pb.go",
+    "*.generated.*",
+    "*.svg",
+    "dist/*",
+    "build/*",
+    "*/dist/*",
+    "*/build/*",
+    "vendor/*",
+    "*/vendor/*",
+    "node_modules/*",
+    "*/node_modules/*",
+    "*/__snapshots__/*",
+]
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+OMITTED_PATCH = "(변경 내용 생략)"
+
+
+def is_noise_path(path: str) -> bool:
+    return any(fnmatch(path, pattern) for pattern in NOISE_PATH_PATTERNS)
+
+
+@dataclass
+class _Hunk:
+    file_index: int
+    order: int
+    text: str
+    old_start: int
+    old_end: int
+    new_start: int
+    new_end: int
+    score: float = 0.0
+    has_comment: bool = False
+    tokens: int = 0
+
+
+def split_hunks(patch: str) -> list[tuple[str, int, int, int, int]]:
+    """patch -> [(hunk text, old_start, old_end, new_start, new_end)]"""
+    hunks: list[tuple[str, int, int, int, int]] = []
+    current: list[str] = []
+    old_start, old_end, new_start, new_end = 0, 0, 0, 0
+
+    for line in patch.splitlines():
+        match = _HUNK_HEADER.match(line)
+        if match:
+            if current:
+                hunks.append(("\n".join(current), old_start, old_end, new_start, new_end))
+            old_start = int(match.group(1))
+            old_end = old_start + int(match.group(2) or 1)
+            new_start = int(match.group(3))
+            new_end = new_start + int(match.group(4) or 1)
+            current = [line]
+        else:
+            current.append(line)
+
+    if current:
+        hunks.append(("\n".join(current), old_start, old_end, new_start, new_end))
+
+    return hunks
+
+
+class DiffCondenser:
+    """
+    PR file_context의 diff를 hunk 단위로 나누고, 현재 질문과 관련 있는 hunk만
+    PR당 토큰 상한 안에서 남긴다.
+
+    - noise 경로(lockfile, 생성 코드 등)의 diff는 제외
+    - 리뷰 코멘트가 달린 hunk를 먼저 선택 (토큰 상한을 넘으면 코멘트 hunk도 제외될 수 있음)
+    - 나머지는 질문과의 lexical overlap 점수 순으로 포함
+    - (PR, 변경 파일 버전, 정규화된 질문) 단위로 결과 캐싱
+    """
+
+    def __init__(
+        self,
+        token_counter: Callable[[str], int],
+        token_cap: int,
+        cache_max_bytes: int = 16 * 1024 * 1024,
+    ):
+        self.count_tokens = token_counter
+        self.token_cap = token_cap
+        self._cache = LruCache(max_bytes=cache_max_bytes)
+
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    @staticmethod
+    def _version(files: list[PRFileContext]) -> str:
+        """변경 파일 blob SHA 기반의 PR 내용 버전 (head가 바뀌면 달라짐)"""
+        raw = "|".join(f"{f.path}:{f.sha or len(f.patch or '')}" for f in files)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def condense(
+        self,
+        owner: str,
+        repo: str,
+        pr_number: int,
+        files: list[PRFileContext],
+        query: str,
+    ) -> list[PRFileContext]:
+        if not files:
+            return files
+
+        self.calls += 1
+
+        key = hashlib.sha256(
+            f"{owner}/{repo}#{pr_number}|{self._version(files)}|{normalize_text(query)}".encode(
+                "utf-8"
+            )
+        ).hexdigest()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return [f.model_copy(deep=True) for f in cached]
+
+        condensed = self._condense(files, query)
+
+        size = sum(len(f.patch or "") for f in condensed) + 256 * len(condensed)
+        self._cache.set(key, condensed, size=size)
+
+        return [f.model_copy(deep=True) for f in condensed]
+
+    def _condense(self, files: list[PRFileContext], query: str) -> list[PRFileContext]:
+        query_tokens = set(tokenize(query))
+
+        hunks: list[_Hunk] = []
+        input_tokens = 0
+
+        for file_index, fc in enumerate(files):
+            if not fc.patch or is_noise_path(fc.path):
+                continue
+
+            path_bonus = len(query_tokens & set(tokenize(fc.path)))
+            # line은 변경 후 파일, original_line은 변경 전 파일 기준 라인 번호
+            new_lines = {c.line for c in fc.comments if c.line is not None}
+            old_lines = {c.original_line for c in fc.comments if c.original_line is not None}
+
+            for order, (text, old_start, old_end, new_start, new_end) in enumerate(
+                split_hunks(fc.patch)
+            ):
+                hunk_tokens = tokenize(text)
+                overlap = len(query_tokens & set(hunk_tokens))
+
+                hunk = _Hunk(
+                    file_index=file_index,
+                    order=order,
+                    text=text,
+                    old_start=old_start,
+                    old_end=old_end,
+                    new_start=new_start,
+                    new_end=new_end,
+                    # 긴 hunk가 유리하지 않도록 길이로 보정
+                    score=(overlap + 0.5 * path_bonus) / math.log2(2 + len(hunk_tokens)),
+                    has_comment=(
+                        any(new_start <= line < new_end for line in new_lines)
+                        or any(old_start <= line < old_end for line in old_lines)
+                    ),
+                    tokens=self.count_tokens(text),
+                )
+                input_tokens += hunk.tokens
+                hunks.append(hunk)
+
+        # 코멘트가 달린 hunk -> 점수 높은 hunk 순서로 토큰 상한까지 선택
+        ranked = sorted(
+            hunks, key=lambda h: (h.has_comment, h.score), reverse=True
+        )
+
+        selected: list[_Hunk] = []
+        used_tokens = 0
+        for hunk in ranked:
+            if used_tokens + hunk.tokens > self.token_cap:
+                continue
+            selected.append(hunk)
+            used_tokens += hunk.tokens
+
+        # 파일별로 원래 순서대로 diff 재구성
+        selected_by_file: dict[int, list[_Hunk]] = {}
+        for hunk in selected:
+            selected_by_file.setdefault(hunk.file_index, []).append(hunk)
+
+        condensed: list[PRFileContext] = []
+        for file_index, fc in enumerate(files):
+            file_hunks = sorted(selected_by_file.get(file_index, []), key=lambda h: h.order)
+            patch = "\n".join(h.text for h in file_hunks) if file_hunks else OMITTED_PATCH
+            if not fc.patch:
+                patch = fc.patch
+
+            condensed.append(fc.model_copy(update={"patch": patch}))
+
+        self.input_tokens += input_tokens
+        self.output_tokens += used_tokens
+
+        logger.info(
+            f"Diff 압축: hunk {len(selected)}/{len(hunks)}개, "
+            f"{input_tokens} -> {used_tokens} tokens (cap: {self.token_cap})"
+        )
+
+        return condensed
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache": self._cache.stats(),
+        }
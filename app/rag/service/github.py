@@ -2,16 +2,39 @@ import asyncio
 import logging
 import httpx
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from app.core.config import settings
+from app.rag.cache.pr_context import PrContextCache, PrContextEntry
 from app.rag.models.pr_base import PRFileContext
 
 logger = logging.getLogger(__name__)
 
 
+# 캐시에 저장할 GitHub 응답 필드 (_merge_files_and_comments에서 사용하는 것만)
+_FILE_FIELDS = ("filename", "status", "patch", "previous_filename", "additions", "deletions", "sha")
+_COMMENT_FIELDS = ("id", "path", "body", "created_at", "diff_hunk", "line", "original_line")
+
+
+def _slim_file(file: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: file.get(key) for key in _FILE_FIELDS if key in file}
+
+
+def _slim_comment(comment: Dict[str, Any]) -> Dict[str, Any]:
+    slim = {key: comment.get(key) for key in _COMMENT_FIELDS}
+    user = comment.get("user")
+    slim["user"] = {"login": user["login"]} if user else None
+    return slim
+
+
 class GithubService:
-    def __init__(self):
+    def __init__(
+            self,
+            cache: Optional[PrContextCache] = None,
+            fresh_seconds: float = 60.0,
+            max_stale_seconds: float = 24 * 60 * 60,
+            client: Optional[httpx.AsyncClient] = None,
+    ):
         self.token = settings.GITHUB_TOKEN
         self.base_url = settings.GITHUB_BASE_URL
         self.headers = {
@@ -20,38 +43,149 @@ class GithubService:
             "Accept": "application/vnd.github.v3+json",
         }
 
+        # 서비스 단위로 connection pool 재사용 (요청마다 TLS handshake 방지)
+        self.client = client or httpx.AsyncClient(headers=self.headers, timeout=20.0)
+
+        self.cache = cache
+        self.fresh_seconds = fresh_seconds
+        self.max_stale_seconds = max_stale_seconds
+
+        # stale-while-revalidate 백그라운드 갱신 (PR당 하나)
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
     async def get_pr_context(
             self, owner: str, repo: str, pr_number: int
     ) -> List[PRFileContext]:
 
-        async with httpx.AsyncClient(headers=self.headers, timeout=20.0) as client:
-            try:
-                base_path = f"{self.base_url}/{owner}/{repo}/pulls/{pr_number}"
-                files_url = f"{base_path}/files"
-                comments_url = f"{base_path}/comments"
+        if self.cache is None:
+            entry = await self._fetch(owner, repo, pr_number)
+            return self._entry_to_files(entry)
+
+        key = PrContextCache.make_key(owner, repo, pr_number)
+        self.cache.requests += 1
+
+        entry = await self.cache.get(key)
 
-                logger.info(f"Fetching file context for PR {owner}/{repo}#{pr_number}")
+        if entry is not None and entry.age_seconds < self.fresh_seconds:
+            self.cache.fresh_hits += 1
+            self.cache.bytes_saved += entry.nbytes
+            logger.info(f"PR context cache hit: {key}")
+            return self._entry_to_files(entry)
 
-                # Diff와 Review를 병렬 조회
-                responses = await asyncio.gather(
-                    client.get(files_url, params={"per_page": 100}),
-                    client.get(comments_url, params={"per_page": 100}),
-                )
+        if entry is not None and entry.age_seconds < self.max_stale_seconds:
+            # 캐시된 내용을 바로 반환하고 ETag 재검증은 백그라운드에서 수행
+            self.cache.stale_hits += 1
+            logger.info(f"PR context cache stale hit: {key} (백그라운드 재검증)")
+            self._schedule_refresh(key, owner, repo, pr_number, entry)
+            return self._entry_to_files(entry)
 
-                for resp in responses:
-                    resp.raise_for_status()
+        self.cache.misses += 1
+        refreshed = await self._refresh(key, owner, repo, pr_number, entry)
 
-                files_data = responses[0].json()
-                comments_data = responses[1].json()
+        # 재검증 실패 시 너무 오래된 캐시라도 빈 결과보다는 낫다
+        return self._entry_to_files(refreshed or entry)
 
-                return self._merge_files_and_comments(files_data, comments_data)
+    def _schedule_refresh(
+            self, key: str, owner: str, repo: str, pr_number: int, entry: PrContextEntry
+    ) -> None:
+        if key in self._refreshing:
+            return
 
-            except httpx.HTTPStatusError as e:
-                logger.error(f"GitHub API Error: {e.response.status_code} - {e.response.text}")
-                return []
-            except Exception as e:
-                logger.error(f"Failed to fetch PR file context: {e}")
-                return []
+        task = asyncio.create_task(self._refresh(key, owner, repo, pr_number, entry))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(
+            self,
+            key: str,
+            owner: str,
+            repo: str,
+            pr_number: int,
+            entry: Optional[PrContextEntry],
+    ) -> Optional[PrContextEntry]:
+        refreshed = await self._fetch(owner, repo, pr_number, entry)
+        if refreshed is not None:
+            await self.cache.set(key, refreshed)
+        return refreshed
+
+    async def _fetch(
+            self,
+            owner: str,
+            repo: str,
+            pr_number: int,
+            cached: Optional[PrContextEntry] = None,
+    ) -> Optional[PrContextEntry]:
+        """files / comments 조회. cached가 있으면 If-None-Match로 조건부 요청 (304는 rate limit 미차감)"""
+
+        try:
+            base_path = f"{self.base_url}/{owner}/{repo}/pulls/{pr_number}"
+            files_url = f"{base_path}/files"
+            comments_url = f"{base_path}/comments"
+
+            files_headers = {}
+            comments_headers = {}
+            if cached is not None:
+                if cached.files_etag:
+                    files_headers["If-None-Match"] = cached.files_etag
+                if cached.comments_etag:
+                    comments_headers["If-None-Match"] = cached.comments_etag
+
+            logger.info(f"Fetching file context for PR {owner}/{repo}#{pr_number}")
+
+            # Diff와 Review를 병렬 조회
+            files_resp, comments_resp = await asyncio.gather(
+                self.client.get(files_url, params={"per_page": 100}, headers=files_headers),
+                self.client.get(comments_url, params={"per_page": 100}, headers=comments_headers),
+            )
+
+            entry = PrContextEntry()
+
+            if cached is not None and files_resp.status_code == 304:
+                entry.files_data = cached.files_data
+                entry.files_etag = cached.files_etag
+                entry.files_bytes = cached.files_bytes
+            else:
+                files_resp.raise_for_status()
+                entry.files_data = [_slim_file(f) for f in files_resp.json()]
+                entry.files_etag = files_resp.headers.get("ETag")
+                entry.files_bytes = len(files_resp.content)
+
+            if cached is not None and comments_resp.status_code == 304:
+                entry.comments_data = cached.comments_data
+                entry.comments_etag = cached.comments_etag
+                entry.comments_bytes = cached.comments_bytes
+            else:
+                comments_resp.raise_for_status()
+                entry.comments_data = [_slim_comment(c) for c in comments_resp.json()]
+                entry.comments_etag = comments_resp.headers.get("ETag")
+                entry.comments_bytes = len(comments_resp.content)
+
+            if cached is not None and self.cache is not None:
+                self.cache.revalidations += 1
+                not_modified = [
+                    size
+                    for resp, size in (
+                        (files_resp, cached.files_bytes),
+                        (comments_resp, cached.comments_bytes),
+                    )
+                    if resp.status_code == 304
+                ]
+                self.cache.not_modified += len(not_modified)
+                self.cache.bytes_saved += sum(not_modified)
+
+            return entry
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"GitHub API Error: {e.response.status_code} - {e.response.text}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to fetch PR file context: {e}")
+            return None
+
+    def _entry_to_files(self, entry: Optional[PrContextEntry]) -> List[PRFileContext]:
+        if entry is None:
+            return []
+        return self._merge_files_and_comments(entry.files_data, entry.comments_data)
 
     def _merge_files_and_comments(
             self,
@@ -80,6 +214,7 @@ class GithubService:
                 "additions": additions,
                 "deletions": deletions,
                 "previous_filename": prev_filename,
+                "sha": file.get("sha"),
                 "patch": patch_content,
                 "comments": []
             }
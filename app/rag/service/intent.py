@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import random
+import re
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Literal, Optional
+
+from app.rag.cache.embedding import normalize_text
+
+logger = logging.getLogger(__name__)
+
+
+Datasource = Literal["chitchat", "search_pipeline"]
+
+# 기술 질문 신호
+_FILE_PATH = re.compile(r"[\w./-]+\.(py|java|kt|ts|tsx|js|jsx|go|rs|rb|sql|yml|yaml|json|md|gradle|xml|toml)\b", re.IGNORECASE)
+_PR_NUMBER = re.compile(r"(#\d+|\bPR\s*#?\d+|풀\s*리퀘)", re.IGNORECASE)
+_JIRA_KEY = re.compile(r"\b[A-Z][A-Z0-9]+-\d+\b")
+_CODE_TOKEN = re.compile(
+    r"(`[^`]+`|\b\w+_\w+\b|\b[a-z]+[A-Z]\w*\b|\b[A-Z][a-z]+[A-Z]\w*\b|\b\w+\(\))"
+)
+_TECH_KEYWORDS = re.compile(
+    r"(코드|함수|클래스|메서드|변수|모듈|노드|라우터|프롬프트|파이프라인|구현|로직|에러|오류|버그|예외|"
+    r"이슈|티켓|지라|커밋|머지|리뷰|배포|빌드|테스트|설정|의존성|스키마|쿼리|인덱스|엔드포인트|"
+    r"담당|작업|기능|수정|변경|"
+    r"\b(api|rag|pr|jira|issue|bug|error|exception|build|deploy|test|commit|merge|branch|"
+    r"endpoint|schema|config|docker|redis|db|sql|class|function|method)\b)",
+    re.IGNORECASE,
+)
+
+# 인사/감사/작별 (카테고리 -> 패턴). 문장 전체가 인사말일 때만 일치
+# (접두어 일치는 "바이너리", "감사 로그", "hint" 같은 기술 질문을 인사로 오인함)
+_GREETING_TAIL = r"(\s*[ㅎㅋ^~]+)?"
+_GREETINGS: dict[str, re.Pattern] = {
+    "hello": re.compile(
+        r"(안녕(하세요|하십니까)?|하이(요)?|헬로|반가워(요)?|반갑습니다|hi|hello|hey)" + _GREETING_TAIL,
+        re.IGNORECASE,
+    ),
+    "thanks": re.compile(
+        r"(고마워(요)?|고맙습니다|감사(합니다|해요|드려요|드립니다)?|땡큐|thanks|thank\s*you|thx)"
+        + _GREETING_TAIL,
+        re.IGNORECASE,
+    ),
+    "cheer": re.compile(
+        r"((고생|수고)\s*(많으셨습니다|많았어(요)?|하셨습니다|하셨어요|했어(요)?|하세요|해(요)?)?"
+        r"|화이팅|파이팅)" + _GREETING_TAIL,
+        re.IGNORECASE,
+    ),
+    "bye": re.compile(
+        r"(잘\s*가(요|세요)?|바이(바이)?|bye(\s*bye)?|good\s*bye|다음에\s*(또\s*)?(봐요?|뵐게요)"
+        r"|내일\s*(봐요?|뵐게요)|또\s*봐요?)" + _GREETING_TAIL,
+        re.IGNORECASE,
+    ),
+}
+
+# 인사말로 인정할 최대 길이 (긴 문장은 다른 의도가 섞여 있을 가능성이 큼)
+_GREETING_MAX_CHARS = 30
+
+CANNED_RESPONSES: dict[str, str] = {
+    "hello": "안녕하세요! CEOS 프로젝트를 함께 커밋해 나가는 AI 동료입니다. 코드, PR, 이슈, Jira 티켓에 대해 무엇이든 물어봐 주세요.",
+    "thanks": "천만에요! 언제든 머지 대기 중입니다. 더 궁금한 코드나 이슈가 있으면 편하게 물어봐 주세요.",
+    "cheer": "감사합니다! CEOS 여러분도 오늘 배포까지 무사히, 빌드는 항상 그린이길 바랄게요.",
+    "bye": "수고하셨어요! 다음에 또 필요한 내용이 있으면 언제든 불러 주세요.",
+}
+
+
+@dataclass
+class IntentDecision:
+    datasource: Datasource
+    confidence: float
+    signals: list[str] = field(default_factory=list)
+    greeting: Optional[str] = None
+
+
+class LocalIntentRouter:
+    """
+    네트워크 호출 없이 질문 의도(chitchat / search_pipeline)를 분류하는 pre-router.
+
+    - 파일 경로, PR 번호, Jira 키, 코드 토큰이 있으면 search_pipeline (기술 용어만 있으면 판단 보류)
+    - 기술 신호 없이 문장 전체가 인사/감사/작별이면 chitchat (정형화된 응답 제공)
+    - confidence가 threshold 미만이면 LLM router로 fallback
+    - 확신한 결정 중 일부(shadow_sample_rate)는 백그라운드로 LLM router와 비교해 일치율 측정
+    """
+
+    def __init__(self, confidence_threshold: float, shadow_sample_rate: float = 0.0):
+        self.confidence_threshold = confidence_threshold
+        self.shadow_sample_rate = shadow_sample_rate
+        self._tasks: set[asyncio.Task] = set()
+
+        # 통계
+        self.decisions = {"local_search_pipeline": 0, "local_chitchat": 0, "llm_fallback": 0}
+        self.canned_responses = 0
+        self.compared = 0
+        self.agreed = 0
+        self.disagreements: dict[str, int] = {}
+
+    def classify(self, question: str) -> IntentDecision:
+        text = normalize_text(question)
+
+        signals = [
+            name
+            for name, pattern in (
+                ("file_path", _FILE_PATH),
+                ("pr_number", _PR_NUMBER),
+                ("jira_key", _JIRA_KEY),
+                ("code_token", _CODE_TOKEN),
+                ("tech_keyword", _TECH_KEYWORDS),
+            )
+            if pattern.search(text)
+        ]
+
+        if signals:
+            # 식별자 형태의 신호는 강한 근거, 일반 기술 용어("작업", "설정" 등)는 약한 근거
+            # 기술 용어만 있으면 일상 대화일 수 있으므로 LLM router로 넘김 (threshold 미만)
+            strong = len([s for s in signals if s != "tech_keyword"])
+            if not strong:
+                return IntentDecision("search_pipeline", 0.6, signals)
+
+            confidence = round(
+                min(1.0, 0.7 + 0.15 * strong + 0.05 * ("tech_keyword" in signals)), 2
+            )
+            return IntentDecision("search_pipeline", confidence, signals)
+
+        greeting = self.greeting_category(text)
+        if greeting is not None:
+            return IntentDecision("chitchat", 0.95, ["greeting"], greeting)
+
+        # 신호가 없으면 판단 보류 (대부분 기술 질문이므로 search_pipeline 쪽으로 추정)
+        return IntentDecision("search_pipeline", 0.5)
+
+    @staticmethod
+    def greeting_category(text: str) -> Optional[str]:
+        stripped = text.strip(" !.?~^")
+        if len(stripped) > _GREETING_MAX_CHARS:
+            return None
+
+        for category, pattern in _GREETINGS.items():
+            if pattern.fullmatch(stripped):
+                return category
+        return None
+
+    def is_confident(self, decision: IntentDecision) -> bool:
+        return decision.confidence >= self.confidence_threshold
+
+    def record_local(self, decision: IntentDecision) -> None:
+        self.decisions[f"local_{decision.datasource}"] += 1
+        logger.info(
+            f"Local intent router: {decision.datasource} "
+            f"(confidence: {decision.confidence:.2f}, signals: {decision.signals})"
+        )
+
+    def record_fallback(self, decision: IntentDecision, llm_datasource: str) -> None:
+        self.decisions["llm_fallback"] += 1
+        self.record_agreement(decision, llm_datasource)
+
+    def record_agreement(self, decision: IntentDecision, llm_datasource: str) -> None:
+        self.compared += 1
+        if decision.datasource == llm_datasource:
+            self.agreed += 1
+        else:
+            key = f"{decision.datasource}->{llm_datasource}"
+            self.disagreements[key] = self.disagreements.get(key, 0) + 1
+
+    def canned_response(self, question: str) -> Optional[str]:
+        category = self.greeting_category(normalize_text(question))
+        if category is None:
+            return None
+
+        self.canned_responses += 1
+        return CANNED_RESPONSES[category]
+
+    def maybe_shadow(
+        self, decision: IntentDecision, llm_route: Callable[[], Awaitable[str]]
+    ) -> None:
+        """확신한 로컬 결정을 샘플링해 백그라운드로 LLM router 결과와 비교"""
+        if random.random() >= self.shadow_sample_rate:
+            return
+
+        async def compare() -> None:
+            try:
+                self.record_agreement(decision, await llm_route())
+            except Exception as e:
+                logger.warning(f"Shadow LLM routing failed: {e}")
+
+        task = asyncio.create_task(compare())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats(self) -> dict[str, Any]:
+        total = sum(self.decisions.values())
+        local = total - self.decisions["llm_fallback"]
+        return {
+            **self.decisions,
+            "local_rate": round(local / total, 4) if total else 0.0,
+            "canned_responses": self.canned_responses,
+            "llm_compared": self.compared,
+            "llm_agreement": round(self.agreed / self.compared, 4) if self.compared else 0.0,
+            "disagreements": dict(self.disagreements),
+        }
@@ -1,13 +1,21 @@
+from typing import Optional
+
 from langchain_core.messages import trim_messages
 from langchain_core.output_parsers import StrOutputParser
 from langchain_openai import ChatOpenAI
 
+from app.core.clients import ClientRegistry
 from app.core.config import settings
 
 
 class LlmService:
-    def __init__(self):
-        self.llm = ChatOpenAI(model=settings.OPENAI_CHAT_MODEL, temperature=0)
+    def __init__(self, clients: Optional[ClientRegistry] = None):
+        http_kwargs = (
+            {"http_client": clients.openai_sync, "http_async_client": clients.openai_async}
+            if clients is not None
+            else {}
+        )
+        self.llm = ChatOpenAI(model=settings.OPENAI_CHAT_MODEL, temperature=0, **http_kwargs)
 
         self.output_parser = StrOutputParser()
 
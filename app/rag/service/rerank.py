@@ -1,22 +1,158 @@
+import asyncio
 import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
+import cohere
 from langchain_cohere import CohereRerank
-from langchain_core.documents import Document
 
-from app.core.config import settings
+from app.core.config import RerankBackendType, settings
+from app.rag.cache.rerank import RerankScoreCache
 from app.rag.models.retrieve import BaseSearchResult
 
 logger = logging.getLogger(__name__)
 
 
-class RerankService:
-    def __init__(self):
-        self.reranker = CohereRerank(
-            cohere_api_key=settings.COHERE_API_KEY, model="rerank-multilingual-v3.0"
+class RerankBackend(ABC):
+    """(query, 문서 텍스트) 쌍의 relevance score를 계산하는 rerank 백엔드"""
+
+    name: str = "base"
+
+    @abstractmethod
+    async def score(self, query: str, texts: list[str]) -> list[float]:
+        """texts와 같은 순서의 relevance score 반환"""
+
+
+class CohereRerankBackend(RerankBackend):
+    name = "cohere"
+
+    def __init__(
+        self,
+        model: str = "rerank-multilingual-v3.0",
+        client: Optional[cohere.ClientV2] = None,
+    ):
+        if client is not None:
+            self.reranker = CohereRerank(client=client, model=model)
+        else:
+            self.reranker = CohereRerank(
+                cohere_api_key=settings.COHERE_API_KEY, model=model
+            )
+
+    async def score(self, query: str, texts: list[str]) -> list[float]:
+        if not texts:
+            return []
+
+        # CohereRerank는 동기 클라이언트만 제공
+        results = await asyncio.to_thread(
+            self.reranker.rerank, documents=texts, query=query, top_n=None
+        )
+
+        scores = [0.0] * len(texts)
+        for result in results:
+            scores[result["index"]] = result["relevance_score"]
+
+        return scores
+
+
+class CrossEncoderRerankBackend(RerankBackend):
+    """
+    sentence-transformers CrossEncoder 기반 로컬(CPU) rerank 백엔드.
+
+    - 문서당 토큰 수를 max_tokens로 제한
+    - batch_size 단위 배치 추론
+    - ONNX(runtime="onnx") 혹은 torch dynamic quantization(quantize=True) 선택 가능
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int = 16,
+        max_tokens: int = 512,
+        runtime: str = "torch",
+        onnx_file_name: Optional[str] = None,
+        quantize: bool = False,
+    ):
+        # torch 로딩 비용이 커서 로컬 백엔드 사용 시에만 import
+        from sentence_transformers import CrossEncoder
+
+        model_kwargs = {"file_name": onnx_file_name} if onnx_file_name else None
+
+        self.model = CrossEncoder(
+            model_name,
+            max_length=max_tokens,
+            device="cpu",
+            backend=runtime,
+            model_kwargs=model_kwargs,
+        )
+
+        if quantize and runtime == "torch":
+            import torch
+
+            self.model.model = torch.quantization.quantize_dynamic(
+                self.model.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+
+        self.batch_size = batch_size
+
+        # 토크나이저에 넘기기 전 대략적인 문자 수 제한 (긴 diff 토크나이징 비용 방지)
+        self.max_chars = max_tokens * 4
+
+        # CPU 추론은 한 번에 하나씩 (torch intra-op 스레드와 경합 방지)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rerank")
+
+        logger.info(
+            f"Local rerank model loaded: {model_name} "
+            f"(runtime: {runtime}, quantize: {quantize}, max_tokens: {max_tokens})"
+        )
+
+    def _predict(self, query: str, texts: list[str]) -> list[float]:
+        pairs = [(query, text[: self.max_chars]) for text in texts]
+        scores = self.model.predict(
+            pairs,
+            batch_size=self.batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+        )
+        return [float(s) for s in scores]
+
+    async def score(self, query: str, texts: list[str]) -> list[float]:
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._predict, query, texts)
+
+
+def create_rerank_backend(
+    backend_type: RerankBackendType, cohere_client: Optional[cohere.ClientV2] = None
+) -> RerankBackend:
+    if backend_type == RerankBackendType.local:
+        return CrossEncoderRerankBackend(
+            model_name=settings.LOCAL_RERANK_MODEL,
+            batch_size=settings.LOCAL_RERANK_BATCH_SIZE,
+            max_tokens=settings.LOCAL_RERANK_MAX_TOKENS,
+            runtime=settings.LOCAL_RERANK_RUNTIME,
+            onnx_file_name=settings.LOCAL_RERANK_ONNX_FILE,
+            quantize=settings.LOCAL_RERANK_QUANTIZE,
         )
 
+    return CohereRerankBackend(client=cohere_client)
+
+
+class RerankService:
+    def __init__(
+        self,
+        backend: Optional[RerankBackend] = None,
+        score_cache: Optional[RerankScoreCache] = None,
+    ):
+        self.backend = backend or create_rerank_backend(settings.RERANK_BACKEND)
+        self.score_cache = score_cache
+
     def get_reranker(self):
-        return self.reranker
+        return self.backend
 
     async def rerank(
         self,
@@ -24,35 +160,47 @@ class RerankService:
         documents: list[BaseSearchResult],
         top_n: int = 5
     ) -> list[BaseSearchResult]:
-        
+
         if not documents:
             return []
-        
-        # BaseSearchResult -> Document
-        input_docs = [
-            Document(
-                page_content=doc.text,
-                metadata={"original_doc": doc}
-            )
-            for doc in documents
-        ]
 
-        self.reranker.top_n = top_n
-        
-        # Rerank 호출
-        reranked_docs: list[Document] = await self.reranker.acompress_documents(
-            documents=input_docs,
-            query=query
-        )
+        scores = await self._score(query, documents)
+
+        ranked = sorted(
+            zip(documents, scores), key=lambda pair: pair[1], reverse=True
+        )[:top_n]
+
+        logger.info(f"Reranked docs count: {len(ranked)} (backend: {self.backend.name})")
 
-        logger.info(f"Reranked docs count: {len(reranked_docs)}")
-        
-        # Document -> BaseSearchResult
         result_models = []
-        for doc in reranked_docs:
-            original_model: BaseSearchResult = doc.metadata.get("original_doc")
-            new_score = doc.metadata.get("relevance_score")
-            original_model.relevance_score = new_score
-            result_models.append(original_model)
+        for doc, score in ranked:
+            doc.relevance_score = score
+            result_models.append(doc)
 
         return result_models
+
+    async def _score(self, query: str, documents: list[BaseSearchResult]) -> list[float]:
+        if self.score_cache is None:
+            return await self.backend.score(query, [doc.text for doc in documents])
+
+        keys = [
+            RerankScoreCache.make_key(self.backend.name, query, doc) for doc in documents
+        ]
+        cached = await self.score_cache.get_many(keys)
+
+        # 처음 보는 (query, document) 쌍만 rerank 호출
+        misses = {
+            key: doc.text for key, doc in zip(keys, documents) if key not in cached
+        }
+
+        if misses:
+            fresh_scores = await self.backend.score(query, list(misses.values()))
+            fresh = dict(zip(misses.keys(), fresh_scores))
+            await self.score_cache.set_many(fresh)
+            cached.update(fresh)
+
+        reused = sum(1 for key in keys if key not in misses)
+        self.score_cache.record(total=len(documents), cached=reused)
+        logger.info(f"Rerank score cache: 전체 {len(documents)}건 중 {reused}건 재사용")
+
+        return [cached[key] for key in keys]
@@ -0,0 +1,239 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from langchain_core.documents import Document
+
+from app.rag.repository.meili import LangChainMeiliRepository
+
+logger = logging.getLogger(__name__)
+
+
+# 동일 검색 요청 판별 키 (k는 병합 시 최댓값으로 통일)
+RequestKey = tuple[str, str, float, str, bool]
+
+# 실행이 시작된 batch_key를 기억하는 시간 (늦게 도착한 consumer가 다시 대기하지 않도록)
+_FLUSHED_KEY_TTL_SECONDS = 60.0
+
+
+def _request_key(req: dict[str, Any]) -> RequestKey:
+    return (
+        req["index_name"],
+        req["query"],
+        float(req.get("semantic_ratio", 0.5)),
+        json.dumps(req.get("filter"), sort_keys=True, default=str),
+        bool(req.get("light")),
+    )
+
+
+@dataclass
+class _PendingBatch:
+    expected_consumers: set[str]
+    submissions: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    futures: dict[str, asyncio.Future] = field(default_factory=dict)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class RetrievalCoordinator:
+    """
+    같은 턴에서 발생하는 여러 검색 요청(retrieve, search_related_jira)을
+    하나의 임베딩 배치와 하나의 Meilisearch multi_search 호출로 병합한다.
+
+    - batch_key가 같은 consumer들이 모두 요청을 제출하면(혹은 max_wait 경과 시) 일괄 실행
+    - 동일한 (index, query, ratio, filter) 요청은 한 번만 실행 후 각 consumer의 k만큼 분배
+    - 다른 배치에서 이미 실행 중인 동일 요청은 결과를 공유 (single-flight)
+    """
+
+    def __init__(self, repository: LangChainMeiliRepository, max_wait_seconds: float):
+        self.repository = repository
+        self.max_wait_seconds = max_wait_seconds
+
+        self._batches: dict[str, _PendingBatch] = {}
+        # 이미 실행된 batch_key -> 만료 시각 (loop.time 기준)
+        self._flushed: dict[str, float] = {}
+        # 실행 중인 요청 -> (k, 결과 future)
+        self._inflight: dict[RequestKey, tuple[int, asyncio.Future]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+        # 통계
+        self.batches = 0
+        self.merged_batches = 0
+        self.timed_out_batches = 0
+        self.late_consumers = 0
+        self.submitted_requests = 0
+        self.executed_requests = 0
+        self.singleflight_shared = 0
+        self.multi_search_calls = 0
+
+    async def search(
+        self,
+        consumer: str,
+        search_requests: list[dict[str, Any]],
+        batch_key: Optional[str] = None,
+        expected_consumers: Optional[set[str]] = None,
+    ) -> list[list[Document]]:
+        """LangChainMeiliRepository.multi_search와 동일한 입출력 형식"""
+        expected = expected_consumers or {consumer}
+
+        # 병합할 상대가 없으면 즉시 실행
+        if batch_key is None or expected <= {consumer}:
+            results = await self._execute({consumer: search_requests})
+            return results[consumer]
+
+        loop = asyncio.get_running_loop()
+
+        # 상대가 이미 떠난 배치(대기 시간 초과 등)에 늦게 도착하면 다시 기다리지 않고 즉시 실행
+        if self._is_flushed(batch_key, loop.time()):
+            self.late_consumers += 1
+            results = await self._execute({consumer: search_requests})
+            return results[consumer]
+
+        batch = self._batches.get(batch_key)
+        if batch is None:
+            batch = _PendingBatch(expected_consumers=set(expected))
+            batch.timer = loop.call_later(
+                self.max_wait_seconds, self._on_timeout, batch_key, batch
+            )
+            self._batches[batch_key] = batch
+
+        future = loop.create_future()
+        batch.submissions[consumer] = search_requests
+        batch.futures[consumer] = future
+
+        if batch.expected_consumers <= batch.submissions.keys():
+            self._flush(batch_key, batch)
+
+        return await future
+
+    def _on_timeout(self, batch_key: str, batch: _PendingBatch) -> None:
+        if self._batches.get(batch_key) is not batch:
+            return
+
+        waiting = batch.expected_consumers - batch.submissions.keys()
+        logger.info(f"Retrieval batch '{batch_key}' 대기 시간 초과. 미도착: {waiting}")
+        self.timed_out_batches += 1
+        self._flush(batch_key, batch)
+
+    def _is_flushed(self, batch_key: str, now: float) -> bool:
+        # 만료된 키 정리
+        for key in [k for k, expires_at in self._flushed.items() if expires_at <= now]:
+            del self._flushed[key]
+        return batch_key in self._flushed
+
+    def _flush(self, batch_key: str, batch: _PendingBatch) -> None:
+        self._batches.pop(batch_key, None)
+        self._flushed[batch_key] = asyncio.get_running_loop().time() + _FLUSHED_KEY_TTL_SECONDS
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = asyncio.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: _PendingBatch) -> None:
+        try:
+            results = await self._execute(batch.submissions)
+        except Exception as e:
+            for future in batch.futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for consumer, future in batch.futures.items():
+            if not future.done():
+                future.set_result(results[consumer])
+
+    async def _execute(
+        self, submissions: dict[str, list[dict[str, Any]]]
+    ) -> dict[str, list[list[Document]]]:
+        self.batches += 1
+        if len(submissions) > 1:
+            self.merged_batches += 1
+
+        # 요청 병합 (k는 최댓값 사용)
+        merged: dict[RequestKey, dict[str, Any]] = {}
+        for requests in submissions.values():
+            self.submitted_requests += len(requests)
+            for req in requests:
+                key = _request_key(req)
+                if key in merged:
+                    merged[key]["k"] = max(merged[key]["k"], req.get("k", 5))
+                else:
+                    merged[key] = {**req, "k": req.get("k", 5)}
+
+        # 다른 배치에서 실행 중인 동일 요청은 결과 공유
+        shared: dict[RequestKey, asyncio.Future] = {}
+        owned: list[RequestKey] = []
+        for key, req in merged.items():
+            inflight = self._inflight.get(key)
+            if inflight is not None and inflight[0] >= req["k"]:
+                shared[key] = inflight[1]
+            else:
+                owned.append(key)
+
+        loop = asyncio.get_running_loop()
+        owned_futures: dict[RequestKey, asyncio.Future] = {}
+        for key in owned:
+            future = loop.create_future()
+            owned_futures[key] = future
+            self._inflight[key] = (merged[key]["k"], future)
+
+        self.singleflight_shared += len(shared)
+        self.executed_requests += len(owned)
+
+        docs_by_key: dict[RequestKey, list[Document]] = {}
+
+        try:
+            if owned:
+                self.multi_search_calls += 1
+                responses = await self.repository.multi_search(
+                    [merged[key] for key in owned]
+                )
+                for key, docs in zip(owned, responses):
+                    docs_by_key[key] = docs
+                    owned_futures[key].set_result(docs)
+
+            if shared:
+                shared_results = await asyncio.gather(*shared.values())
+                docs_by_key.update(zip(shared.keys(), shared_results))
+
+        except Exception as e:
+            for future in owned_futures.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # 공유 대기자가 없어도 경고가 남지 않도록 예외 소비
+                    future.exception()
+            raise
+
+        finally:
+            for key, future in owned_futures.items():
+                if self._inflight.get(key, (0, None))[1] is future:
+                    del self._inflight[key]
+
+        logger.info(
+            f"Retrieval batch 실행: consumer {list(submissions.keys())}, "
+            f"요청 {sum(len(r) for r in submissions.values())}건 -> "
+            f"실행 {len(owned)}건 (공유 {len(shared)}건)"
+        )
+
+        # consumer별 원래 요청 순서와 k에 맞게 분배
+        return {
+            consumer: [
+                docs_by_key[_request_key(req)][: req.get("k", 5)] for req in requests
+            ]
+            for consumer, requests in submissions.items()
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "merged_batches": self.merged_batches,
+            "timed_out_batches": self.timed_out_batches,
+            "late_consumers": self.late_consumers,
+            "submitted_requests": self.submitted_requests,
+            "executed_requests": self.executed_requests,
+            "singleflight_shared": self.singleflight_shared,
+            "multi_search_calls": self.multi_search_calls,
+        }
@@ -0,0 +1,244 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+from langchain_core.documents import Document
+
+from app.rag.cache.embedding import normalize_text
+from app.rag.cache.store import LruCache
+
+logger = logging.getLogger(__name__)
+
+# 추측 검색 항목당 대략적인 메모리 사용량 (문서 본문은 repository 결과를 공유)
+_ENTRY_SIZE = 64 * 1024
+
+
+@dataclass
+class _Speculation:
+    question: str
+    requests: dict[str, dict[str, Any]]  # index_name -> 검색 요청
+    task: asyncio.Task
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+
+
+def speculation_key(thread_id: Optional[str], question: str) -> Optional[str]:
+    if not thread_id:
+        return None
+    digest = hashlib.sha1(normalize_text(question).encode("utf-8")).hexdigest()
+    return f"{thread_id}:{digest}"
+
+
+class SpeculativeRetriever:
+    """
+    턴 시작 시점에 원본 질문으로 index_list 전체를 미리 검색해 두고,
+    router / rewrite / plan LLM 호출이 끝난 뒤 계획된 검색 요청 중
+    원본 질문과 충분히 비슷한 (query, index) 쌍은 그 결과를 재사용한다.
+
+    - 재사용 기준: 같은 인덱스 + 정규화한 질문 일치 또는 임베딩 cosine 유사도 >= reuse_similarity
+    - 재사용되지 않은 요청만 실제로 검색
+    - router가 chitchat을 선택하면 진행 중인 추측 검색 취소
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        reuse_similarity: float,
+        ttl_seconds: float = 300.0,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.repository = repository
+        self.reuse_similarity = reuse_similarity
+        self._speculations = LruCache(max_bytes=max_bytes, ttl_seconds=ttl_seconds)
+
+        # 통계
+        self.started = 0
+        self.cancelled = 0
+        self.failed = 0
+        self.completed = 0
+        self.resolved = 0
+        self.ready_before_use = 0
+        self.planned_requests = 0
+        self.reused_requests = 0
+        self.speculative_search_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def start(
+        self,
+        key: Optional[str],
+        question: str,
+        index_list: list[str],
+        k: int,
+        semantic_ratio: float,
+    ) -> None:
+        if key is None or not index_list or key in self._speculations:
+            return
+
+        requests = {
+            index_name: {
+                "index_name": index_name,
+                "query": question,
+                "k": k,
+                "semantic_ratio": semantic_ratio,
+            }
+            for index_name in index_list
+        }
+
+        task = asyncio.create_task(self.repository.multi_search(list(requests.values())))
+        speculation = _Speculation(question=question, requests=requests, task=task)
+        task.add_done_callback(lambda t: self._on_done(speculation, t))
+
+        self._speculations.set(key, speculation, size=_ENTRY_SIZE)
+        self.started += 1
+        logger.info(f"추측 검색 시작: {len(requests)}개 인덱스 (key: {key})")
+
+    def _on_done(self, speculation: _Speculation, task: asyncio.Task) -> None:
+        speculation.finished_at = time.perf_counter()
+
+        if task.cancelled():
+            return
+
+        if task.exception() is not None:
+            self.failed += 1
+            logger.warning(f"추측 검색 실패: {task.exception()}")
+            return
+
+        self.completed += 1
+        self.speculative_search_seconds += speculation.finished_at - speculation.started_at
+
+    def cancel(self, key: Optional[str]) -> None:
+        if key is None:
+            return
+
+        speculation: Optional[_Speculation] = self._speculations.peek(key)
+        if speculation is None:
+            return
+
+        self._speculations.delete(key)
+        if not speculation.task.done():
+            speculation.task.cancel()
+            self.cancelled += 1
+            logger.info(f"추측 검색 취소 (key: {key})")
+
+    async def resolve(
+        self, key: Optional[str], search_requests: list[dict[str, Any]]
+    ) -> list[Optional[list[Document]]]:
+        """계획된 요청별로 재사용 가능한 추측 검색 결과 (재사용 불가면 None)"""
+        reused: list[Optional[list[Document]]] = [None] * len(search_requests)
+
+        speculation: Optional[_Speculation] = (
+            self._speculations.get(key) if key is not None else None
+        )
+        if speculation is None or not search_requests:
+            return reused
+
+        candidates = [
+            i
+            for i, req in enumerate(search_requests)
+            if self._compatible(speculation.requests.get(req["index_name"]), req)
+        ]
+        if not candidates:
+            return reused
+
+        similar = await self._similar_queries(
+            speculation.question, [search_requests[i]["query"] for i in candidates]
+        )
+        candidates = [i for i, ok in zip(candidates, similar) if ok]
+        ready = speculation.task.done()
+        if not candidates:
+            self._record(len(search_requests), 0, ready)
+            return reused
+
+        # 아직 진행 중이면 남은 시간만 대기
+        wait_start = time.perf_counter()
+        try:
+            results = await asyncio.shield(speculation.task)
+        except asyncio.CancelledError:
+            # 추측 검색만 취소된 경우(chitchat / 새 턴)는 재사용 없이 진행, 호출자 취소는 전파
+            if speculation.task.cancelled():
+                return reused
+            raise
+        except Exception:
+            return reused
+        finally:
+            self.wait_seconds += time.perf_counter() - wait_start
+
+        docs_by_index = dict(zip(speculation.requests.keys(), results))
+        for i in candidates:
+            req = search_requests[i]
+            reused[i] = docs_by_index[req["index_name"]][: req.get("k", 5)]
+
+        self._record(len(search_requests), len(candidates), ready)
+        return reused
+
+    def _record(self, planned: int, reused: int, ready: bool) -> None:
+        self.resolved += 1
+        self.planned_requests += planned
+        self.reused_requests += reused
+        if ready:
+            self.ready_before_use += 1
+
+        logger.info(f"추측 검색 재사용: 계획된 요청 {planned}건 중 {reused}건")
+
+    @staticmethod
+    def _compatible(speculative: Optional[dict[str, Any]], req: dict[str, Any]) -> bool:
+        if speculative is None or req.get("filter"):
+            return False
+        return (
+            speculative["k"] >= req.get("k", 5)
+            and abs(speculative["semantic_ratio"] - req.get("semantic_ratio", 0.5)) < 1e-6
+        )
+
+    async def _similar_queries(self, question: str, queries: list[str]) -> list[bool]:
+        normalized = normalize_text(question)
+        result = [normalize_text(query) == normalized for query in queries]
+
+        pending = [i for i, same in enumerate(result) if not same]
+        if not pending:
+            return result
+
+        # 계획된 쿼리 임베딩은 이후 검색에서 embedding cache로 재사용됨
+        vectors = await self.repository.embeddings.aembed_documents(
+            [question] + [queries[i] for i in pending]
+        )
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms[:, None]
+
+        similarities = matrix[1:] @ matrix[0]
+        for i, similarity in zip(pending, similarities):
+            result[i] = float(similarity) >= self.reuse_similarity
+
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "started": self.started,
+            "cancelled": self.cancelled,
+            "failed": self.failed,
+            "completed": self.completed,
+            "resolved": self.resolved,
+            "ready_before_use": self.ready_before_use,
+            "planned_requests": self.planned_requests,
+            "reused_requests": self.reused_requests,
+            "reuse_rate": (
+                round(self.reused_requests / self.planned_requests, 4)
+                if self.planned_requests
+                else 0.0
+            ),
+            "avg_speculative_search_ms": (
+                round(self.speculative_search_seconds * 1000 / self.completed, 2)
+                if self.completed
+                else 0.0
+            ),
+            "avg_wait_ms": (
+                round(self.wait_seconds * 1000 / self.resolved, 2)
+                if self.resolved
+                else 0.0
+            ),
+        }
@@ -0,0 +1,207 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.output_parsers import StrOutputParser
+
+from app.observability.langfuse_client import langfuse_handler
+from app.rag.prompts.utils import get_prompt_template
+
+logger = logging.getLogger(__name__)
+
+
+def conversation_messages(messages: list) -> list[BaseMessage]:
+    """사용자-어시스턴트 대화만 필터링"""
+    return [m for m in messages if isinstance(m, (HumanMessage, AIMessage))]
+
+
+def unsummarized_messages(messages: list, summarized_until: Optional[str]) -> list:
+    """
+    요약에 포함되지 않은 메시지. 마지막 요약 메시지가 message_reducer에 의해 이미 잘려나갔으면
+    남은 메시지는 모두 그 이후의 메시지이므로 전체를 반환한다.
+    """
+    if summarized_until is None:
+        return messages
+
+    for i, m in enumerate(messages):
+        if m.id == summarized_until:
+            return messages[i + 1 :]
+    return messages
+
+
+def format_conversation(messages: list) -> str:
+    lines = []
+    for m in messages:
+        if isinstance(m, HumanMessage):
+            lines.append(f"User: {m.content}")
+        elif isinstance(m, AIMessage):
+            lines.append(f"Assistant: {m.content}")
+    return "\n".join(lines)
+
+
+class ConversationSummarizer:
+    """
+    턴 종료 후 백그라운드에서 오래된 대화를 누적 요약(conversation_summary)에 합친다.
+
+    - 요약되지 않은 대화가 trigger_tokens를 넘으면 최근 keep_turns 턴을 제외한 나머지를 요약에 합침
+    - 요약 결과는 aupdate_state로 AgentState에 저장하고, 노드는 요약 + 이후 메시지만 프롬프트에 사용
+    - 세션당 하나만 실행하며, 같은 세션의 새 턴이 시작되면 진행 중인 요약은 취소
+    - 요약 중 새 checkpoint가 생겼거나 interrupt 대기 중이면 state를 갱신하지 않음 (resume 보호)
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        count_tokens: Callable[[str], int],
+        trigger_tokens: int = 1500,
+        keep_turns: int = 2,
+        max_summary_tokens: int = 500,
+    ):
+        self.llm = llm
+        self.count_tokens = count_tokens
+        self.trigger_tokens = trigger_tokens
+        self.keep_turns = keep_turns
+        self.max_summary_tokens = max_summary_tokens
+
+        # thread_id -> 실행 중인 요약 작업
+        self._tasks: dict[str, asyncio.Task] = {}
+
+        # 통계
+        self.scheduled = 0
+        self.folds = 0
+        self.skipped_stale = 0
+        self.cancelled = 0
+        self.failures = 0
+        self.folded_messages = 0
+        self.folded_tokens = 0
+        self.summary_tokens = 0
+        self.summarize_seconds = 0.0
+
+    def message_tokens(self, messages: list) -> int:
+        return sum(
+            self.count_tokens(m.content if isinstance(m.content, str) else str(m.content))
+            for m in messages
+        )
+
+    def schedule(self, app: Any, config: dict) -> None:
+        """턴 종료 후 호출. 응답 지연에 영향을 주지 않도록 background에서 실행"""
+        thread_id = config["configurable"]["thread_id"]
+        if thread_id in self._tasks:
+            return
+
+        task = asyncio.create_task(self._run(app, config))
+        self._tasks[thread_id] = task
+        task.add_done_callback(lambda t: self._discard(thread_id, t))
+        self.scheduled += 1
+
+    def _discard(self, thread_id: str, task: asyncio.Task) -> None:
+        # 취소 후 같은 세션에 새로 예약된 작업은 유지
+        if self._tasks.get(thread_id) is task:
+            del self._tasks[thread_id]
+
+    def cancel(self, thread_id: str) -> None:
+        """같은 세션의 새 턴 시작 시 호출"""
+        task = self._tasks.pop(thread_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+            self.cancelled += 1
+
+    async def aclose(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, app: Any, config: dict) -> None:
+        try:
+            await self.fold(app, config)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"대화 요약 실패: {e}")
+
+    async def fold(self, app: Any, config: dict) -> bool:
+        """필요하면 오래된 턴을 요약에 합치고 state 갱신. 갱신 여부 반환"""
+        snapshot = await app.aget_state(config)
+        # 실행 중이거나 HITL 응답 대기 중인 thread는 건드리지 않음
+        if snapshot.next:
+            return False
+
+        values = snapshot.values
+        pending = unsummarized_messages(
+            conversation_messages(values.get("messages", [])), values.get("summarized_until")
+        )
+        if self.message_tokens(pending) <= self.trigger_tokens:
+            return False
+
+        # 최근 keep_turns 턴은 원문 유지
+        human_indices = [i for i, m in enumerate(pending) if isinstance(m, HumanMessage)]
+        if len(human_indices) <= self.keep_turns:
+            return False
+        cut = human_indices[-self.keep_turns] if self.keep_turns else len(pending)
+        to_fold = pending[:cut]
+
+        start = time.perf_counter()
+        summary = await self._summarize(values.get("conversation_summary"), to_fold)
+        self.summarize_seconds += time.perf_counter() - start
+
+        # 요약하는 동안 새 턴이 저장됐으면 다음 턴 종료 후 다시 요약
+        latest = await app.aget_state(config)
+        if latest.next or (
+            latest.config["configurable"].get("checkpoint_id")
+            != snapshot.config["configurable"].get("checkpoint_id")
+        ):
+            self.skipped_stale += 1
+            return False
+
+        await app.aupdate_state(
+            config,
+            {"conversation_summary": summary, "summarized_until": to_fold[-1].id},
+            as_node="generate",
+        )
+
+        folded_tokens = self.message_tokens(to_fold)
+        summary_tokens = self.count_tokens(summary)
+        self.folds += 1
+        self.folded_messages += len(to_fold)
+        self.folded_tokens += folded_tokens
+        self.summary_tokens += summary_tokens
+
+        logger.info(
+            f"Session {config['configurable']['thread_id']}: 대화 {len(to_fold)}개 메시지 요약 "
+            f"({folded_tokens} -> {summary_tokens} tokens)"
+        )
+        return True
+
+    async def _summarize(self, summary: Optional[str], messages: list) -> str:
+        chain = get_prompt_template("summary") | self.llm | StrOutputParser()
+        result = await chain.ainvoke(
+            input={
+                "summary": summary or "(없음)",
+                "conversation": format_conversation(messages),
+                "max_tokens": self.max_summary_tokens,
+            },
+            config={"callbacks": [langfuse_handler]},
+        )
+        return result.strip()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "trigger_tokens": self.trigger_tokens,
+            "keep_turns": self.keep_turns,
+            "running": len(self._tasks),
+            "scheduled": self.scheduled,
+            "folds": self.folds,
+            "skipped_stale": self.skipped_stale,
+            "cancelled": self.cancelled,
+            "failures": self.failures,
+            "folded_messages": self.folded_messages,
+            "folded_tokens": self.folded_tokens,
+            "summary_tokens": self.summary_tokens,
+            "avg_summarize_seconds": (
+                round(self.summarize_seconds / self.folds, 3) if self.folds else 0.0
+            ),
+        }
@@ -47,4 +47,13 @@ class AgentState(TypedDict):
     retrieved_docs: list[BaseSearchResult]  # 검색 결과
     grade_status: Literal["good", "bad", "max_retries"]
     sources: list[dict[str, Any]]  # generate_node가 생성하는 최종 출처 데이터
-    related_jira_issues: list[JiraSource]  # 사용자 쿼리와 관련 있는 Jira 이슈 목록
\ No newline at end of file
+    related_jira_issues: list[JiraSource]  # 사용자 쿼리와 관련 있는 Jira 이슈 목록
+
+    # 턴 내 재시도 간 공유 (router / analyze 진입 시 초기화)
+    candidate_pool: list[BaseSearchResult]  # rerank 완료된 누적 후보 문서
+    executed_searches: list[str]  # 실행한 검색 요청 key (index|query)
+    reviewed_prs: list[str]  # context 조회 / 사용자 선택을 마친 PR (owner/repo#number)
+
+    # 대화 요약 메모리 (턴 종료 후 ConversationSummarizer가 갱신, 새 턴에도 유지)
+    conversation_summary: Optional[str]  # 요약된 이전 대화
+    summarized_until: Optional[str]  # 요약에 포함된 마지막 메시지 id
\ No newline at end of file
@@ -0,0 +1,20 @@
+import re
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_CAMEL_PATTERN = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def tokenize(text: str) -> list[str]:
+    """BM25용 토큰화. 식별자(snake_case, camelCase)는 분해한 토큰도 함께 포함한다."""
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text):
+        lowered = token.lower()
+        tokens.append(lowered)
+
+        parts = [
+            p.lower() for p in _CAMEL_PATTERN.sub("_", token).split("_") if p
+        ]
+        if len(parts) > 1:
+            tokens.extend(parts)
+
+    return tokens
@@ -0,0 +1,277 @@
+"""
+checkpoint 경량화(CHECKPOINT_OFFLOAD_ENABLED / CHECKPOINT_COMPACT_SERDE_ENABLED) 저장량 / latency 비교 벤치마크.
+
+retrieve -> rerank -> manage_pr_context -> grade를 --retries번 반복하는 재시도 턴을
+실제 노드 대신 합성 문서를 만드는 노드로 구성한 그래프에서 실행한다. (LLM / 검색 호출 없음)
+PR 문서는 --body-bytes 크기의 본문과 --diff-bytes 크기의 file_context diff를 가진다.
+
+모드:
+    plain            기존 방식. 검색 결과 전체를 JSON으로 checkpoint에 저장
+    offload          큰 문서는 blob으로 분리하고 checkpoint에는 BlobRef만 저장
+    compact          CompactSerializer(msgpack + zstd)로 checkpoint 저장
+    offload_compact  둘 다 적용
+    write_behind     offload_compact + write-behind (저장을 모아 최신 checkpoint만 반영)
+    hot_cache        offload_compact + 활성 세션 checkpoint in-process 캐시
+
+--durability로 LangGraph checkpoint 저장 시점(sync / async / exit)을 지정한다.
+
+지표:
+    ckpt_bytes   checkpoint 1개당 평균 JSON 크기
+    redis_bytes  턴 1회당 Redis 수신 바이트 (INFO stats total_net_input_bytes 증가량)
+    redis_cmds   턴 1회당 Redis 명령 수 (INFO commandstats calls 증가량, pipeline 내 명령도 각각 집계)
+    turn_ms      턴 전체 latency / load_ms  턴 종료 후 aget_state latency
+
+한 세션(thread)에서 --session-turns번 연속으로 질문하고, 턴마다 chat_stream처럼 aget_state를
+--state-reads번 호출한다.
+
+Redis Stack(RedisJSON, RediSearch)이 필요하며 REDIS_URL을 사용한다.
+
+사용 예:
+    python -m benchmark.checkpoint --turns 20 --retries 2 --docs 10
+    python -m benchmark.checkpoint --durability exit
+    python -m benchmark.checkpoint --session-turns 5 --state-reads 3
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from benchmark.common import print_table, summarize_latencies
+
+MODES = {
+    "plain": {"offload_enabled": False, "compact_serde": False},
+    "offload": {"offload_enabled": True, "compact_serde": False},
+    "compact": {"offload_enabled": False, "compact_serde": True},
+    "offload_compact": {"offload_enabled": True, "compact_serde": True},
+    "write_behind": {"offload_enabled": True, "compact_serde": True, "write_behind": True},
+    "hot_cache": {
+        "offload_enabled": True,
+        "compact_serde": True,
+        "hot_cache_max_bytes": 64 * 1024 * 1024,
+    },
+}
+
+
+def make_docs(args: argparse.Namespace, turn: str, retry: int) -> list:
+    """검색 1회 분량의 합성 문서 (PR / Code 절반씩, 재시도마다 절반은 이전 검색과 겹침)"""
+    from app.rag.models.retrieve import (
+        CodeSearchResult,
+        PullRequestSearchResult,
+        SourceType,
+    )
+
+    docs = []
+    for i in range(args.docs):
+        n = i + retry * args.docs // 2
+        if i % 2:
+            docs.append(
+                CodeSearchResult(
+                    id=f"{turn}-code-{n}",
+                    source_type=SourceType.CODE,
+                    repo="repo",
+                    text="def f():\n    return 1\n" * (args.body_bytes // 24),
+                    file_path=f"src/module_{n}.py",
+                )
+            )
+        else:
+            docs.append(
+                PullRequestSearchResult(
+                    id=n,
+                    source_type=SourceType.PULL_REQUEST,
+                    repo="repo",
+                    pr_number=n,
+                    title=f"PR {n}",
+                    body="본문 " * (args.body_bytes // 7),
+                    commit_messages=[f"commit {j}" for j in range(20)],
+                    changed_files=[f"src/module_{j}.py" for j in range(10)],
+                )
+            )
+    return docs
+
+
+def attach_file_context(doc, args: argparse.Namespace) -> None:
+    """manage_pr_context가 붙이는 PR 파일 diff (PR 1개당 약 --diff-bytes)"""
+    from app.rag.models.pr_base import PRFileContext
+
+    doc.file_context = [
+        PRFileContext(
+            path=path,
+            status="modified",
+            additions=10,
+            deletions=5,
+            patch="+ added line\n" * (args.diff_bytes // 13 // len(doc.changed_files)),
+        )
+        for path in doc.changed_files
+    ]
+
+
+def build_graph(checkpointer, args: argparse.Namespace):
+    from langchain_core.messages import AIMessage
+    from langgraph.graph import END, StateGraph
+
+    from app.rag.models.plan import SearchQuery
+    from app.rag.models.retrieve import PullRequestSearchResult
+    from app.rag.state import AgentState
+
+    async def rewrite(state):
+        return {"current_query": "query", "retry_count": state.get("retry_count", 0) + 1}
+
+    async def plan(state):
+        return {"search_queries": [SearchQuery(datasource="codebase", query="query")]}
+
+    async def retrieve(state):
+        return {"retrieved_docs": make_docs(args, state["messages"][0].id, state["retry_count"])}
+
+    async def rerank(state):
+        pool = {d.id: d for d in state.get("candidate_pool") or []}
+        for doc in state["retrieved_docs"]:
+            pool.setdefault(doc.id, doc)
+        return {
+            "candidate_pool": list(pool.values()),
+            "retrieved_docs": list(pool.values())[: args.docs],
+        }
+
+    async def manage_pr_context(state):
+        for doc in state["retrieved_docs"]:
+            if isinstance(doc, PullRequestSearchResult) and not doc.file_context:
+                attach_file_context(doc, args)
+        return {"retrieved_docs": state["retrieved_docs"]}
+
+    async def grade(state):
+        return {"grade_status": "bad" if state["retry_count"] <= args.retries else "good"}
+
+    async def generate(state):
+        return {"messages": [AIMessage(content="answer")]}
+
+    workflow = StateGraph(AgentState)
+    for node in (rewrite, plan, retrieve, rerank, manage_pr_context, grade, generate):
+        workflow.add_node(node.__name__, node)
+
+    workflow.set_entry_point("rewrite")
+    workflow.add_edge("rewrite", "plan")
+    workflow.add_edge("plan", "retrieve")
+    workflow.add_edge("retrieve", "rerank")
+    workflow.add_edge("rerank", "manage_pr_context")
+    workflow.add_edge("manage_pr_context", "grade")
+    workflow.add_conditional_edges(
+        "grade",
+        lambda state: "rewrite" if state["grade_status"] == "bad" else "generate",
+        {"rewrite": "rewrite", "generate": "generate"},
+    )
+    workflow.add_edge("generate", END)
+
+    return workflow.compile(checkpointer=checkpointer)
+
+
+async def net_input_bytes(redis_client) -> int:
+    info = await redis_client.info("stats")
+    return int(info["total_net_input_bytes"])
+
+
+async def command_calls(redis_client) -> int:
+    info = await redis_client.info("commandstats")
+    # 측정용 INFO 호출은 제외
+    return sum(
+        int(stat["calls"]) for name, stat in info.items() if name != "cmdstat_info"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    from langchain_core.messages import HumanMessage
+    from redis.asyncio import Redis
+
+    from app.core.config import settings
+    from app.rag.checkpoint.blob import CheckpointBlobStore
+    from app.rag.checkpoint.saver import CatchUpRedisSaver
+
+    redis_client = Redis.from_url(settings.REDIS_URL)
+
+    rows = []
+    for mode, options in MODES.items():
+        checkpointer = CatchUpRedisSaver(
+            redis_client=redis_client,
+            blob_store=CheckpointBlobStore(
+                client=redis_client,
+                ttl_seconds=600,
+                memory_max_bytes=settings.CHECKPOINT_BLOB_CACHE_MAX_BYTES,
+                namespace=f"bench:checkpoint_doc:{uuid.uuid4().hex[:8]}",
+            ),
+            blob_min_bytes=settings.CHECKPOINT_BLOB_MIN_BYTES,
+            **options,
+        )
+        await checkpointer.setup()
+        app = build_graph(checkpointer, args)
+
+        turn_latencies, load_latencies = [], []
+        start_bytes = await net_input_bytes(redis_client)
+        start_calls = await command_calls(redis_client)
+
+        for _ in range(args.turns // args.session_turns):
+            config = {"configurable": {"thread_id": f"bench-{uuid.uuid4()}"}}
+
+            for _ in range(args.session_turns):
+                inputs = {
+                    "messages": [HumanMessage(content="질문", id=uuid.uuid4().hex)],
+                    "retry_count": 0,
+                }
+
+                start = time.perf_counter()
+                await app.ainvoke(inputs, config, durability=args.durability)
+                turn_latencies.append(time.perf_counter() - start)
+
+                # 다음 턴 / resume 시점의 state 조회 (blob 메모리 캐시는 비워 Redis hydrate 비용 포함)
+                for _ in range(args.state_reads):
+                    checkpointer.blob_store.memory.clear()
+                    start = time.perf_counter()
+                    await app.aget_state(config)
+                    load_latencies.append(time.perf_counter() - start)
+
+            await checkpointer.adelete_thread(config["configurable"]["thread_id"])
+
+        await checkpointer.aclose()
+        redis_bytes = await net_input_bytes(redis_client) - start_bytes
+        redis_calls = await command_calls(redis_client) - start_calls
+        turns = len(turn_latencies)
+        stats = checkpointer.stats()
+
+        turn = summarize_latencies(turn_latencies)
+        load = summarize_latencies(load_latencies)
+        rows.append(
+            {
+                "mode": mode,
+                "durability": args.durability,
+                "checkpoints": stats["checkpoints"] // turns,
+                "ckpt_bytes": stats["avg_checkpoint_bytes"],
+                "max_ckpt_bytes": stats["max_checkpoint_bytes"],
+                "redis_bytes": redis_bytes // turns,
+                "redis_cmds": redis_calls // turns,
+                "turn_p50_ms": turn["p50_ms"],
+                "turn_p95_ms": turn["p95_ms"],
+                "load_p50_ms": load["p50_ms"],
+                "hot_hit_rate": stats["hot_cache"]["hit_rate"] if stats["hot_cache"] else "-",
+            }
+        )
+
+    await redis_client.aclose()
+    print_table(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--session-turns", type=int, default=4, help="세션(thread)당 연속 턴 수")
+    parser.add_argument("--state-reads", type=int, default=2, help="턴당 aget_state 호출 수")
+    parser.add_argument("--retries", type=int, default=2, help="턴당 grade 재시도 횟수")
+    parser.add_argument("--docs", type=int, default=10, help="검색 1회당 문서 수")
+    parser.add_argument("--body-bytes", type=int, default=4000)
+    parser.add_argument("--diff-bytes", type=int, default=20000, help="PR 1개당 diff 크기")
+    parser.add_argument(
+        "--durability", choices=["sync", "async", "exit"], default="async"
+    )
+
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import json
+import math
+import statistics
+from pathlib import Path
+from typing import Any, Iterable
+
+
+def load_jsonl(path: str | Path) -> list[dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_jsonl(path: str | Path, rows: Iterable[dict[str, Any]]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize_latencies(values: list[float]) -> dict[str, float]:
+    """초 단위 측정값 -> ms 단위 요약"""
+    if not values:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0}
+    return {
+        "mean_ms": statistics.mean(values) * 1000,
+        "p50_ms": percentile(values, 0.5) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+    }
+
+
+def ndcg_at_k(ranked_relevances: list[float], k: int) -> float:
+    """랭킹 순서대로 나열된 relevance label의 NDCG@k"""
+
+    def dcg(relevances: list[float]) -> float:
+        return sum(
+            (2**rel - 1) / math.log2(i + 2) for i, rel in enumerate(relevances[:k])
+        )
+
+    ideal = dcg(sorted(ranked_relevances, reverse=True))
+    return dcg(ranked_relevances) / ideal if ideal else 0.0
+
+
+def print_table(rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        print("(no results)")
+        return
+
+    columns = list(rows[0].keys())
+
+    def fmt(value: Any) -> str:
+        return f"{value:.4f}" if isinstance(value, float) else str(value)
+
+    widths = {
+        col: max(len(col), *(len(fmt(row.get(col, ""))) for row in rows))
+        for col in columns
+    }
+
+    print(" | ".join(col.ljust(widths[col]) for col in columns))
+    print("-+-".join("-" * widths[col] for col in columns))
+    for row in rows:
+        print(" | ".join(fmt(row.get(col, "")).ljust(widths[col]) for col in columns))
@@ -0,0 +1,93 @@
+"""
+로컬 intent router 분류 회귀 점검 (네트워크 / LLM 호출 없음).
+
+기본 회귀 케이스(REGRESSION_CASES)와 선택적인 데이터셋에 대해 로컬 결정을 확인한다.
+expected 값:
+    chitchat          로컬에서 일상 대화로 확정 (정형화된 응답)
+    search_pipeline   로컬에서 검색 질문으로 확정
+    llm               확신하지 못해 LLM router로 fallback
+
+데이터셋 (JSONL, 한 줄에 한 질문):
+    {"query": "...", "expected": "chitchat" | "search_pipeline" | "llm"}
+
+사용 예:
+    python -m benchmark.intent_router
+    python -m benchmark.intent_router --dataset intent_set.jsonl --threshold 0.8
+"""
+
+import argparse
+import sys
+
+from benchmark.common import load_jsonl, print_table
+
+REGRESSION_CASES: list[dict[str, str]] = [
+    # 인사말
+    {"query": "안녕하세요!", "expected": "chitchat"},
+    {"query": "고마워요 ㅎㅎ", "expected": "chitchat"},
+    {"query": "감사합니다", "expected": "chitchat"},
+    {"query": "수고하셨습니다", "expected": "chitchat"},
+    {"query": "바이바이~", "expected": "chitchat"},
+    # 인사말 접두어로 시작하는 기술 질문
+    {"query": "바이너리 파일은 어디서 처리해?", "expected": "llm"},
+    {"query": "바이트 배열 변환 위치", "expected": "llm"},
+    {"query": "감사 로그는 어디에 남겨?", "expected": "llm"},
+    {"query": "hint 좀 줄래?", "expected": "llm"},
+    # 일반 기술 용어만 있는 문장
+    {"query": "오늘 작업 너무 힘들다", "expected": "llm"},
+    {"query": "설정 변경 담당이 누구야?", "expected": "llm"},
+    # 식별자 형태의 강한 신호
+    {"query": "app/rag/node.py 의 generate_node 설명해줘", "expected": "search_pipeline"},
+    {"query": "CATCHUP-123 이슈 담당자 알려줘", "expected": "search_pipeline"},
+    {"query": "PR #42 에서 무엇이 바뀌었어?", "expected": "search_pipeline"},
+]
+
+
+def local_decision(router, query: str) -> tuple[str, float]:
+    decision = router.classify(query)
+    if not router.is_confident(decision):
+        return "llm", decision.confidence
+    return decision.datasource, decision.confidence
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dataset", default=None)
+    parser.add_argument("--threshold", type=float, default=None)
+    args = parser.parse_args()
+
+    from app.core.config import settings
+    from app.rag.service.intent import LocalIntentRouter
+
+    router = LocalIntentRouter(
+        confidence_threshold=args.threshold or settings.INTENT_ROUTER_CONFIDENCE_THRESHOLD
+    )
+
+    cases = list(REGRESSION_CASES)
+    if args.dataset:
+        cases += load_jsonl(args.dataset)
+
+    rows = []
+    failures = 0
+    for case in cases:
+        actual, confidence = local_decision(router, case["query"])
+        ok = actual == case["expected"]
+        failures += not ok
+        rows.append(
+            {
+                "query": case["query"],
+                "expected": case["expected"],
+                "actual": actual,
+                "confidence": confidence,
+                "ok": "O" if ok else "X",
+            }
+        )
+
+    print_table(rows)
+    print(f"Cases: {len(cases)}, failures: {failures}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
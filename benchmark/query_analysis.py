@@ -0,0 +1,138 @@
+"""
+질문 분석 모드(sequential: router -> rewrite -> plan / fused: analyze) latency / 계획 품질 비교 벤치마크.
+
+데이터셋 (JSONL, 한 줄에 한 질문):
+    {
+        "query": "...",
+        "history": [{"role": "user" | "assistant", "content": "..."}],   # 선택
+        "expected_datasource": "search_pipeline" | "chitchat",
+        "expected_sources": ["codebase", "jira_issue"]                   # search_pipeline인 경우
+    }
+
+계획 품질 지표:
+    route_acc   datasource(chitchat / search_pipeline) 정확도
+    source_f1   계획된 검색 저장소 집합과 expected_sources의 F1 (search_pipeline 질문만)
+
+사용 예:
+    python -m benchmark.query_analysis --dataset analysis_set.jsonl --repeat 2
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmark.common import load_jsonl, print_table, summarize_latencies
+
+
+def build_state(case: dict) -> dict:
+    from langchain_core.messages import AIMessage, HumanMessage
+
+    messages = [
+        HumanMessage(content=m["content"])
+        if m["role"] == "user"
+        else AIMessage(content=m["content"])
+        for m in case.get("history", [])
+    ]
+    messages.append(HumanMessage(content=case["query"]))
+
+    return {"messages": messages, "retry_count": 0, "index_list": []}
+
+
+async def analyze_sequential(state: dict) -> dict:
+    from app.rag.node import plan_node, rewrite_node, router_node
+
+    config = {"configurable": {}}
+
+    state.update(await router_node(state, config))
+    if state["datasource"] == "chitchat":
+        return state
+
+    state.update(await rewrite_node(state))
+    state.update(await plan_node(state))
+    return state
+
+
+async def analyze_fused(state: dict) -> dict:
+    from app.rag.node import analyze_node
+
+    state.update(await analyze_node(state, {"configurable": {}}))
+    return state
+
+
+def source_f1(planned: set[str], expected: set[str]) -> float:
+    if not planned and not expected:
+        return 1.0
+    if not planned or not expected:
+        return 0.0
+
+    overlap = len(planned & expected)
+    precision = overlap / len(planned)
+    recall = overlap / len(expected)
+    return 2 * precision * recall / (precision + recall) if overlap else 0.0
+
+
+async def run(args: argparse.Namespace) -> None:
+    dataset = load_jsonl(args.dataset)
+    print(f"Queries: {len(dataset)}")
+
+    modes = {"sequential": analyze_sequential, "fused": analyze_fused}
+
+    rows = []
+    for mode in args.modes:
+        analyze = modes[mode]
+
+        # 커넥션 워밍업은 측정에서 제외
+        await analyze(build_state(dataset[0]))
+
+        latencies = []
+        route_hits = 0
+        f1_scores = []
+        query_counts = []
+
+        for _ in range(args.repeat):
+            for case in dataset:
+                start = time.perf_counter()
+                state = await analyze(build_state(case))
+                latencies.append(time.perf_counter() - start)
+
+                route_hits += state["datasource"] == case["expected_datasource"]
+
+                if case["expected_datasource"] == "search_pipeline":
+                    planned = {q.datasource for q in state.get("search_queries", [])}
+                    f1_scores.append(
+                        source_f1(planned, set(case.get("expected_sources", [])))
+                    )
+                    query_counts.append(len(state.get("search_queries", [])))
+
+        rows.append(
+            {
+                "mode": mode,
+                "runs": len(latencies),
+                **summarize_latencies(latencies),
+                "route_acc": route_hits / len(latencies),
+                "source_f1": sum(f1_scores) / len(f1_scores) if f1_scores else 0.0,
+                "avg_queries": (
+                    sum(query_counts) / len(query_counts) if query_counts else 0.0
+                ),
+            }
+        )
+
+    print_table(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dataset", required=True)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=["sequential", "fused"],
+        choices=["sequential", "fused"],
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
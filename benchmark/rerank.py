@@ -0,0 +1,163 @@
+"""
+Rerank 백엔드 latency / NDCG 비교 벤치마크.
+
+데이터셋 (JSONL, 한 줄에 한 쿼리):
+    {"query": "...", "documents": [{"text": "...", "relevance": 2}, ...]}
+
+relevance는 사람이 라벨링한 등급(0: 무관 ~ 3: 정답)이며, `record` 명령으로
+실제 검색 결과를 수집한 뒤 라벨링해서 사용한다.
+
+사용 예:
+    # 1) 실제 검색 후보 기록 (relevance는 null로 저장됨)
+    python -m benchmark.rerank record --queries queries.txt \\
+        --index-list org_repo_code org_repo_pr --output rerank_set.jsonl
+
+    # 2) 라벨링된 데이터셋으로 비교
+    python -m benchmark.rerank run --dataset rerank_set.jsonl \\
+        --backends cohere local local-quantized
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmark.common import (
+    load_jsonl,
+    ndcg_at_k,
+    print_table,
+    summarize_latencies,
+    write_jsonl,
+)
+
+
+def build_backend(name: str, onnx_file_name: str | None = None):
+    from app.core.config import settings
+    from app.rag.service.rerank import CohereRerankBackend, CrossEncoderRerankBackend
+
+    if name == "cohere":
+        return CohereRerankBackend()
+
+    local_kwargs = {
+        "model_name": settings.LOCAL_RERANK_MODEL,
+        "batch_size": settings.LOCAL_RERANK_BATCH_SIZE,
+        "max_tokens": settings.LOCAL_RERANK_MAX_TOKENS,
+    }
+
+    if name == "local":
+        return CrossEncoderRerankBackend(**local_kwargs)
+    if name == "local-quantized":
+        return CrossEncoderRerankBackend(**local_kwargs, quantize=True)
+    if name == "local-onnx":
+        return CrossEncoderRerankBackend(
+            **local_kwargs, runtime="onnx", onnx_file_name=onnx_file_name
+        )
+
+    raise ValueError(f"Unknown backend: {name}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    dataset = [
+        case
+        for case in load_jsonl(args.dataset)
+        if any(doc.get("relevance") for doc in case["documents"])
+    ]
+    print(f"Labeled queries: {len(dataset)}")
+
+    rows = []
+    for backend_name in args.backends:
+        backend = build_backend(backend_name, args.onnx_file)
+
+        # 모델 로딩/커넥션 워밍업은 측정에서 제외
+        await backend.score(dataset[0]["query"], [dataset[0]["documents"][0]["text"]])
+
+        latencies = []
+        ndcgs = []
+
+        for case in dataset:
+            texts = [doc["text"] for doc in case["documents"]]
+            labels = [doc.get("relevance") or 0 for doc in case["documents"]]
+
+            start = time.perf_counter()
+            scores = await backend.score(case["query"], texts)
+            latencies.append(time.perf_counter() - start)
+
+            ranked = sorted(zip(scores, labels), key=lambda x: x[0], reverse=True)
+            ndcgs.append(ndcg_at_k([label for _, label in ranked], args.k))
+
+        rows.append(
+            {
+                "backend": backend_name,
+                "queries": len(dataset),
+                **summarize_latencies(latencies),
+                f"ndcg@{args.k}": sum(ndcgs) / len(ndcgs),
+            }
+        )
+
+    print_table(rows)
+
+
+async def record(args: argparse.Namespace) -> None:
+    from app.core.config import settings
+    from app.rag.factory import get_vector_repository
+
+    repo = get_vector_repository()
+
+    with open(args.queries, encoding="utf-8") as f:
+        queries = [line.strip() for line in f if line.strip()]
+
+    rows = []
+    for query in queries:
+        requests = [
+            {
+                "index_name": index_name,
+                "query": query,
+                "k": args.k_per_index,
+                "semantic_ratio": settings.MEILISEARCH_SEMANTIC_RATIO,
+            }
+            for index_name in args.index_list
+        ]
+        results = await repo.multi_search(requests)
+
+        documents = [
+            {
+                "id": doc.metadata.get("id"),
+                "index": index_name,
+                "text": doc.page_content,
+                "relevance": None,
+            }
+            for index_name, docs in zip(args.index_list, results)
+            for doc in docs
+        ]
+        rows.append({"query": query, "documents": documents})
+
+    write_jsonl(args.output, rows)
+    print(f"Recorded {len(rows)} queries -> {args.output}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="라벨링된 데이터셋으로 백엔드 비교")
+    run_parser.add_argument("--dataset", required=True)
+    run_parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=["cohere", "local"],
+        choices=["cohere", "local", "local-quantized", "local-onnx"],
+    )
+    run_parser.add_argument("--onnx-file", default=None)
+    run_parser.add_argument("--k", type=int, default=10)
+
+    record_parser = subparsers.add_parser("record", help="실제 검색 후보 기록")
+    record_parser.add_argument("--queries", required=True)
+    record_parser.add_argument("--index-list", nargs="+", required=True)
+    record_parser.add_argument("--k-per-index", type=int, default=10)
+    record_parser.add_argument("--output", required=True)
+
+    args = parser.parse_args()
+    asyncio.run(run(args) if args.command == "run" else record(args))
+
+
+if __name__ == "__main__":
+    main()
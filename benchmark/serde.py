@@ -0,0 +1,144 @@
+"""
+checkpoint serializer(CompactSerializer vs 기존 JsonPlusRedisSerializer) 직렬화 시간 / 크기 비교 벤치마크.
+
+benchmark.checkpoint와 같은 합성 문서로 재시도 턴 종료 시점의 state
+(retrieved_docs, candidate_pool, search_queries, related_jira_issues, messages)를 만들고
+channel value 단위로 dumps_typed / loads_typed를 반복 측정한다. Redis 연결은 필요 없다.
+
+지표:
+    bytes         serializer 출력 크기 합
+    stored_bytes  RedisJSON에 저장되는 크기 (compact는 base64 인코딩 후)
+    dumps_ms / loads_ms  state 1개당 직렬화 / 역직렬화 시간
+
+사용 예:
+    python -m benchmark.serde --docs 10 --retries 2 --repeat 200
+"""
+
+import argparse
+import base64
+import time
+
+from benchmark.checkpoint import attach_file_context, make_docs
+from benchmark.common import print_table, summarize_latencies
+
+
+def build_state(args: argparse.Namespace) -> dict:
+    from langchain_core.messages import AIMessage, HumanMessage
+
+    from app.rag.models.dto import BaseSource, JiraSource
+    from app.rag.models.plan import SearchQuery
+    from app.rag.models.retrieve import (
+        JiraIssueSearchResult,
+        PullRequestSearchResult,
+        SourceType,
+    )
+
+    pool = {}
+    for retry in range(args.retries + 1):
+        for doc in make_docs(args, "bench", retry):
+            pool.setdefault(doc.id, doc)
+    candidate_pool = list(pool.values())
+
+    retrieved_docs = candidate_pool[: args.docs]
+    for doc in retrieved_docs:
+        if isinstance(doc, PullRequestSearchResult):
+            attach_file_context(doc, args)
+
+    jira_issues = [
+        BaseSource.from_search_result(
+            index=i,
+            doc=JiraIssueSearchResult(
+                id=f"CU-{i}",
+                source_type=SourceType.JIRA_ISSUE,
+                repo="CatchUp",
+                summary=f"이슈 {i}",
+                issue_type_name="Task",
+                project_name="CatchUp",
+                text="이슈 설명 " * 50,
+            ),
+        )
+        for i in range(5)
+    ]
+    assert all(isinstance(issue, JiraSource) for issue in jira_issues)
+
+    messages = []
+    for turn in range(5):
+        messages.append(HumanMessage(content=f"질문 {turn}"))
+        messages.append(AIMessage(content="답변 " * 200))
+
+    return {
+        "messages": messages,
+        "current_query": "query",
+        "retry_count": args.retries + 1,
+        "search_queries": [
+            SearchQuery(datasource="codebase", query=f"query {i}") for i in range(4)
+        ],
+        "retrieved_docs": retrieved_docs,
+        "candidate_pool": candidate_pool,
+        "related_jira_issues": jira_issues,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=10, help="검색 1회당 문서 수")
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--body-bytes", type=int, default=4000)
+    parser.add_argument("--diff-bytes", type=int, default=20000, help="PR 1개당 diff 크기")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    from langgraph.checkpoint.redis.jsonplus_redis import JsonPlusRedisSerializer
+
+    from app.core.config import settings
+    from app.rag.checkpoint.serde import COMPACT_TYPE, CompactSerializer
+
+    state = build_state(args)
+    default = JsonPlusRedisSerializer()
+    serializers = {
+        "default": default,
+        "compact": CompactSerializer(
+            default,
+            compress_min_bytes=settings.CHECKPOINT_COMPRESS_MIN_BYTES,
+            zstd_level=settings.CHECKPOINT_ZSTD_LEVEL,
+        ),
+    }
+
+    rows = []
+    for name, serde in serializers.items():
+        dumps, loads = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            encoded = {k: serde.dumps_typed(v) for k, v in state.items()}
+            dumps.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            decoded = {k: serde.loads_typed(v) for k, v in encoded.items()}
+            loads.append(time.perf_counter() - start)
+
+        assert decoded["retrieved_docs"] == state["retrieved_docs"]
+
+        size = sum(len(data) for _, data in encoded.values())
+        stored = sum(
+            len(base64.b64encode(data)) if type_ == COMPACT_TYPE else len(data)
+            for type_, data in encoded.values()
+        )
+        dumps_summary = summarize_latencies(dumps)
+        loads_summary = summarize_latencies(loads)
+        rows.append(
+            {
+                "serde": name,
+                "bytes": size,
+                "stored_bytes": stored,
+                "dumps_p50_ms": dumps_summary["p50_ms"],
+                "dumps_p95_ms": dumps_summary["p95_ms"],
+                "loads_p50_ms": loads_summary["p50_ms"],
+                "loads_p95_ms": loads_summary["p95_ms"],
+            }
+        )
+
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+추측 검색(SPECULATIVE_RETRIEVAL_ENABLED) on/off end-to-end latency 비교 벤치마크.
+
+같은 질문 세트를 두 모드로 그래프에 실행하고, 턴 시작부터
+retrieve 노드 완료까지의 시간과 전체 턴 시간을 비교한다.
+(PR 선택 interrupt가 발생하는 턴은 interrupt 시점까지를 전체 시간으로 기록)
+
+사용 예:
+    python -m benchmark.speculative --queries queries.txt \\
+        --index-list org_repo_code org_repo_pr org_repo_issue --repeat 2
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from benchmark.common import print_table, summarize_latencies
+
+
+async def run_turn(app, query: str, index_list: list[str]) -> tuple[float | None, float]:
+    from langchain_core.messages import HumanMessage
+
+    inputs = {
+        "messages": [HumanMessage(content=query)],
+        "role": "user",
+        "index_list": index_list,
+    }
+    config = {"configurable": {"thread_id": f"bench-{uuid.uuid4()}"}}
+
+    start = time.perf_counter()
+    time_to_retrieval = None
+
+    async for update in app.astream(inputs, config, stream_mode="updates"):
+        if time_to_retrieval is None and "retrieve" in update:
+            time_to_retrieval = time.perf_counter() - start
+
+    return time_to_retrieval, time.perf_counter() - start
+
+
+async def run(args: argparse.Namespace) -> None:
+    from app.core.config import settings
+    from app.rag.factory import get_speculative_retriever
+    from app.rag.graph import get_compiled_graph
+
+    with open(args.queries, encoding="utf-8") as f:
+        queries = [line.strip() for line in f if line.strip()]
+
+    app = await get_compiled_graph()
+
+    # 커넥션/캐시 워밍업은 측정에서 제외
+    await run_turn(app, queries[0], args.index_list)
+
+    rows = []
+    for enabled in (False, True):
+        settings.SPECULATIVE_RETRIEVAL_ENABLED = enabled
+
+        retrieval_latencies = []
+        total_latencies = []
+
+        for _ in range(args.repeat):
+            for query in queries:
+                to_retrieval, total = await run_turn(app, query, args.index_list)
+                total_latencies.append(total)
+                if to_retrieval is not None:
+                    retrieval_latencies.append(to_retrieval)
+
+        rows.append(
+            {
+                "mode": "speculative" if enabled else "sequential",
+                "turns": len(total_latencies),
+                **{
+                    f"retrieval_{key}": value
+                    for key, value in summarize_latencies(retrieval_latencies).items()
+                },
+                **{
+                    f"total_{key}": value
+                    for key, value in summarize_latencies(total_latencies).items()
+                },
+            }
+        )
+
+    print_table(rows)
+    print(get_speculative_retriever().stats())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", required=True)
+    parser.add_argument("--index-list", nargs="+", required=True)
+    parser.add_argument("--repeat", type=int, default=1)
+
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+2단계 검색(TWO_PHASE_RETRIEVAL_ENABLED) vs 기존 전체 hit 검색의 전송량 / 파싱 시간 비교 벤치마크.
+
+같은 (query, index) 요청 세트를 두 방식으로 Meilisearch에 실행한다.
+    full       기존 방식. multi_search로 전체 hit 수신
+    two_phase  multi_search는 식별 필드 + snippet만 수신, 상위 --survivors개만 get_documents로 전체 조회
+
+rerank 비용을 배제하기 위해 survivors는 Meilisearch 랭킹 순서 상위 문서로 정한다.
+
+지표:
+    bytes      Meilisearch 응답 본문 크기 합 (hydrate 요청 포함)
+    parse_ms   Document -> SearchResult 모델 변환 시간
+    *_ms       요청 1건당 전체 latency (임베딩은 캐시 워밍업 후 측정)
+
+사용 예:
+    python -m benchmark.two_phase --queries queries.txt \\
+        --index-list org_repo_code org_repo_pr --k 10 --repeat 3
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmark.common import print_table, summarize_latencies
+
+
+class ResponseMeter:
+    """httpx response hook으로 응답 본문 크기 누적"""
+
+    def __init__(self):
+        self.bytes = 0
+
+    async def __call__(self, response) -> None:
+        await response.aread()
+        self.bytes += len(response.content)
+
+
+async def run_full(repo, requests: list[dict]) -> tuple[list, float]:
+    from app.rag.node import _parse_search_result
+
+    results = await repo.multi_search(requests)
+
+    start = time.perf_counter()
+    docs = [
+        parsed
+        for req, hits in zip(requests, results)
+        for doc in hits
+        if (parsed := _parse_search_result(doc, req["index_name"])) is not None
+    ]
+    return docs, time.perf_counter() - start
+
+
+async def run_two_phase(repo, requests: list[dict], survivors: int) -> tuple[list, float]:
+    from app.rag.node import _hydrate_documents, _parse_search_result
+
+    results = await repo.multi_search([{**req, "light": True} for req in requests])
+
+    start = time.perf_counter()
+    docs = [
+        parsed
+        for req, hits in zip(requests, results)
+        for doc in hits
+        if (parsed := _parse_search_result(doc, req["index_name"])) is not None
+    ]
+    parse_seconds = time.perf_counter() - start
+
+    # hydrate 시간에는 네트워크가 포함되므로 파싱 시간은 1단계만 측정
+    return await _hydrate_documents(docs[:survivors]), parse_seconds
+
+
+async def run(args: argparse.Namespace) -> None:
+    from app.core.config import settings
+    from app.rag.factory import get_vector_repository
+
+    with open(args.queries, encoding="utf-8") as f:
+        queries = [line.strip() for line in f if line.strip()]
+
+    repo = get_vector_repository()
+    meter = ResponseMeter()
+    repo.client.http_client.event_hooks.setdefault("response", []).append(meter)
+
+    def build_requests(query: str) -> list[dict]:
+        return [
+            {
+                "index_name": index_name,
+                "query": query,
+                "k": args.k,
+                "semantic_ratio": settings.MEILISEARCH_SEMANTIC_RATIO,
+            }
+            for index_name in args.index_list
+        ]
+
+    modes = {
+        "full": lambda reqs: run_full(repo, reqs),
+        "two_phase": lambda reqs: run_two_phase(repo, reqs, args.survivors),
+    }
+
+    # 임베딩 캐시 / 커넥션 워밍업은 측정에서 제외
+    for query in queries:
+        await repo.multi_search(build_requests(query))
+
+    rows = []
+    for mode, execute in modes.items():
+        meter.bytes = 0
+        latencies = []
+        parse_seconds = 0.0
+        doc_count = 0
+
+        for _ in range(args.repeat):
+            for query in queries:
+                start = time.perf_counter()
+                docs, parsed_in = await execute(build_requests(query))
+                latencies.append(time.perf_counter() - start)
+                parse_seconds += parsed_in
+                doc_count += len(docs)
+
+        runs = len(latencies)
+        rows.append(
+            {
+                "mode": mode,
+                "runs": runs,
+                "bytes": meter.bytes // runs,
+                "parse_ms": parse_seconds * 1000 / runs,
+                "docs": doc_count / runs,
+                **summarize_latencies(latencies),
+            }
+        )
+
+    print_table(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", required=True)
+    parser.add_argument("--index-list", nargs="+", required=True)
+    parser.add_argument("--k", type=int, default=10, help="인덱스당 검색 문서 수")
+    parser.add_argument(
+        "--survivors", type=int, default=None, help="hydrate할 문서 수 (기본 CUSTOM_RERANK_TOTAL_K)"
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+
+    args = parser.parse_args()
+    if args.survivors is None:
+        from app.core.config import settings
+
+        args.survivors = settings.CUSTOM_RERANK_TOTAL_K
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()